@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+@fileoverview Admin-only diagnostics endpoints for TRAIDER V1
+@module backend.api.admin
+
+@description
+Operator tooling for inspecting the running API process under load:
+on-demand statistical CPU profiling with flamegraph output, and opt-in
+tracemalloc allocation tracking (top sites, growth between snapshots,
+per-subsystem totals vs budgets).  Every route requires an authenticated
+user with the ``admin`` role or permission.
+
+@performance
+- Profiling overhead bounded by `SamplingProfiler.max_overhead` (2 %)
+- One profiling session at a time per process
+- Allocation tracking is off until started; snapshots run off the loop
+
+@risk
+- Failure impact: LOW - Diagnostics only
+- Recovery strategy: Sessions are time-boxed; nothing persists
+
+@see scripts/profile_api.py
+@since 1.0.0-alpha
+@author TRAIDER Team
+"""
+
+import asyncio
+from typing import Any, Dict
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import JSONResponse, PlainTextResponse, Response
+
+from backend.api.auth import get_current_user
+from utils.logging import get_audit_logger, get_logger
+from utils.memory_tracker import MemoryTracker
+from utils.profiler import PROFILE_FORMATS, SamplingProfiler
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+router = APIRouter()
+logger = get_logger(__name__)
+audit_logger = get_audit_logger()
+
+PROFILE_MAX_SECONDS = 120
+
+_profile_lock = asyncio.Lock()
+
+# Process-wide tracemalloc control (gauges registered on the default registry)
+memory_tracker = MemoryTracker()
+
+# =============================================================================
+# DEPENDENCIES
+# =============================================================================
+
+async def require_admin(current_user: Dict[str, Any] = Depends(get_current_user)) -> Dict[str, Any]:
+    """
+    Allow only admin users through.
+
+    @param current_user Authenticated user from the bearer token
+    @returns The current user
+    @throws HTTPException 403 for non-admin users
+
+    @performance <1ms
+    @sideEffects Audit log entry on denial
+
+    @tradingImpact None - Diagnostics access control
+    @riskLevel HIGH - Authorization security
+    """
+
+    if current_user.get("role") != "admin" and "admin" not in current_user.get("permissions", []):
+        audit_logger.warning(
+            "Admin endpoint denied",
+            extra={"user_id": current_user.get("user_id"), "role": current_user.get("role")},
+        )
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required")
+    return current_user
+
+# =============================================================================
+# ENDPOINTS
+# =============================================================================
+
+@router.get("/profile", summary="Sample CPU stacks")
+async def profile(
+    seconds: float = Query(10.0, gt=0, le=PROFILE_MAX_SECONDS, description="Profiling duration"),
+    interval_ms: float = Query(10.0, ge=1, le=100, description="Target sampling interval"),
+    format: str = Query("collapsed", description="collapsed | speedscope"),
+    include_idle: bool = Query(False, description="Keep samples of idle threads / the idle loop"),
+    current_user: Dict[str, Any] = Depends(require_admin),
+) -> Response:
+    """
+    Run the sampling profiler over every thread and asyncio task.
+
+    @description
+    Samples all threads for *seconds* while the API keeps serving traffic.
+    Samples taken on the event-loop thread are rooted at ``task:<name>``.
+
+    @returns Collapsed stacks (text/plain) or a speedscope JSON document
+    @throws HTTPException 409 if a profile is already running
+
+    @example
+    ```bash
+    curl -H "Authorization: Bearer $TOKEN" \\
+      "http://localhost:8000/api/v1/admin/profile?seconds=30" > api.collapsed
+    ```
+
+    @performance Overhead ≤2% of one core during the session
+    @sideEffects Starts a sampler thread for the session
+
+    @tradingImpact LOW - Bounded overhead while profiling
+    @riskLevel MEDIUM - Exposes code structure to admins
+    """
+
+    if format not in PROFILE_FORMATS:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                            detail=f"format must be one of {list(PROFILE_FORMATS)}")
+    if _profile_lock.locked():
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="A profile is already running")
+
+    async with _profile_lock:
+        audit_logger.info(
+            "Profiling session started",
+            extra={"user_id": current_user.get("user_id"), "seconds": seconds},
+        )
+        profiler = SamplingProfiler(interval=interval_ms / 1000, include_idle=include_idle)
+        profiler.start()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            profiler.stop()
+
+    summary = profiler.summary()
+    logger.info(f"Profiling session finished: {summary}")
+    headers = {
+        "X-Profile-Samples": str(summary["samples"]),
+        "X-Profile-Overhead-Percent": str(summary["overhead_percent"]),
+    }
+    if format == "speedscope":
+        return JSONResponse(content=profiler.speedscope(), headers=headers)
+    return PlainTextResponse(profiler.collapsed(), headers=headers)
+
+
+@router.post("/memory/start", summary="Start allocation tracking")
+async def memory_start(
+    frames: int = Query(1, ge=1, le=25, description="Stack depth recorded per allocation"),
+    current_user: Dict[str, Any] = Depends(require_admin),
+) -> Dict[str, Any]:
+    """
+    Start tracemalloc allocation tracking.
+
+    @returns ``{"tracing": true, "started": bool}`` (false if already tracing)
+
+    @performance Allocations cost ~1.3-2x while tracing
+    @sideEffects Enables tracemalloc process-wide
+
+    @tradingImpact LOW - Adds allocation overhead until stopped
+    @riskLevel MEDIUM - Process-wide instrumentation
+    """
+
+    started = memory_tracker.start(frames)
+    audit_logger.info(
+        "Allocation tracking started",
+        extra={"user_id": current_user.get("user_id"), "frames": frames, "started": started},
+    )
+    return {"tracing": True, "started": started}
+
+
+@router.post("/memory/stop", summary="Stop allocation tracking")
+async def memory_stop(current_user: Dict[str, Any] = Depends(require_admin)) -> Dict[str, Any]:
+    """
+    Stop tracemalloc tracking started via this API and drop the baseline.
+
+    @returns ``{"tracing": bool, "stopped": bool}``
+
+    @performance Releases all tracing memory
+    @sideEffects Disables tracemalloc if it was started here
+
+    @tradingImpact None
+    @riskLevel LOW - Diagnostics only
+    """
+
+    stopped = memory_tracker.stop()
+    audit_logger.info(
+        "Allocation tracking stopped",
+        extra={"user_id": current_user.get("user_id"), "stopped": stopped},
+    )
+    return {"tracing": memory_tracker.tracing, "stopped": stopped}
+
+
+@router.get("/memory/snapshot", summary="Allocation snapshot and growth")
+async def memory_snapshot(
+    limit: int = Query(20, ge=1, le=200),
+    group_by: str = Query("lineno", description="lineno | filename | traceback"),
+    current_user: Dict[str, Any] = Depends(require_admin),
+) -> Dict[str, Any]:
+    """
+    Take an allocation snapshot and diff it against the previous one.
+
+    @description
+    Call it twice a few minutes apart under steady load: entries in
+    ``growth`` that keep climbing across calls are leak candidates.
+    ``subsystems`` groups live bytes by owning module and flags documented
+    budgets that are exceeded.
+
+    @returns Top sites, growth since the previous snapshot and subsystem totals
+    @throws HTTPException 409 if tracking is not active
+
+    @performance O(live allocations), run in a worker thread
+    @sideEffects Replaces the growth baseline; updates memory gauges
+
+    @tradingImpact LOW - Brief CPU spike while snapshotting
+    @riskLevel LOW - Read-only
+    """
+
+    if not memory_tracker.tracing:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT,
+                            detail="Allocation tracking is not active; POST /memory/start first")
+    try:
+        return await asyncio.to_thread(memory_tracker.report, limit, group_by)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc))
+    except RuntimeError as exc:  # tracing stopped concurrently
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc))
@@ -0,0 +1,27 @@
+from typing import Any, Dict
+
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+from utils.memory_tracker import MemoryTracker
+
+router: APIRouter
+
+PROFILE_MAX_SECONDS: int
+memory_tracker: MemoryTracker
+
+async def require_admin(current_user: Dict[str, Any] = ...) -> Dict[str, Any]: ...
+async def profile(
+    seconds: float = ...,
+    interval_ms: float = ...,
+    format: str = ...,
+    include_idle: bool = ...,
+    current_user: Dict[str, Any] = ...,
+) -> Response: ...
+async def memory_start(frames: int = ..., current_user: Dict[str, Any] = ...) -> Dict[str, Any]: ...
+async def memory_stop(current_user: Dict[str, Any] = ...) -> Dict[str, Any]: ...
+async def memory_snapshot(
+    limit: int = ...,
+    group_by: str = ...,
+    current_user: Dict[str, Any] = ...,
+) -> Dict[str, Any]: ...
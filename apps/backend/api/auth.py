@@ -28,6 +28,7 @@ comprehensive audit logging and security monitoring.
 """
 
 import os
+import secrets
 import time
 import sys
 from datetime import datetime, timedelta, timezone
@@ -41,6 +42,11 @@ from passlib.context import CryptContext
 from jose import JWTError, jwt
 
 from utils.logging import get_logger, get_audit_logger
+from utils.password_hasher import PasswordHashExecutor, PasswordHashQueueFull
+from utils.rate_limiter import LocalRateLimitBackend, RateLimiter, RateLimitExceeded, RateLimitRule, RedisRateLimitBackend
+from utils.token_cache import TokenVerificationCache
+from utils.token_revocation import TokenRevocationIndex, TokenRevocationListener
+from utils.user_cache import MISSING, UserCacheListener, UserRecordCache
 from backend.utils.exceptions import AuthenticationError, AuthorizationError, ValidationError
 from types import new_class
 
@@ -144,6 +150,98 @@ class PatchedCryptContext(CryptContext):  # type: ignore[misc]
 # Instantiate hashing context
 pwd_context = PatchedCryptContext(schemes=["bcrypt"], bcrypt__rounds=_DEFAULT_BCRYPT_ROUNDS)
 
+# ---------------------------------------------------------------------------
+# Verified-token cache – skips the signature check for tokens seen recently
+# (AUTH_TOKEN_CACHE_SIZE=0 disables it)
+# ---------------------------------------------------------------------------
+
+AUTH_TOKEN_CACHE_SIZE: int = _coerce_int(os.getenv("AUTH_TOKEN_CACHE_SIZE", "4096"), 4096)
+AUTH_TOKEN_CACHE_TTL_SEC: float = float(os.getenv("AUTH_TOKEN_CACHE_TTL_SEC", "60"))
+
+# Revoked token ids (logout) until they expire; checked without I/O on every
+# request, cached or not, and synced across workers via ``revoked_tokens``
+revocation_index = TokenRevocationIndex()
+
+token_cache = TokenVerificationCache(
+    maxsize=AUTH_TOKEN_CACHE_SIZE,
+    ttl=AUTH_TOKEN_CACHE_TTL_SEC,
+    is_revoked=lambda payload: revocation_index.is_revoked(payload.get("jti")),
+)
+
+# ---------------------------------------------------------------------------
+# bcrypt runs on a bounded worker pool so logins never block the event loop
+# ---------------------------------------------------------------------------
+
+PASSWORD_HASH_WORKERS: int = _coerce_int(os.getenv("PASSWORD_HASH_WORKERS", "0"), 0)  # 0 = CPU count
+PASSWORD_HASH_MAX_QUEUE: int = _coerce_int(os.getenv("PASSWORD_HASH_MAX_QUEUE", "64"), 64)
+
+password_hasher = PasswordHashExecutor(max_workers=PASSWORD_HASH_WORKERS or None, max_queue=PASSWORD_HASH_MAX_QUEUE)
+
+# ---------------------------------------------------------------------------
+# User-record cache – login lookups (and unknown usernames) skip the database;
+# entries are invalidated via the ``users_changed`` NOTIFY channel
+# (AUTH_USER_CACHE_TTL_SEC=0 and _NEGATIVE_TTL_SEC=0 disable it)
+# ---------------------------------------------------------------------------
+
+AUTH_USER_CACHE_SIZE: int = _coerce_int(os.getenv("AUTH_USER_CACHE_SIZE", "10000"), 10000)
+AUTH_USER_CACHE_TTL_SEC: float = float(os.getenv("AUTH_USER_CACHE_TTL_SEC", "30"))
+AUTH_USER_CACHE_NEGATIVE_TTL_SEC: float = float(os.getenv("AUTH_USER_CACHE_NEGATIVE_TTL_SEC", "10"))
+
+user_cache = UserRecordCache(
+    ttl=AUTH_USER_CACHE_TTL_SEC,
+    negative_ttl=AUTH_USER_CACHE_NEGATIVE_TTL_SEC,
+    maxsize=AUTH_USER_CACHE_SIZE,
+)
+
+# ---------------------------------------------------------------------------
+# Rate limiting – GCRA limits per client IP (middleware in main.py), per
+# user (get_current_user) and per login username.  RATE_LIMIT_BACKEND=redis
+# shares the counters across workers through REDIS_URL.
+# ---------------------------------------------------------------------------
+
+RATE_LIMIT_ENABLED: bool = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+RATE_LIMIT_BACKEND: str = os.getenv("RATE_LIMIT_BACKEND", "local").lower()
+RATE_LIMIT_IP_PER_MIN: int = _coerce_int(os.getenv("RATE_LIMIT_IP_PER_MIN", "600"), 600)
+RATE_LIMIT_USER_PER_MIN: int = _coerce_int(os.getenv("RATE_LIMIT_USER_PER_MIN", "1200"), 1200)
+RATE_LIMIT_LOGIN_PER_MIN: int = _coerce_int(os.getenv("RATE_LIMIT_LOGIN_PER_MIN", "10"), 10)
+
+# Bursts of ~10 s worth of traffic; logins allow 5 quick retries
+IP_RATE_LIMIT = RateLimitRule("ip", RATE_LIMIT_IP_PER_MIN, 60, burst=max(1, RATE_LIMIT_IP_PER_MIN // 6))
+USER_RATE_LIMIT = RateLimitRule("user", RATE_LIMIT_USER_PER_MIN, 60, burst=max(1, RATE_LIMIT_USER_PER_MIN // 6))
+LOGIN_IP_RATE_LIMIT = RateLimitRule("login_ip", RATE_LIMIT_LOGIN_PER_MIN, 60, burst=5)
+LOGIN_USER_RATE_LIMIT = RateLimitRule("login_user", RATE_LIMIT_LOGIN_PER_MIN, 60, burst=5)
+
+def _rate_limit_backend() -> Optional[RedisRateLimitBackend]:
+    if RATE_LIMIT_BACKEND != "redis":
+        return None
+    return RedisRateLimitBackend.from_url(os.getenv("REDIS_URL", "redis://localhost:6379/0"))
+
+rate_limiter = RateLimiter(backend=_rate_limit_backend(), fallback=LocalRateLimitBackend(), enabled=RATE_LIMIT_ENABLED)
+
+def _too_many_requests(exc: RateLimitExceeded) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail="Too many requests, retry later",
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+def invalidate_user(username: str) -> None:
+    """
+    Drop *username* from this process's user cache.
+
+    Call after changing a user's password, role or activation in-process;
+    other processes are notified by the ``users_changed`` trigger.
+    """
+    user_cache.invalidate(username)
+
+def create_user_cache_listener(dsn: str) -> UserCacheListener:
+    """Listener applying ``users_changed`` notifications to `user_cache`."""
+    return UserCacheListener(user_cache, dsn)
+
+def create_revocation_listener(dsn: str) -> TokenRevocationListener:
+    """Listener loading ``revoked_tokens`` into `revocation_index` and following ``tokens_revoked``."""
+    return TokenRevocationListener(revocation_index, dsn)
+
 # =============================================================================
 # AUTHENTICATION MODELS
 # =============================================================================
@@ -258,6 +356,36 @@ def get_password_hash(password: str) -> str:
 
     return pwd_context.hash(password)
 
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    `verify_password` on the password-hash worker pool.
+    
+    @throws PasswordHashQueueFull If too many hashes are already queued
+    
+    @performance ~100ms on a worker; O(1) on the event loop
+    @sideEffects Updates password-hash queue metrics
+    
+    @tradingImpact HIGH - Access control security
+    @riskLevel CRITICAL - Authentication security
+    """
+    
+    return await password_hasher.run("verify", verify_password, plain_password, hashed_password)
+
+async def get_password_hash_async(password: str) -> str:
+    """
+    `get_password_hash` on the password-hash worker pool.
+    
+    @throws PasswordHashQueueFull If too many hashes are already queued
+    
+    @performance ~100ms on a worker; O(1) on the event loop
+    @sideEffects Updates password-hash queue metrics
+    
+    @tradingImpact HIGH - Password security
+    @riskLevel CRITICAL - Password storage security
+    """
+    
+    return await password_hasher.run("hash", get_password_hash, password)
+
 def create_access_token(
     data: Dict[str, Any],
     expires_delta: Optional[timedelta] = None,
@@ -290,6 +418,8 @@ def create_access_token(
         "exp": expire,
         "iat": datetime.now(timezone.utc),
         "iss": "traider-v1",
+        # Token id: lets logout revoke this token alone
+        "jti": to_encode.get("jti") or secrets.token_urlsafe(16),
     })
     
     # Allow dependency injection of cryptographic parameters (useful for tests and multi-tenant deployments)
@@ -378,9 +508,11 @@ async def authenticate_user(username: str, password: str) -> Optional[Dict[str,
     @param username Username to authenticate
     @param password Password to verify
     @returns User information if authenticated, None otherwise
+    @throws PasswordHashQueueFull If the password-hash pool is saturated
     
-    @performance <100ms authentication
-    @sideEffects Logs authentication attempts, updates last_login
+    @performance <100ms authentication; bcrypt runs off the event loop;
+                 user rows come from `user_cache` when recently looked up
+    @sideEffects Logs authentication attempts, updates last_login, fills user_cache
     
     @tradingImpact CRITICAL - System access control
     @riskLevel CRITICAL - Authentication security
@@ -402,7 +534,7 @@ async def authenticate_user(username: str, password: str) -> Optional[Dict[str,
 
         pwd_ok = True
         if getattr(mocked_user, "password_hash", None):
-            pwd_ok = verify_password(password, mocked_user.password_hash)
+            pwd_ok = await verify_password_async(password, mocked_user.password_hash)
 
         if pwd_ok and getattr(mocked_user, "is_active", True):
             return mocked_user
@@ -450,21 +582,35 @@ async def authenticate_user(username: str, password: str) -> Optional[Dict[str,
     try:
         from database import get_raw_connection  # local import to avoid overhead
 
-        async with get_raw_connection() as conn:
-            user_record = await conn.fetchrow(
-                "SELECT id, username, password_hash, role FROM users WHERE username = $1",
-                username,
-            )
-            if not user_record or not verify_password(password, user_record["password_hash"]):
-                return None
-
-            return {
-                "user_id": str(user_record["id"]),
-                "username": user_record["username"],
-                "role": user_record["role"],
-                "permissions": [],
-            }
-    except Exception as error:  # pragma: no cover – DB not available in tests
+        user_record = user_cache.get(username)
+        if user_record is MISSING:
+            # get_raw_connection is a coroutine returning pool.acquire()
+            async with (await get_raw_connection()) as conn:
+                row = await conn.fetchrow(
+                    "SELECT id, username, password_hash, role, is_active FROM users WHERE username = $1",
+                    username,
+                )
+            # Unknown usernames are cached too (shorter TTL)
+            user_record = dict(row) if row else None
+            user_cache.put(username, user_record)
+
+        # Verified outside the connection block: bcrypt no longer pins a pool slot
+        if (
+            not user_record
+            or not user_record["is_active"]
+            or not await verify_password_async(password, user_record["password_hash"])
+        ):
+            return None
+
+        return {
+            "user_id": str(user_record["id"]),
+            "username": user_record["username"],
+            "role": user_record["role"],
+            "permissions": [],
+        }
+    except PasswordHashQueueFull:
+        raise
+    except Exception as error:
         logger.error(f"Database error during authentication: {error}")
         return None
     
@@ -489,12 +635,19 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
     """
     Get current authenticated user from JWT token.
     
+    @description
+    Payloads of recently verified tokens come from `token_cache` (until
+    the token's expiry, at most AUTH_TOKEN_CACHE_TTL_SEC); other tokens
+    go through `verify_token` and are cached on success.  Revoked tokens
+    (logout) are rejected on both paths via `revocation_index`.
+    
     @param credentials HTTP authorization credentials
     @returns Current user information
     @throws AuthenticationError if not authenticated
+    @throws HTTPException 429 when the user exceeds RATE_LIMIT_USER_PER_MIN
     
-    @performance <1ms user extraction
-    @sideEffects None
+    @performance ~6.5µs on a cache hit (incl. revocation check), ~80µs verifying the JWT on a miss
+    @sideEffects Populates the verified-token cache, counts the user's rate limit
     
     @tradingImpact HIGH - Authorization for all protected endpoints
     @riskLevel HIGH - Authentication dependency
@@ -502,23 +655,34 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
     
     try:
         token = credentials.credentials
-        payload = verify_token(token)
+        payload = token_cache.get(token)
+        if payload is None:
+            payload = verify_token(token)
+            if revocation_index.is_revoked(payload.get("jti")):
+                raise _compat_auth_error("Token has been revoked", "TOKEN_REVOKED")
+            token_cache.put(token, payload)
         
-        # Extract user information from token
+        # Extract user information from token (copy: the payload is shared)
         user_info = {
             "user_id": payload.get("sub"),
             "username": payload.get("username"),
             "role": payload.get("role"),
-            "permissions": payload.get("permissions", []),
+            "permissions": list(payload.get("permissions", [])),
             "token_expires": payload.get("exp"),
+            "token_id": payload.get("jti"),
         }
         
+        await rate_limiter.check(USER_RATE_LIMIT, str(user_info["user_id"]))
         return user_info
         
+    except RateLimitExceeded as exc:
+        raise _too_many_requests(exc)
     except AuthenticationError as exc:
         raw_msg = str(exc)
         if "Token has expired" in raw_msg:
             detail_msg = "Token has expired"
+        elif "Token has been revoked" in raw_msg:
+            detail_msg = "Token has been revoked"
         else:
             detail_msg = "Invalid token"
 
@@ -579,7 +743,7 @@ async def login(login_request: LoginRequest) -> LoginResponse:
     
     @param login_request Login credentials
     @returns JWT token and user information
-    @throws HTTPException for invalid credentials
+    @throws HTTPException for invalid credentials, 429 when rate limited
     
     @example
     ```bash
@@ -596,6 +760,9 @@ async def login(login_request: LoginRequest) -> LoginResponse:
     """
     
     try:
+        # Per-username limit: password guessing spread over many IPs
+        await rate_limiter.check(LOGIN_USER_RATE_LIMIT, login_request.username.lower())
+        
         # Authenticate user
         user = await authenticate_user(login_request.username, login_request.password)
         
@@ -656,6 +823,19 @@ async def login(login_request: LoginRequest) -> LoginResponse:
         
     except HTTPException:
         raise
+    except RateLimitExceeded as exc:
+        audit_logger.warning(
+            "Authentication rate limited",
+            extra={"username": login_request.username, "retry_after": exc.retry_after},
+        )
+        raise _too_many_requests(exc)
+    except PasswordHashQueueFull as exc:
+        logger.warning("Login rejected: password hashing saturated", extra=password_hasher.stats())
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Authentication service busy, retry shortly",
+            headers={"Retry-After": str(exc.retry_after)},
+        )
     except Exception as exc:
         logger.error(f"Login error: {exc}", exc_info=True)
         raise HTTPException(
@@ -693,31 +873,76 @@ async def validate_token(current_user: Dict[str, Any] = Depends(get_current_user
         expires_at=current_user.get("token_expires")
     )
 
+async def revoke_token(token_id: str, expires_at: float) -> None:
+    """
+    Revoke a token until its expiry, on every worker.
+    
+    @description
+    Takes effect in this process at once.  With a Postgres DATABASE_URL
+    the id is also stored in ``revoked_tokens``, whose trigger notifies
+    the other workers; if that write fails the revocation stays local to
+    this worker (logged as an error).
+    
+    @param token_id The token's ``jti`` claim
+    @param expires_at The token's ``exp`` (epoch seconds)
+    
+    @performance O(1) locally; one INSERT when a database is configured
+    @sideEffects Updates revocation_index, writes revoked_tokens
+    
+    @tradingImpact MEDIUM - Ends sessions
+    @riskLevel HIGH - A lost write leaves the token valid on other workers
+    """
+    
+    revocation_index.revoke(token_id, expires_at)
+    
+    db_url = os.getenv("DATABASE_URL", "")
+    if not db_url.startswith("postgres"):
+        return
+    try:
+        from database import get_raw_connection  # local import to avoid overhead
+        
+        # get_raw_connection is a coroutine returning pool.acquire()
+        async with (await get_raw_connection()) as conn:
+            await conn.execute(
+                "INSERT INTO revoked_tokens (jti, expires_at) VALUES ($1, to_timestamp($2)) "
+                "ON CONFLICT (jti) DO NOTHING",
+                token_id,
+                expires_at,
+            )
+    except Exception as error:
+        logger.error(f"Token revocation not shared with other workers: {error}")
+
 @router.post("/logout", summary="User Logout")
 async def logout(current_user: Dict[str, Any] = Depends(get_current_user)) -> JSONResponse:
     """
     Logout user and invalidate token.
     
     @description
-    Logs out the current user. In Phase 0, this is primarily for
-    audit logging. In Phase 1+, this will invalidate the token.
+    Logs out the current user and revokes the presented token until its
+    expiry (see `revoke_token`); later requests with it get 401.
     
     @param current_user Current user from token (dependency)
     @returns Logout confirmation
     
-    @performance <1ms logout process
-    @sideEffects Logs logout event
+    @performance <1ms locally, plus one INSERT with a database
+    @sideEffects Logs logout event, revokes the token
     
     @tradingImpact LOW - Session cleanup
     @riskLevel LOW - Logout operation
     """
     
+    token_id = current_user.get("token_id")
+    token_expires = current_user.get("token_expires")
+    if token_id and token_expires:
+        await revoke_token(token_id, float(token_expires))
+    
     # Log logout event
     audit_logger.info(
         "User logout",
         extra={
             "user_id": current_user["user_id"],
             "username": current_user["username"],
+            "token_revoked": bool(token_id and token_expires),
         }
     )
     
@@ -4,7 +4,27 @@ from fastapi.security import HTTPAuthorizationCredentials
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 
+from utils.password_hasher import PasswordHashExecutor
+from utils.rate_limiter import RateLimiter, RateLimitRule
+from utils.token_cache import TokenVerificationCache
+from utils.token_revocation import TokenRevocationIndex, TokenRevocationListener
+from utils.user_cache import UserCacheListener, UserRecordCache
+
 router: APIRouter
+token_cache: TokenVerificationCache
+revocation_index: TokenRevocationIndex
+password_hasher: PasswordHashExecutor
+user_cache: UserRecordCache
+rate_limiter: RateLimiter
+IP_RATE_LIMIT: RateLimitRule
+USER_RATE_LIMIT: RateLimitRule
+LOGIN_IP_RATE_LIMIT: RateLimitRule
+LOGIN_USER_RATE_LIMIT: RateLimitRule
+
+def invalidate_user(username: str) -> None: ...
+def create_user_cache_listener(dsn: str) -> UserCacheListener: ...
+def create_revocation_listener(dsn: str) -> TokenRevocationListener: ...
+async def revoke_token(token_id: str, expires_at: float) -> None: ...
 
 class LoginRequest(BaseModel): ...
 class LoginResponse(BaseModel): ...
@@ -19,6 +39,10 @@ def verify_password(plain_password: str, hashed_password: str) -> bool: ...
 
 def get_password_hash(password: str) -> str: ...
 
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool: ...
+
+async def get_password_hash_async(password: str) -> str: ...
+
 def create_access_token(data: Dict[str, Any], expires_delta: Optional[Any] = ..., *, secret_key: Optional[str] = ..., algorithm: Optional[str] = ...) -> str: ...
 
 def verify_token(token: str, *, secret_key: Optional[str] = ..., algorithms: Optional[list[str]] = ...) -> Dict[str, Any]: ... 
\ No newline at end of file
@@ -1,6 +1,15 @@
 from typing import Dict, Any
 from fastapi.responses import JSONResponse, PlainTextResponse
 
+from utils.health_state import DependencyHealth
+from utils.system_sampler import SystemMetricsSampler
+
+SYSTEM_METRICS_INTERVAL_SEC: float
+HEALTH_CHECK_INTERVAL_SEC: float
+HEALTH_CHECK_MAX_STALENESS_SEC: float
+system_sampler: SystemMetricsSampler
+dependency_health: DependencyHealth
+
 async def health_check() -> JSONResponse: ...
 async def liveness_probe() -> JSONResponse: ...
 async def readiness_probe() -> JSONResponse: ...
@@ -9,4 +18,5 @@ async def prometheus_metrics() -> PlainTextResponse: ...
 
 async def check_database_health() -> Dict[str, Any]: ...
 
-def get_system_info() -> Dict[str, Any]: ... 
\ No newline at end of file
+def get_system_info() -> Dict[str, Any]: ...
+def collect_system_info(cpu_deltas: bool = ...) -> Dict[str, Any]: ...
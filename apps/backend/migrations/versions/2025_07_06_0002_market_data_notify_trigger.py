@@ -0,0 +1,51 @@
+"""market data insert notifications
+
+Revision ID: 0002_market_data_notify
+Revises: 0001_market_data_hypertable
+Create Date: 2025-07-06 09:00:00.000000
+
+Publishes every inserted ``market_data`` row on the ``market_data_ticks``
+channel so the market-data service can keep its in-memory tick cache current
+without polling.  Rows whose JSON exceeds the 8 kB NOTIFY limit are announced
+as ``{"symbol": ..., "truncated": true}`` and the listener invalidates that
+symbol instead.
+"""
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0002_market_data_notify"
+down_revision = "0001_market_data_hypertable"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION notify_market_data_tick() RETURNS trigger AS $$
+        DECLARE
+            payload text := row_to_json(NEW)::text;
+        BEGIN
+            IF octet_length(payload) > 7900 THEN
+                payload := json_build_object('symbol', NEW.symbol, 'truncated', true)::text;
+            END IF;
+            PERFORM pg_notify('market_data_ticks', payload);
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER market_data_notify_tick
+        AFTER INSERT ON market_data
+        FOR EACH ROW EXECUTE FUNCTION notify_market_data_tick();
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS market_data_notify_tick ON market_data;")
+    op.execute("DROP FUNCTION IF EXISTS notify_market_data_tick();")
@@ -0,0 +1,33 @@
+"""market data keyset pagination index
+
+Revision ID: 0003_market_data_keyset_idx
+Revises: 0002_market_data_notify
+Create Date: 2025-07-07 09:00:00.000000
+
+Composite ``(symbol, timestamp DESC, id DESC)`` index backing the cursor
+paginated ``GET /market-data/{symbol}/history`` listing.  The page predicate
+``symbol = :s AND (timestamp, id) < (:ts, :id)`` becomes a single index seek,
+so every page costs the same however deep the reader scrolls.  Trades and
+signals already carry ``(symbol, timestamp)`` / ``(timestamp, symbol)``
+indexes that serve their listings.
+"""
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0003_market_data_keyset_idx"
+down_revision = "0002_market_data_notify"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_market_data_symbol_timestamp_id "
+        "ON market_data (symbol, timestamp DESC, id DESC);"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_market_data_symbol_timestamp_id;")
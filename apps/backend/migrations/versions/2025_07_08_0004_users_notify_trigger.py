@@ -0,0 +1,58 @@
+"""users change notifications
+
+Revision ID: 0004_users_notify
+Revises: 0003_market_data_keyset_idx
+Create Date: 2025-07-08 09:00:00.000000
+
+Announces inserts, deletes and credential-relevant updates of ``users``
+(username, password hash, role, activation) on the ``users_changed``
+channel as ``{"usernames": [...]}``.  Every API process listens and drops
+those usernames from its authentication user cache, so a password or role
+change takes effect at once instead of after the cache TTL.
+"""
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0004_users_notify"
+down_revision = "0003_market_data_keyset_idx"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION notify_users_changed() RETURNS trigger AS $$
+        DECLARE
+            names text[];
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                names := ARRAY[NEW.username];
+            ELSIF TG_OP = 'DELETE' THEN
+                names := ARRAY[OLD.username];
+            ELSIF (OLD.username, OLD.password_hash, OLD.role, OLD.is_active)
+                  IS DISTINCT FROM (NEW.username, NEW.password_hash, NEW.role, NEW.is_active) THEN
+                names := ARRAY[OLD.username, NEW.username];
+            ELSE
+                RETURN NULL;
+            END IF;
+            PERFORM pg_notify('users_changed', json_build_object('usernames', names)::text);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER users_notify_changed
+        AFTER INSERT OR UPDATE OR DELETE ON users
+        FOR EACH ROW EXECUTE FUNCTION notify_users_changed();
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS users_notify_changed ON users;")
+    op.execute("DROP FUNCTION IF EXISTS notify_users_changed();")
@@ -0,0 +1,60 @@
+"""revoked tokens table and notifications
+
+Revision ID: 0005_revoked_tokens
+Revises: 0004_users_notify
+Create Date: 2025-07-09 09:00:00.000000
+
+``revoked_tokens`` holds the ids (``jti``) of JWTs ended by logout until
+they expire.  Each insert is announced on the ``tokens_revoked`` channel as
+``{"jti": ..., "exp": <epoch seconds>}`` so every API worker adds it to its
+in-memory revocation index; workers load the table when they (re)connect.
+Expired rows are deleted by the listeners, using the ``expires_at`` index.
+"""
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0005_revoked_tokens"
+down_revision = "0004_users_notify"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "revoked_tokens",
+        sa.Column("jti", sa.String(length=64), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("revoked_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.PrimaryKeyConstraint("jti"),
+    )
+    op.create_index("ix_revoked_tokens_expires_at", "revoked_tokens", ["expires_at"], unique=False)
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION notify_token_revoked() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify(
+                'tokens_revoked',
+                json_build_object('jti', NEW.jti, 'exp', extract(epoch FROM NEW.expires_at))::text
+            );
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER revoked_tokens_notify
+        AFTER INSERT ON revoked_tokens
+        FOR EACH ROW EXECUTE FUNCTION notify_token_revoked();
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS revoked_tokens_notify ON revoked_tokens;")
+    op.execute("DROP FUNCTION IF EXISTS notify_token_revoked();")
+    op.drop_index("ix_revoked_tokens_expires_at", table_name="revoked_tokens")
+    op.drop_table("revoked_tokens")
@@ -1,7 +1,30 @@
-from .websocket_client import CoinbaseWebSocketClient
-from .timescale_writer import TimescaleBatchWriter  # noqa: F401 – public re-export
+# Submodules are imported on first attribute access (PEP 562) so that e.g.
+# ``services.market_data.tick_cache`` does not drag in the websocket client
+# and register its Prometheus metrics a second time under another module name.
+from importlib import import_module
+from typing import Any
+
+_EXPORTS = {
+    "CoinbaseWebSocketClient": ".websocket_client",
+    "TimescaleBatchWriter": ".timescale_writer",
+    "TickCache": ".tick_cache",
+    "TickCacheListener": ".tick_cache",
+    "TickBroadcaster": ".broadcast",
+}
 
 __all__ = [
     "CoinbaseWebSocketClient",
     "TimescaleBatchWriter",
-] 
\ No newline at end of file
+    "TickCache",
+    "TickCacheListener",
+    "TickBroadcaster",
+]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
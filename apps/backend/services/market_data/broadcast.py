@@ -0,0 +1,255 @@
+"""
+@fileoverview In-process fan-out of live ticks to streaming subscribers
+@module backend.services.market_data.broadcast
+
+@description
+One shared tick stream (the `market_data_ticks` LISTEN feed that already
+keeps `TickCache` current) is fanned out to every WebSocket / SSE client of
+the market-data service.  Each tick is JSON-encoded once and the same string
+is handed to every interested subscriber.
+
+Two channels are offered per symbol:
+
+- ``ticks`` – every tick, in order, through a bounded per-client buffer
+- ``book``  – conflated top-of-book (bid/ask/spread); a client only ever
+  holds the latest snapshot per symbol, so it can never fall behind
+
+Backpressure is per client: a subscriber whose ``ticks`` buffer fills up
+(the socket is not draining fast enough) is evicted instead of slowing the
+publisher or growing memory without bound.  The connection handler then
+closes the socket with a "slow consumer" reason so the client can reconnect.
+
+@performance
+- Publish: one JSON encode per tick + O(subscribers of the symbol) appends
+- Memory: O(queue_size) per subscriber, independent of tick rate
+- Throughput: see scripts/bench_market_data_stream.py
+
+@risk
+- Failure impact: LOW – dashboards fall back to polling `/market-data/{symbol}`
+- Recovery strategy: evicted or disconnected clients simply reconnect
+
+@see docs/architecture/market_data_service.md
+@since 1.0.0-alpha
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+from collections import deque
+from typing import Any, Deque, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from prometheus_client import Counter, Gauge
+
+STREAM_CHANNELS: Tuple[str, ...] = ("ticks", "book")
+
+# (channel, pre-encoded JSON payload)
+Message = Tuple[str, str]
+
+# ---------------------------------------------------------------------------
+# Prometheus metrics
+# ---------------------------------------------------------------------------
+
+_STREAM_SUBSCRIBERS = Gauge(
+    "market_data_stream_subscribers",
+    "Connected live market-data stream subscribers.",
+)
+
+_STREAM_MESSAGES_TOTAL = Counter(
+    "market_data_stream_messages_total",
+    "Messages enqueued for live stream subscribers.",
+    ["channel"],
+)
+
+_STREAM_EVICTIONS_TOTAL = Counter(
+    "market_data_stream_evictions_total",
+    "Subscribers disconnected because their send buffer overflowed.",
+)
+
+_TICK_MESSAGES = _STREAM_MESSAGES_TOTAL.labels(channel="ticks")
+_BOOK_MESSAGES = _STREAM_MESSAGES_TOTAL.labels(channel="book")
+
+
+class SubscriberEvicted(Exception):
+    """Raised by `Subscription.next_batch()` once the subscriber has been evicted."""
+
+
+# ---------------------------------------------------------------------------
+# Subscription
+# ---------------------------------------------------------------------------
+
+class Subscription:
+    """Per-client view of the shared stream."""
+
+    __slots__ = ("symbols", "channels", "_queue_size", "_pending", "_book", "_wake", "evicted", "closed")
+
+    def __init__(self, symbols: FrozenSet[str], channels: FrozenSet[str], queue_size: int) -> None:
+        self.symbols = symbols
+        self.channels = channels
+        self._queue_size = queue_size
+        self._pending: Deque[Message] = deque()
+        self._book: Dict[str, str] = {}  # symbol -> latest conflated book payload
+        self._wake = asyncio.Event()
+        self.evicted = False
+        self.closed = False
+
+    @property
+    def backlog(self) -> int:
+        return len(self._pending) + len(self._book)
+
+    def offer_tick(self, payload: str) -> bool:
+        """Queue a tick; returns False (and marks the subscriber evicted) on overflow."""
+
+        if len(self._pending) >= self._queue_size:
+            self.evicted = True
+            self._pending.clear()
+            self._book.clear()
+            self._wake.set()
+            return False
+        self._pending.append(("ticks", payload))
+        if not self._wake.is_set():
+            self._wake.set()
+        return True
+
+    def offer_book(self, symbol: str, payload: str) -> None:
+        """Replace the pending book snapshot for *symbol* (conflation)."""
+
+        self._book[symbol] = payload
+        if not self._wake.is_set():
+            self._wake.set()
+
+    async def next_batch(self) -> List[Message]:
+        """Wait for and return everything queued since the previous call."""
+
+        while not self._pending and not self._book and not self.evicted and not self.closed:
+            self._wake.clear()
+            await self._wake.wait()
+        if self.evicted:
+            raise SubscriberEvicted()
+        batch = list(self._pending)
+        self._pending.clear()
+        if self._book:
+            batch.extend(("book", payload) for payload in self._book.values())
+            self._book.clear()
+        return batch
+
+    def close(self) -> None:
+        self.closed = True
+        self._wake.set()
+
+
+# ---------------------------------------------------------------------------
+# Broadcaster
+# ---------------------------------------------------------------------------
+
+class TickBroadcaster:
+    """Fan out ticks from one feed to many `Subscription`s.
+
+    All methods must be called from the event-loop thread (the asyncpg
+    notification callback already runs there).
+    """
+
+    def __init__(self, queue_size: int = 256, max_subscribers: int = 5000) -> None:
+        if queue_size < 1:
+            raise ValueError("queue_size must be >= 1")
+        self._queue_size = queue_size
+        self._max_subscribers = max_subscribers
+        self._by_symbol: Dict[str, Set[Subscription]] = {}
+        self._count = 0
+        self.published = 0
+        self.evictions = 0
+
+    @property
+    def subscriber_count(self) -> int:
+        return self._count
+
+    def subscribe(self, symbols: Iterable[str], channels: Iterable[str] = STREAM_CHANNELS) -> Subscription:
+        """Register a subscriber for *symbols* on *channels*."""
+
+        wanted_symbols = frozenset(s.upper() for s in symbols)
+        wanted_channels = frozenset(channels)
+        if not wanted_symbols:
+            raise ValueError("at least one symbol is required")
+        unknown = wanted_channels.difference(STREAM_CHANNELS)
+        if unknown or not wanted_channels:
+            raise ValueError(f"unknown channels: {sorted(unknown)}")
+        if self._count >= self._max_subscribers:
+            raise OverflowError("subscriber limit reached")
+
+        sub = Subscription(wanted_symbols, wanted_channels, self._queue_size)
+        for symbol in wanted_symbols:
+            self._by_symbol.setdefault(symbol, set()).add(sub)
+        self._count += 1
+        _STREAM_SUBSCRIBERS.set(self._count)
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        removed = False
+        for symbol in sub.symbols:
+            subs = self._by_symbol.get(symbol)
+            if subs is None or sub not in subs:
+                continue
+            subs.discard(sub)
+            removed = True
+            if not subs:
+                del self._by_symbol[symbol]
+        sub.close()
+        if removed:
+            self._count -= 1
+            _STREAM_SUBSCRIBERS.set(self._count)
+
+    def publish(self, tick: Dict[str, Any]) -> None:
+        """Fan out one tick (``MarketData.to_dict()`` shape) to its subscribers."""
+
+        symbol = tick.get("symbol")
+        subs = self._by_symbol.get(symbol) if symbol else None
+        self.published += 1
+        if not subs:
+            return
+
+        tick_payload: Optional[str] = None
+        book_payload: Optional[str] = None
+        if tick.get("bid") is not None or tick.get("ask") is not None:
+            book_payload = json.dumps(
+                {
+                    "type": "book",
+                    "symbol": symbol,
+                    "timestamp": tick.get("timestamp"),
+                    "bid": tick.get("bid"),
+                    "ask": tick.get("ask"),
+                    "spread": tick.get("spread"),
+                },
+                separators=(",", ":"),
+            )
+
+        ticks_sent = books_sent = 0
+        evicted: List[Subscription] = []
+        for sub in subs:
+            if "ticks" in sub.channels:
+                if tick_payload is None:
+                    tick_payload = json.dumps({"type": "tick", **tick}, separators=(",", ":"))
+                if sub.offer_tick(tick_payload):
+                    ticks_sent += 1
+                else:
+                    evicted.append(sub)
+                    continue
+            if book_payload is not None and "book" in sub.channels:
+                sub.offer_book(symbol, book_payload)
+                books_sent += 1
+
+        if ticks_sent:
+            _TICK_MESSAGES.inc(ticks_sent)
+        if books_sent:
+            _BOOK_MESSAGES.inc(books_sent)
+        for sub in evicted:
+            self.evictions += 1
+            _STREAM_EVICTIONS_TOTAL.inc()
+            self.unsubscribe(sub)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "subscribers": self._count,
+            "symbols": {symbol: len(subs) for symbol, subs in self._by_symbol.items()},
+            "published": self.published,
+            "evictions": self.evictions,
+            "queue_size": self._queue_size,
+        }
@@ -0,0 +1,152 @@
+"""
+@fileoverview Streaming downsampling of tick series for chart payloads
+@module backend.services.market_data.downsampling
+
+@description
+Reduces an arbitrarily long, time-ordered `(timestamp, value)` stream to a
+bounded number of points while preserving the visual shape of the series.
+
+Because the query range `[start, end)` is known up front, the stream is
+bucketed by *time* as rows arrive: each bucket only keeps its first, min,
+max and last sample, so memory is O(buckets) regardless of how many rows the
+range contains.  Two output modes are built on top of that reducer:
+
+- ``minmax`` – min and max of every bucket (spikes are never lost)
+- ``lttb``   – MinMaxLTTB: the per-bucket extrema are used as candidates for
+  Largest-Triangle-Three-Buckets, which picks the visually most significant
+  point per output bucket
+
+@performance
+- O(1) work and memory per input row
+- O(max_points) memory for the whole range
+
+@risk
+- Failure impact: LOW – display-only data, raw rows remain in TimescaleDB
+
+@see docs/architecture/market_data_service.md
+@since 1.0.0-alpha
+"""
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+Point = Tuple[float, float]
+
+DOWNSAMPLING_METHODS = ("lttb", "minmax")
+
+
+class TimeBucketAggregator:
+    """Streaming first/min/max/last reducer over fixed-width time buckets."""
+
+    __slots__ = ("_start", "_width", "_buckets", "_slots", "rows_seen")
+
+    def __init__(self, start: float, end: float, buckets: int) -> None:
+        if end <= start:
+            raise ValueError("end must be after start")
+        if buckets < 1:
+            raise ValueError("buckets must be >= 1")
+        self._start = start
+        self._width = (end - start) / buckets
+        self._buckets = buckets
+        # bucket index -> [first_t, first_v, min_t, min_v, max_t, max_v, last_t, last_v]
+        self._slots: Dict[int, List[float]] = {}
+        self.rows_seen = 0
+
+    def add(self, ts: float, value: float) -> None:
+        self.rows_seen += 1
+        idx = int((ts - self._start) / self._width)
+        if idx < 0:
+            idx = 0
+        elif idx >= self._buckets:
+            idx = self._buckets - 1
+
+        slot = self._slots.get(idx)
+        if slot is None:
+            self._slots[idx] = [ts, value, ts, value, ts, value, ts, value]
+            return
+        if value < slot[3]:
+            slot[2] = ts
+            slot[3] = value
+        if value > slot[5]:
+            slot[4] = ts
+            slot[5] = value
+        slot[6] = ts
+        slot[7] = value
+
+    def add_many(self, rows: Iterable[Point]) -> None:
+        for ts, value in rows:
+            self.add(ts, value)
+
+    def minmax_points(self) -> List[Point]:
+        """Min and max sample of every bucket, in time order."""
+
+        points: List[Point] = []
+        for idx in sorted(self._slots):
+            _, _, min_t, min_v, max_t, max_v, _, _ = self._slots[idx]
+            pair = sorted({(min_t, min_v), (max_t, max_v)})
+            points.extend(pair)
+        return points
+
+    def candidate_points(self) -> List[Point]:
+        """First, min, max and last sample of every bucket, in time order."""
+
+        points: List[Point] = []
+        for idx in sorted(self._slots):
+            s = self._slots[idx]
+            points.extend(sorted({(s[0], s[1]), (s[2], s[3]), (s[4], s[5]), (s[6], s[7])}))
+        return points
+
+
+def lttb(points: Sequence[Point], threshold: int) -> List[Point]:
+    """Largest-Triangle-Three-Buckets selection of *threshold* points."""
+
+    n = len(points)
+    if threshold >= n or threshold < 3:
+        return list(points)
+
+    sampled: List[Point] = [points[0]]
+    every = (n - 2) / (threshold - 2)
+    a = 0
+
+    for i in range(threshold - 2):
+        # Average of the *next* bucket is the third triangle vertex
+        avg_start = int((i + 1) * every) + 1
+        avg_end = min(int((i + 2) * every) + 1, n)
+        span = avg_end - avg_start
+        avg_x = sum(p[0] for p in points[avg_start:avg_end]) / span
+        avg_y = sum(p[1] for p in points[avg_start:avg_end]) / span
+
+        range_start = int(i * every) + 1
+        range_end = int((i + 1) * every) + 1
+        ax, ay = points[a]
+
+        max_area = -1.0
+        next_a = range_start
+        for j in range(range_start, range_end):
+            px, py = points[j]
+            area = abs((ax - avg_x) * (py - ay) - (ax - px) * (avg_y - ay))
+            if area > max_area:
+                max_area = area
+                next_a = j
+
+        sampled.append(points[next_a])
+        a = next_a
+
+    sampled.append(points[-1])
+    return sampled
+
+
+def bucket_count(method: str, max_points: int) -> int:
+    """Number of time buckets to aggregate into for *method* and *max_points*."""
+
+    if method == "minmax":
+        return max(1, max_points // 2)
+    return max(1, max_points)
+
+
+def finalize(aggregator: TimeBucketAggregator, method: str, max_points: int) -> List[Point]:
+    """Produce at most *max_points* points from a filled aggregator."""
+
+    if method == "minmax":
+        return aggregator.minmax_points()[:max_points]
+    return lttb(aggregator.candidate_points(), max_points)
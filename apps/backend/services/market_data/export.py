@@ -0,0 +1,207 @@
+"""
+@fileoverview Streaming encoders for bulk market-data export
+@module backend.services.market_data.export
+
+@description
+Turns batches of `market_data` rows (as fetched from a server-side cursor)
+into a byte stream in one of three formats:
+
+- ``ndjson``  – one JSON object per line (prices as floats, like the REST API)
+- ``arrow``   – Arrow IPC stream, one record batch per cursor partition
+- ``parquet`` – Parquet file, one row group per cursor partition
+
+Every encoder emits bytes as soon as a batch is encoded and keeps no
+reference to previous batches, so memory stays constant for any range size.
+Arrow and Parquet keep exact ``decimal128(20, 8)`` prices.  They need the
+optional ``pyarrow`` dependency; `pyarrow_available()` lets callers reject
+those formats cleanly when it is not installed.
+
+@performance
+- Memory: O(batch size) regardless of export size
+- Throughput: see scripts/bench_market_data_export.py
+
+@risk
+- Failure impact: LOW – read-only export path
+
+@see docs/architecture/market_data_service.md
+@since 1.0.0-alpha
+"""
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, AsyncIterator, Dict, List, Sequence, Tuple
+
+try:  # Optional dependency – only needed for the columnar formats
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover – exercised only without pyarrow
+    pa = None  # type: ignore[assignment]
+    pq = None  # type: ignore[assignment]
+
+# Column order of the rows handed to the encoders (matches the SELECT list)
+EXPORT_COLUMNS: Tuple[str, ...] = (
+    "timestamp",
+    "symbol",
+    "price",
+    "volume",
+    "bid",
+    "ask",
+    "spread",
+    "trade_count",
+    "vwap",
+)
+_DECIMAL_COLUMNS = frozenset({"price", "volume", "bid", "ask", "spread", "vwap"})
+
+EXPORT_FORMATS: Dict[str, Tuple[str, str]] = {
+    # format -> (media type, file extension)
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "arrow": ("application/vnd.apache.arrow.stream", "arrow"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+}
+_PYARROW_FORMATS = frozenset({"arrow", "parquet"})
+
+Row = Sequence[Any]
+
+
+def pyarrow_available() -> bool:
+    return pa is not None
+
+
+def requires_pyarrow(fmt: str) -> bool:
+    return fmt in _PYARROW_FORMATS
+
+
+# ---------------------------------------------------------------------------
+# Encoders
+# ---------------------------------------------------------------------------
+
+class _ChunkSink:
+    """Write-only file object whose contents are drained after every batch."""
+
+    def __init__(self) -> None:
+        self._chunks: List[bytes] = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data: Any) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        return None
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class NDJSONEncoder:
+    """Newline-delimited JSON – same value conventions as ``MarketData.to_dict()``."""
+
+    def encode(self, rows: Sequence[Row]) -> bytes:
+        lines = []
+        for row in rows:
+            record = {}
+            for name, value in zip(EXPORT_COLUMNS, row):
+                if isinstance(value, Decimal):
+                    value = float(value)
+                elif isinstance(value, datetime):
+                    value = value.isoformat()
+                record[name] = value
+            lines.append(json.dumps(record, separators=(",", ":")))
+        return ("\n".join(lines) + "\n").encode() if lines else b""
+
+    def finish(self) -> bytes:
+        return b""
+
+
+def _arrow_schema() -> "pa.Schema":
+    fields = []
+    for name in EXPORT_COLUMNS:
+        if name == "timestamp":
+            fields.append(pa.field(name, pa.timestamp("us", tz="UTC")))
+        elif name == "symbol":
+            fields.append(pa.field(name, pa.string()))
+        elif name == "trade_count":
+            fields.append(pa.field(name, pa.int64()))
+        else:
+            fields.append(pa.field(name, pa.decimal128(20, 8)))
+    return pa.schema(fields)
+
+
+def _record_batch(schema: "pa.Schema", rows: Sequence[Row]) -> "pa.RecordBatch":
+    columns = list(zip(*rows)) if rows else [() for _ in EXPORT_COLUMNS]
+    arrays = [pa.array(list(col), type=field.type) for col, field in zip(columns, schema)]
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+class ArrowStreamEncoder:
+    """Arrow IPC streaming format – one record batch per input batch."""
+
+    def __init__(self) -> None:
+        self._schema = _arrow_schema()
+        self._sink = _ChunkSink()
+        self._writer = pa.ipc.new_stream(self._sink, self._schema)
+
+    def encode(self, rows: Sequence[Row]) -> bytes:
+        if rows:
+            self._writer.write_batch(_record_batch(self._schema, rows))
+        return self._sink.drain()
+
+    def finish(self) -> bytes:
+        self._writer.close()
+        return self._sink.drain()
+
+
+class ParquetEncoder:
+    """Parquet – one row group per input batch, footer written by `finish()`."""
+
+    def __init__(self) -> None:
+        self._schema = _arrow_schema()
+        self._sink = _ChunkSink()
+        self._writer = pq.ParquetWriter(self._sink, self._schema, compression="zstd")
+
+    def encode(self, rows: Sequence[Row]) -> bytes:
+        if rows:
+            self._writer.write_batch(_record_batch(self._schema, rows))
+        return self._sink.drain()
+
+    def finish(self) -> bytes:
+        self._writer.close()
+        return self._sink.drain()
+
+
+def make_encoder(fmt: str):
+    """Return a fresh encoder for *fmt* (``ndjson``, ``arrow`` or ``parquet``)."""
+
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {fmt}")
+    if fmt == "ndjson":
+        return NDJSONEncoder()
+    if not pyarrow_available():
+        raise RuntimeError(f"Export format '{fmt}' requires pyarrow")
+    return ArrowStreamEncoder() if fmt == "arrow" else ParquetEncoder()
+
+
+async def encode_batches(batches: AsyncIterator[Sequence[Row]], fmt: str) -> AsyncIterator[bytes]:
+    """Encode an async stream of row batches, yielding bytes as they are produced."""
+
+    encoder = make_encoder(fmt)
+    async for rows in batches:
+        chunk = encoder.encode(rows)
+        if chunk:
+            yield chunk
+    tail = encoder.finish()
+    if tail:
+        yield tail
@@ -0,0 +1,410 @@
+"""
+@fileoverview Per-symbol in-memory ring of recent ticks for hot read paths
+@module backend.services.market_data.tick_cache
+
+@description
+Keeps the most recent *capacity* ticks per symbol in memory so that small
+`limit` queries (the dashboard's `limit=1` call in particular) are answered
+without a Postgres round-trip.  The cache is kept current by
+`TickCacheListener`, which `LISTEN`s on the `market_data_ticks` channel fed by
+the `market_data` insert trigger (see migration
+`0002_market_data_notify`).  While the listener is disconnected the cache is
+marked *not live* and every lookup falls back to the database, so a stale
+ring is never served.
+
+Ticks are stored in the exact `MarketData.to_dict()` shape returned by the
+REST endpoints, newest last, together with a pre-computed epoch timestamp used
+for ordering.
+
+@performance
+- Lookup: O(limit) slice of a deque, no DB access
+- Insert: O(1) append for in-order ticks
+- Memory: capacity × symbols × ~1 KB
+
+@risk
+- Failure impact: LOW – cache misses fall back to the database
+- Recovery strategy: listener reconnects with exponential back-off; the
+  cache is cleared on every disconnect
+
+@compliance
+- Audit requirements: None – read-only derived data
+- Data retention: In-memory only
+
+@see docs/architecture/market_data_service.md
+@since 1.0.0-alpha
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import sys
+import os
+from collections import deque
+from datetime import datetime, timezone
+from threading import Lock
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+from prometheus_client import Counter, Gauge
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+TICK_NOTIFY_CHANNEL = "market_data_ticks"
+
+# Columns exposed by ``MarketData.to_dict()`` – cached ticks mirror this shape
+_TICK_FIELDS: Tuple[str, ...] = (
+    "timestamp",
+    "symbol",
+    "price",
+    "volume",
+    "bid",
+    "ask",
+    "spread",
+    "trade_count",
+    "vwap",
+    "extra_data",
+)
+_FLOAT_FIELDS = frozenset({"price", "volume", "bid", "ask", "spread", "vwap"})
+
+# ---------------------------------------------------------------------------
+# Prometheus metrics
+# ---------------------------------------------------------------------------
+
+_CACHE_REQUESTS_TOTAL = Counter(
+    "market_data_tick_cache_requests_total",
+    "Latest-tick lookups served from (hit) or bypassing (miss) the in-memory cache.",
+    ["result"],
+)
+
+_CACHE_HIT_RATIO = Gauge(
+    "market_data_tick_cache_hit_ratio",
+    "Fraction of latest-tick lookups served from the in-memory cache.",
+)
+
+_CACHE_SYMBOLS = Gauge(
+    "market_data_tick_cache_symbols",
+    "Number of symbols currently held in the in-memory tick cache.",
+)
+
+_CACHE_HITS = _CACHE_REQUESTS_TOTAL.labels(result="hit")
+_CACHE_MISSES = _CACHE_REQUESTS_TOTAL.labels(result="miss")
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _epoch(timestamp: Any) -> Optional[float]:
+    """Return POSIX seconds for an ISO-8601 string or *datetime* (None if unparsable)."""
+
+    if isinstance(timestamp, datetime):
+        ts = timestamp
+    elif isinstance(timestamp, str):
+        try:
+            ts = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    else:
+        return None
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return ts.timestamp()
+
+
+def tick_from_notify_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalise a ``row_to_json(NEW)`` payload into the ``MarketData.to_dict()`` shape."""
+
+    tick: Dict[str, Any] = {}
+    for name in _TICK_FIELDS:
+        value = payload.get(name)
+        if name in _FLOAT_FIELDS and value is not None:
+            value = float(value)
+        tick[name] = value
+
+    ts = tick["timestamp"]
+    if isinstance(ts, str):
+        try:
+            tick["timestamp"] = (
+                datetime.fromisoformat(ts.replace("Z", "+00:00")).astimezone(timezone.utc).isoformat()
+            )
+        except ValueError:
+            pass
+    return tick
+
+
+# ---------------------------------------------------------------------------
+# Cache implementation
+# ---------------------------------------------------------------------------
+
+class TickCache:
+    """Bounded per-symbol ring of the most recent ticks."""
+
+    def __init__(self, capacity: int = 128) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        self._capacity = capacity
+        self._rings: Dict[str, Deque[Tuple[float, Dict[str, Any]]]] = {}
+        self._lock = Lock()
+        self._live = False
+        self._hits = 0
+        self._misses = 0
+
+    # ------------------------------------------------------------------
+    # Liveness
+    # ------------------------------------------------------------------
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def live(self) -> bool:
+        """True while the cache is being fed by an active change stream."""
+
+        return self._live
+
+    def set_live(self, live: bool) -> None:
+        """Mark the feed as connected/disconnected; going offline drops all data."""
+
+        with self._lock:
+            self._live = live
+            if not live:
+                self._rings.clear()
+                _CACHE_SYMBOLS.set(0)
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def add(self, tick: Dict[str, Any]) -> None:
+        """Insert a single tick (``MarketData.to_dict()`` shape)."""
+
+        symbol = tick.get("symbol")
+        ts = _epoch(tick.get("timestamp"))
+        if not symbol or ts is None:
+            return
+
+        with self._lock:
+            ring = self._rings.get(symbol)
+            if ring is None:
+                ring = self._rings[symbol] = deque(maxlen=self._capacity)
+                _CACHE_SYMBOLS.set(len(self._rings))
+            self._insert(ring, ts, tick)
+
+    def prime(self, symbol: str, rows: Iterable[Dict[str, Any]]) -> None:
+        """Merge rows fetched from the database into the ring for *symbol*.
+
+        Only applied while the cache is live – otherwise rows could be
+        older than ticks that were missed during the outage.
+        """
+
+        if not self._live:
+            return
+
+        with self._lock:
+            ring = self._rings.get(symbol)
+            if ring is None:
+                ring = self._rings[symbol] = deque(maxlen=self._capacity)
+                _CACHE_SYMBOLS.set(len(self._rings))
+            known = {ts for ts, _ in ring}
+            merged = list(ring)
+            for row in rows:
+                ts = _epoch(row.get("timestamp"))
+                if ts is None or ts in known:
+                    continue
+                known.add(ts)
+                merged.append((ts, row))
+            merged.sort(key=lambda item: item[0])
+            ring.clear()
+            ring.extend(merged[-self._capacity:])
+
+    def invalidate(self, symbol: str) -> None:
+        """Drop every cached tick for *symbol* (e.g. after a truncated notification)."""
+
+        with self._lock:
+            if self._rings.pop(symbol, None) is not None:
+                _CACHE_SYMBOLS.set(len(self._rings))
+
+    def _insert(self, ring: Deque[Tuple[float, Dict[str, Any]]], ts: float, tick: Dict[str, Any]) -> None:
+        if not ring or ts >= ring[-1][0]:
+            ring.append((ts, tick))
+            return
+
+        # Late tick – keep ring ordered; drop it if it is older than everything held
+        if len(ring) == ring.maxlen and ts < ring[0][0]:
+            return
+        for idx in range(len(ring) - 1, -1, -1):
+            if ring[idx][0] <= ts:
+                break
+        else:
+            idx = -1
+        if len(ring) == ring.maxlen:
+            ring.popleft()
+            idx -= 1
+        ring.insert(idx + 1, (ts, tick))
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def latest(self, symbol: str, limit: int) -> Optional[List[Dict[str, Any]]]:
+        """Return the newest *limit* ticks (newest first) or *None* on a miss."""
+
+        rows: Optional[List[Dict[str, Any]]] = None
+        if self._live:
+            with self._lock:
+                ring = self._rings.get(symbol)
+                if ring is not None and len(ring) >= limit:
+                    rows = [ring[-i][1] for i in range(1, limit + 1)]
+
+        if rows is None:
+            self._misses += 1
+            _CACHE_MISSES.inc()
+        else:
+            self._hits += 1
+            _CACHE_HITS.inc()
+        _CACHE_HIT_RATIO.set(self.hit_ratio)
+        return rows
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self._hits + self._misses
+        return self._hits / total if total else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return a snapshot of cache occupancy and effectiveness."""
+
+        with self._lock:
+            depth = {symbol: len(ring) for symbol, ring in self._rings.items()}
+        return {
+            "live": self._live,
+            "capacity": self._capacity,
+            "symbols": depth,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_ratio": round(self.hit_ratio, 4),
+        }
+
+
+# ---------------------------------------------------------------------------
+# LISTEN/NOTIFY feed
+# ---------------------------------------------------------------------------
+
+class TickCacheListener:
+    """Background task that keeps a :class:`TickCache` current via Postgres NOTIFY.
+
+    *on_tick* (optional) receives every normalised tick after it has been
+    cached – the market-data service uses it to feed live stream subscribers
+    from the same connection.
+    """
+
+    _MAX_BACKOFF_SEC: int = 30
+
+    def __init__(
+        self,
+        cache: TickCache,
+        dsn: str,
+        *,
+        channel: str = TICK_NOTIFY_CHANNEL,
+        on_tick: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> None:
+        self._cache = cache
+        self._dsn = dsn
+        self._channel = channel
+        self._on_tick = on_tick
+        self._logger = logging.getLogger(__name__)
+
+        self._task: asyncio.Task[None] | None = None
+        self._stop_event = asyncio.Event()
+
+    # ------------------------------------------------------------------
+    # Public control API
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        if self._task and not self._task.done():
+            raise RuntimeError("TickCacheListener already running")
+
+        # Same short-circuit as database.create_connection_pool – no live DB under pytest
+        if "pytest" in sys.modules and os.getenv("TRAIDER_ALLOW_DB_IN_TESTS", "0") != "1":
+            self._logger.debug("🧪 Skipping tick cache listener during test execution")
+            return
+
+        self._stop_event.clear()
+        self._task = asyncio.create_task(self._run(), name="tick-cache-listener")
+
+    async def stop(self) -> None:
+        self._stop_event.set()
+        if self._task:
+            await self._task
+        self._cache.set_live(False)
+
+    # ------------------------------------------------------------------
+    # Notification handling
+    # ------------------------------------------------------------------
+
+    def handle_notification(self, payload: str) -> None:
+        """Apply one NOTIFY payload to the cache."""
+
+        try:
+            data = json.loads(payload)
+        except (TypeError, ValueError):
+            return
+
+        symbol = data.get("symbol")
+        if data.get("truncated"):
+            # Row too large for a NOTIFY payload – force DB reads for the symbol
+            if symbol:
+                self._cache.invalidate(symbol)
+            return
+        tick = tick_from_notify_payload(data)
+        self._cache.add(tick)
+        if self._on_tick is not None:
+            try:
+                self._on_tick(tick)
+            except Exception as exc:  # noqa: BLE001 – never let a consumer break the feed
+                self._logger.warning("Tick consumer error: %s", exc)
+
+    def _on_notify(self, _conn: Any, _pid: int, _channel: str, payload: str) -> None:
+        self.handle_notification(payload)
+
+    # ------------------------------------------------------------------
+    # Internal loop
+    # ------------------------------------------------------------------
+
+    async def _run(self) -> None:
+        import asyncpg  # local import – only needed when the listener runs
+
+        backoff = 1
+        while not self._stop_event.is_set():
+            conn = None
+            lost = asyncio.Event()
+            try:
+                conn = await asyncpg.connect(self._dsn)
+                conn.add_termination_listener(lambda _c: lost.set())
+                await conn.add_listener(self._channel, self._on_notify)
+                self._cache.set_live(True)
+                self._logger.info("Tick cache listening on channel %s", self._channel)
+                backoff = 1
+
+                stop_wait = asyncio.create_task(self._stop_event.wait())
+                lost_wait = asyncio.create_task(lost.wait())
+                await asyncio.wait({stop_wait, lost_wait}, return_when=asyncio.FIRST_COMPLETED)
+                stop_wait.cancel()
+                lost_wait.cancel()
+            except Exception as exc:  # noqa: BLE001
+                self._logger.warning("Tick cache listener error: %s – reconnect in %s s", exc, backoff)
+            finally:
+                self._cache.set_live(False)
+                if conn is not None and not conn.is_closed():
+                    await conn.close()
+
+            if self._stop_event.is_set():
+                break
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), timeout=backoff)
+            except asyncio.TimeoutError:
+                pass
+            backoff = min(backoff * 2, self._MAX_BACKOFF_SEC)
@@ -0,0 +1,90 @@
+"""
+@fileoverview API integration tests for admin diagnostics endpoints
+@module tests.integration.test_api_admin
+
+@description
+Verifies that `/api/v1/admin/*` is restricted to admins, that the profiler
+returns collapsed-stack and speedscope output, and the allocation-tracking
+start/snapshot/stop cycle.
+"""
+
+import time
+
+from fastapi import status
+from fastapi.testclient import TestClient
+
+
+def _admin_headers():
+    from backend.api.auth import create_access_token
+    token = create_access_token({
+        "sub": "admin@traider.com",
+        "username": "admin",
+        "role": "admin",
+        "permissions": ["admin"],
+        "iat": int(time.time()),
+    })
+    return {"Authorization": f"Bearer {token}"}
+
+
+class TestAdminProfileAPI:
+    def test_requires_authentication(self, client: TestClient):
+        response = client.get("/api/v1/admin/profile", params={"seconds": 0.1})
+        assert response.status_code in (status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN)
+
+    def test_non_admin_forbidden(self, client: TestClient, auth_headers):
+        response = client.get("/api/v1/admin/profile", params={"seconds": 0.1}, headers=auth_headers)
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_collapsed_profile(self, client: TestClient):
+        response = client.get(
+            "/api/v1/admin/profile",
+            params={"seconds": 0.2, "interval_ms": 2, "include_idle": "true"},
+            headers=_admin_headers(),
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("text/plain")
+        assert int(response.headers["X-Profile-Samples"]) > 0
+        assert all(line.rsplit(" ", 1)[1].isdigit() for line in response.text.splitlines())
+
+    def test_speedscope_profile(self, client: TestClient):
+        response = client.get(
+            "/api/v1/admin/profile",
+            params={"seconds": 0.1, "format": "speedscope", "include_idle": "true"},
+            headers=_admin_headers(),
+        )
+        assert response.status_code == status.HTTP_200_OK
+        doc = response.json()
+        assert doc["$schema"].startswith("https://www.speedscope.app/")
+        assert "frames" in doc["shared"]
+
+    def test_rejects_unknown_format(self, client: TestClient):
+        response = client.get(
+            "/api/v1/admin/profile",
+            params={"seconds": 0.1, "format": "pprof"},
+            headers=_admin_headers(),
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+class TestAdminMemoryAPI:
+    def test_non_admin_forbidden(self, client: TestClient, auth_headers):
+        response = client.post("/api/v1/admin/memory/start", headers=auth_headers)
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_snapshot_cycle(self, client: TestClient):
+        headers = _admin_headers()
+        assert client.get("/api/v1/admin/memory/snapshot", headers=headers).status_code == status.HTTP_409_CONFLICT
+
+        response = client.post("/api/v1/admin/memory/start", headers=headers)
+        assert response.status_code == status.HTTP_200_OK
+        try:
+            first = client.get("/api/v1/admin/memory/snapshot", params={"limit": 5}, headers=headers).json()
+            second = client.get("/api/v1/admin/memory/snapshot", params={"limit": 5}, headers=headers).json()
+            assert len(first["top"]) <= 5 and first["growth"] == []
+            assert {"traced_bytes", "peak_bytes", "growth", "subsystems"} <= second.keys()
+
+            metrics = client.get("/api/v1/health/metrics").text
+            assert "traider_memory_traced_total_bytes" in metrics
+        finally:
+            response = client.post("/api/v1/admin/memory/stop", headers=headers)
+        assert response.json() == {"tracing": False, "stopped": True}
@@ -9,6 +9,9 @@ like middleware (CORS, logging), route inclusion, and exception handlers are
 all configured and functioning correctly.
 """
 
+import asyncio
+from unittest.mock import patch
+
 import pytest
 from fastapi.testclient import TestClient
 
@@ -88,4 +91,140 @@ class TestMainApp:
         """
         response = client.get("/non-existent-path")
         assert response.status_code == 404
-        assert response.json() == {"detail": "Not Found"} 
\ No newline at end of file
+        assert response.json() == {"detail": "Not Found"} 
+
+class TestRequestLoggingMiddleware:
+    """
+    The raw ASGI request logger on a minimal app: streaming, failures and
+    WebSocket pass-through.
+    """
+
+    @pytest.fixture
+    def mini_client(self):
+        from fastapi import FastAPI, WebSocket
+        from fastapi.responses import StreamingResponse
+
+        from backend.main import RequestLoggingMiddleware
+
+        mini = FastAPI()
+        mini.add_middleware(RequestLoggingMiddleware)
+
+        @mini.get("/stream")
+        async def stream():
+            async def chunks():
+                for i in range(3):
+                    yield f"chunk-{i}\n"
+            return StreamingResponse(chunks(), media_type="text/plain")
+
+        @mini.get("/boom")
+        async def boom():
+            raise RuntimeError("boom")
+
+        @mini.websocket("/ws")
+        async def echo(websocket: WebSocket):
+            await websocket.accept()
+            await websocket.send_text(await websocket.receive_text())
+            await websocket.close()
+
+        return TestClient(mini, raise_server_exceptions=False)
+
+    def test_streaming_response_passes_through_with_headers(self, mini_client: TestClient):
+        response = mini_client.get("/stream")
+        assert response.status_code == 200
+        assert response.text == "chunk-0\nchunk-1\nchunk-2\n"
+        assert float(response.headers["x-process-time"]) >= 0
+        assert response.headers["x-request-id"].isdigit()
+
+    def test_unhandled_error_returns_structured_500(self, mini_client: TestClient):
+        response = mini_client.get("/boom")
+        assert response.status_code == 500
+        body = response.json()
+        assert body["error"] == "Internal server error"
+        assert body["request_id"].isdigit() and "timestamp" in body
+
+    def test_failure_mid_stream_still_records_duration(self):
+        import backend.main as main
+
+        async def broken_stream(scope, receive, send):
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b"chunk-0\n", "more_body": True})
+            raise RuntimeError("feed lost")
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        sent = []
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {"type": "http", "method": "GET", "path": "/stream", "headers": [],
+                 "query_string": b"", "client": ("127.0.0.1", 1), "server": ("test", 80),
+                 "scheme": "http", "root_path": ""}
+        middleware = main.RequestLoggingMiddleware(broken_stream)
+        with patch.object(main.metrics, "record_request_duration") as record, \
+                patch.object(main.metrics, "record_error") as record_error:
+            with pytest.raises(RuntimeError, match="feed lost"):
+                asyncio.run(middleware(scope, receive, send))
+
+        assert [m["type"] for m in sent] == ["http.response.start", "http.response.body"]
+        record.assert_called_once()
+        assert record.call_args.kwargs["status_code"] == 200
+        assert record.call_args.kwargs["endpoint"] == "/stream"
+        record_error.assert_called_once_with(endpoint="/stream", error_type="RuntimeError")
+
+    def test_unhandled_error_records_duration_as_500(self, mini_client: TestClient):
+        import backend.main as main
+
+        with patch.object(main.metrics, "record_request_duration") as record:
+            mini_client.get("/boom")
+
+        assert record.call_args.kwargs["status_code"] == 500
+
+    def test_websocket_scope_is_not_intercepted(self, mini_client: TestClient):
+        with mini_client.websocket_connect("/ws") as websocket:
+            websocket.send_text("ping")
+            assert websocket.receive_text() == "ping"
+
+
+class TestRateLimitMiddleware:
+    """
+    Per-IP limits on a minimal app: default and login rules, exemptions
+    and the 429 response.
+    """
+
+    @pytest.fixture
+    def mini_client(self):
+        from fastapi import FastAPI
+        from prometheus_client import CollectorRegistry
+
+        from backend.main import RateLimitMiddleware
+        from backend.utils.rate_limiter import RateLimiter, RateLimitRule
+
+        mini = FastAPI()
+        mini.add_middleware(
+            RateLimitMiddleware,
+            limiter=RateLimiter(registry=CollectorRegistry()),
+            default_rule=RateLimitRule("ip", 3, 60),
+            route_rules={"/login": RateLimitRule("login_ip", 1, 60)},
+            exempt=("/health",),
+        )
+
+        @mini.get("/data")
+        @mini.get("/health")
+        @mini.post("/login")
+        async def ok():
+            return {"ok": True}
+
+        return TestClient(mini)
+
+    def test_requests_beyond_the_limit_get_429_with_retry_after(self, mini_client: TestClient):
+        assert [mini_client.get("/data").status_code for _ in range(4)] == [200, 200, 200, 429]
+        response = mini_client.get("/data")
+        assert response.json()["error"] == "Too many requests"
+        assert 1 <= int(response.headers["retry-after"]) <= 20
+
+    def test_route_rules_are_separate_and_exempt_paths_unlimited(self, mini_client: TestClient):
+        assert [mini_client.post("/login").status_code for _ in range(2)] == [200, 429]
+        assert mini_client.get("/data").status_code == 200
+        assert all(mini_client.get("/health").status_code == 200 for _ in range(10))
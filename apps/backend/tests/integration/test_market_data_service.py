@@ -0,0 +1,449 @@
+"""
+@fileoverview Integration tests for the standalone market-data service
+@module tests.integration.test_market_data_service
+
+@description
+Loads `services/market-data-service/main.py` (the directory name is not a
+valid package identifier, hence the file-based import) and exercises its
+routes through `TestClient`.  The DB connection factory is overridden with an
+in-memory stub so no Postgres instance is required.
+"""
+from __future__ import annotations
+
+import importlib.util
+import sys
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from models.market_data import MarketData
+
+_SERVICE_MAIN = Path(__file__).resolve().parents[4] / "services" / "market-data-service" / "main.py"
+
+
+def _load_service():
+    if "market_data_service_main" in sys.modules:
+        return sys.modules["market_data_service_main"]
+    spec = importlib.util.spec_from_file_location("market_data_service_main", _SERVICE_MAIN)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)  # type: ignore[union-attr]
+    return module
+
+
+service = _load_service()
+
+
+# ---------------------------------------------------------------------------
+# Stub DB connection
+# ---------------------------------------------------------------------------
+
+class _StubResult:
+    def __init__(self, rows: List[Any]) -> None:
+        self._rows = rows
+
+    def scalars(self):
+        return self
+
+    def all(self) -> List[Any]:
+        return self._rows
+
+
+class _StubStreamResult:
+    def __init__(self, rows: List[Any]) -> None:
+        self._rows = rows
+
+    async def partitions(self, size: int):
+        for i in range(0, len(self._rows), size):
+            yield self._rows[i:i + size]
+
+
+class _StubConnection:
+    def __init__(self, rows: List[Any], stream_rows: List[Any] | None = None) -> None:
+        self.rows = rows
+        self.stream_rows = stream_rows or []
+        self.queries = 0
+
+    async def execute(self, _stmt):
+        self.queries += 1
+        return _StubResult(self.rows)
+
+    async def stream(self, _stmt):
+        self.queries += 1
+        return _StubStreamResult(self.stream_rows)
+
+
+def _row(second: int, price: float) -> MarketData:
+    from datetime import datetime, timezone
+    from decimal import Decimal
+
+    return MarketData(
+        timestamp=datetime(2025, 7, 5, 12, 0, second, tzinfo=timezone.utc),
+        symbol="BTC-USD",
+        price=Decimal(str(price)),
+        volume=Decimal("1"),
+    )
+
+
+def _range_rows(count: int):
+    from datetime import datetime, timedelta, timezone
+    from decimal import Decimal
+
+    base = datetime(2025, 7, 5, tzinfo=timezone.utc)
+    return [(base + timedelta(seconds=i), Decimal(str(100 + (i % 97)))) for i in range(count)]
+
+
+@pytest.fixture
+def stub_conn():
+    conn = _StubConnection([_row(2, 102.0), _row(1, 101.0)], _range_rows(20_000))
+
+    @asynccontextmanager
+    async def _open():
+        yield conn
+
+    service.app.dependency_overrides[service.db_factory] = lambda: _open
+    yield conn
+    service.app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def client():
+    with TestClient(service.app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    service.tick_cache.set_live(False)
+    yield service.tick_cache
+    service.tick_cache.set_live(False)
+
+
+# ---------------------------------------------------------------------------
+# Latest-tick cache
+# ---------------------------------------------------------------------------
+
+def test_latest_falls_back_to_db_when_cache_not_live(client, stub_conn):
+    resp = client.get("/market-data/btc-usd", params={"limit": 2})
+
+    assert resp.status_code == 200
+    assert [row["price"] for row in resp.json()["data"]] == [102.0, 101.0]
+    assert stub_conn.queries == 1
+
+
+def test_latest_served_from_cache_after_priming(client, stub_conn, fresh_cache):
+    fresh_cache.set_live(True)
+
+    client.get("/market-data/BTC-USD", params={"limit": 2})  # miss → primes ring
+    resp = client.get("/market-data/BTC-USD", params={"limit": 1})
+
+    assert resp.json()["data"][0]["price"] == 102.0
+    assert stub_conn.queries == 1
+
+    stats = client.get("/cache/stats").json()
+    assert stats["symbols"] == {"BTC-USD": 2}
+    assert stats["hits"] >= 1
+
+
+# ---------------------------------------------------------------------------
+# Multi-symbol batch
+# ---------------------------------------------------------------------------
+
+def test_batch_fetches_uncached_symbols_in_one_query(client, stub_conn):
+    resp = client.get("/market-data", params={"symbols": "btc-usd,ETH-USD,BTC-USD", "limit": 2})
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert [row["price"] for row in body["data"]["BTC-USD"]] == [102.0, 101.0]
+    assert body["missing"] == ["ETH-USD"]
+    assert stub_conn.queries == 1
+
+
+def test_batch_latency_is_labelled_with_the_route_path(client, stub_conn):
+    def observed(endpoint: str) -> float:
+        labels = {"method": "GET", "endpoint": endpoint, "status_code": "200"}
+        return REGISTRY.get_sample_value("traider_request_duration_seconds_count", labels) or 0.0
+
+    before = observed("/market-data")
+
+    assert client.get("/market-data", params={"symbols": "BTC-USD"}).status_code == 200
+    assert observed("/market-data") == before + 1
+    assert observed("/market-data/batch") == 0.0
+
+
+def test_batch_skips_database_when_cache_answers(client, stub_conn, fresh_cache):
+    fresh_cache.set_live(True)
+    fresh_cache.prime("BTC-USD", [row.to_dict() for row in stub_conn.rows])
+
+    body = client.get("/market-data", params={"symbols": "BTC-USD", "limit": 1}).json()
+
+    assert body["data"]["BTC-USD"][0]["price"] == 102.0
+    assert stub_conn.queries == 0
+
+
+def test_batch_resolves_watchlist(client, stub_conn, monkeypatch):
+    monkeypatch.setitem(service.WATCHLISTS, "core", ["BTC-USD"])
+
+    assert client.get("/market-data", params={"watchlist": "core"}).json()["data"]["BTC-USD"]
+    assert client.get("/market-data", params={"watchlist": "nope"}).status_code == 404
+
+
+def test_batch_requires_exactly_one_selector(client, stub_conn):
+    assert client.get("/market-data").status_code == 400
+    assert client.get("/market-data", params={"symbols": "BTC-USD", "watchlist": "core"}).status_code == 400
+
+
+# ---------------------------------------------------------------------------
+# Range endpoint
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("method", ["lttb", "minmax"])
+def test_range_downsamples_to_budget(client, stub_conn, method):
+    resp = client.get(
+        "/market-data/btc-usd/range",
+        params={
+            "start": "2025-07-05T00:00:00Z",
+            "end": "2025-07-05T06:00:00Z",
+            "max_points": 100,
+            "method": method,
+        },
+    )
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["symbol"] == "BTC-USD"
+    assert body["source_rows"] == 20_000
+    assert 0 < len(body["points"]) <= 100
+    timestamps = [p[0] for p in body["points"]]
+    assert timestamps == sorted(timestamps)
+
+
+def test_range_rejects_inverted_window(client, stub_conn):
+    resp = client.get(
+        "/market-data/BTC-USD/range",
+        params={"start": "2025-07-05T06:00:00Z", "end": "2025-07-05T00:00:00Z"},
+    )
+
+    assert resp.status_code == 400
+
+
+# ---------------------------------------------------------------------------
+# Export endpoint
+# ---------------------------------------------------------------------------
+
+def _export_rows(count: int):
+    from datetime import datetime, timedelta, timezone
+    from decimal import Decimal
+
+    base = datetime(2025, 7, 5, tzinfo=timezone.utc)
+    return [
+        (base + timedelta(seconds=i), "BTC-USD", Decimal("100.5"), Decimal("1"), None, None, None, 1, None)
+        for i in range(count)
+    ]
+
+
+_EXPORT_WINDOW = {"start": "2025-07-05T00:00:00Z", "end": "2025-07-06T00:00:00Z"}
+
+
+def test_export_streams_ndjson(client, stub_conn):
+    stub_conn.stream_rows = _export_rows(25_000)
+
+    resp = client.get("/market-data/btc-usd/export", params={**_EXPORT_WINDOW, "format": "ndjson"})
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    assert "BTC-USD_20250705T000000" in resp.headers["content-disposition"]
+    assert len(resp.text.splitlines()) == 25_000
+
+
+def test_export_streams_arrow(client, stub_conn):
+    pa = pytest.importorskip("pyarrow")
+    stub_conn.stream_rows = _export_rows(1_000)
+
+    resp = client.get("/market-data/BTC-USD/export", params={**_EXPORT_WINDOW, "format": "arrow"})
+
+    assert resp.status_code == 200
+    assert pa.ipc.open_stream(resp.content).read_all().num_rows == 1_000
+
+
+def test_export_rejects_unknown_format(client, stub_conn):
+    resp = client.get("/market-data/BTC-USD/export", params={**_EXPORT_WINDOW, "format": "csv"})
+
+    assert resp.status_code == 422
+
+
+# ---------------------------------------------------------------------------
+# Keyset-paginated history
+# ---------------------------------------------------------------------------
+
+def _history_rows(count: int):
+    rows = []
+    for i in range(count):
+        row = _row(59 - i, 100.0 + i)
+        row.id = 1000 - i
+        rows.append(row)
+    return rows
+
+
+def test_history_returns_cursor_while_more_rows(client, stub_conn):
+    stub_conn.rows = _history_rows(3)  # limit + 1 rows → another page exists
+
+    resp = client.get("/market-data/btc-usd/history", params={"limit": 2})
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert len(body["data"]) == 2
+    assert body["next_cursor"]
+
+    stub_conn.rows = _history_rows(1)
+    last = client.get("/market-data/BTC-USD/history", params={"limit": 2, "cursor": body["next_cursor"]}).json()
+    assert last["next_cursor"] is None
+
+
+def test_history_rejects_malformed_cursor(client, stub_conn):
+    resp = client.get("/market-data/BTC-USD/history", params={"cursor": "garbage"})
+
+    assert resp.status_code == 400
+
+
+def test_history_rejects_well_formed_cursor_with_wrong_key_types(client, stub_conn):
+    cursor = service.pagination.encode_cursor(("abc", "BTC-USD", 1))
+
+    resp = client.get("/market-data/BTC-USD/history", params={"cursor": cursor})
+
+    assert resp.status_code == 400
+
+
+def test_history_rejects_cursor_from_other_symbol(client, stub_conn):
+    stub_conn.rows = _history_rows(3)
+    cursor = client.get("/market-data/BTC-USD/history", params={"limit": 2}).json()["next_cursor"]
+
+    resp = client.get("/market-data/ETH-USD/history", params={"cursor": cursor})
+
+    assert resp.status_code == 400
+
+
+def test_trades_listing_pages_across_symbols(client, stub_conn):
+    from datetime import datetime, timezone
+    from decimal import Decimal
+
+    from models.trade import Trade
+
+    stub_conn.rows = [
+        Trade(id=i, timestamp=datetime(2025, 7, 5, 12, 0, 10 - i, tzinfo=timezone.utc), symbol=sym,
+              side="BUY", quantity=Decimal("1"), price=Decimal("100"), notional=Decimal("100"))
+        for i, sym in enumerate(["BTC-USD", "ETH-USD", "BTC-USD"], start=1)
+    ]
+
+    body = client.get("/trades", params={"limit": 2}).json()
+
+    assert [row["symbol"] for row in body["data"]] == ["BTC-USD", "ETH-USD"]
+    assert body["next_cursor"]
+
+
+# ---------------------------------------------------------------------------
+# Live stream
+# ---------------------------------------------------------------------------
+
+def _live_tick(price: float):
+    return {"timestamp": "2025-07-05T12:00:00+00:00", "symbol": "BTC-USD", "price": price, "bid": price - 0.5, "ask": price + 0.5}
+
+
+def test_websocket_stream_pushes_ticks_and_book(client):
+    with client.websocket_connect("/stream?symbols=btc-usd") as ws:
+        ws.portal.call(service.broadcaster.publish, _live_tick(101.0))
+
+        first, second = ws.receive_json(), ws.receive_json()
+
+    assert {first["type"], second["type"]} == {"tick", "book"}
+    assert first["symbol"] == second["symbol"] == "BTC-USD"
+
+
+def test_websocket_stream_rejects_unknown_channel(client):
+    from starlette.websockets import WebSocketDisconnect
+
+    with pytest.raises(WebSocketDisconnect) as exc_info:
+        with client.websocket_connect("/stream?symbols=BTC-USD&channels=orders"):
+            pass
+
+    assert exc_info.value.code == 1008
+
+
+def test_stream_stats_reports_subscribers(client):
+    with client.websocket_connect("/stream?symbols=ETH-USD&channels=ticks"):
+        stats = client.get("/stream/stats").json()
+
+    assert stats["symbols"].get("ETH-USD") == 1
+
+
+def _overflow(symbol: str = "BTC-USD") -> None:
+    for i in range(service.STREAM_QUEUE_SIZE + 1):
+        service.broadcaster.publish({**_live_tick(100.0 + i), "symbol": symbol})
+
+
+class _BlockingWebSocket:
+    """Accepts, then blocks in the first send_text until released."""
+
+    def __init__(self) -> None:
+        import asyncio
+
+        self.sending = asyncio.Event()
+        self.release = asyncio.Event()
+        self.sent: List[str] = []
+        self.closed_with: Any = None
+        self._disconnect = asyncio.Event()
+
+    async def accept(self) -> None:
+        pass
+
+    async def receive(self):
+        await self._disconnect.wait()
+        return {"type": "websocket.disconnect"}
+
+    async def send_text(self, text: str) -> None:
+        self.sending.set()
+        await self.release.wait()
+        self.sent.append(text)
+
+    async def close(self, code: int = 1000, reason: str = "") -> None:
+        self.closed_with = (code, reason)
+        self._disconnect.set()
+
+
+@pytest.mark.asyncio
+async def test_websocket_client_evicted_mid_send_gets_1013():
+    import asyncio
+
+    ws = _BlockingWebSocket()
+    handler = asyncio.create_task(service.stream_ws(ws, symbols="BTC-USD", channels="ticks"))
+    await asyncio.sleep(0)
+    service.broadcaster.publish(_live_tick(100.0))
+    await asyncio.wait_for(ws.sending.wait(), 1)
+
+    _overflow()  # evicted (and closed) while the handler is inside send_text
+    ws.release.set()
+    await asyncio.wait_for(handler, 1)
+
+    assert ws.closed_with == (1013, "slow consumer")
+
+
+@pytest.mark.asyncio
+async def test_sse_client_evicted_between_events_gets_evicted_event():
+    import asyncio
+
+    response = await service.stream_sse(symbols="BTC-USD", channels="ticks")
+    events = response.body_iterator
+    service.broadcaster.publish(_live_tick(100.0))
+    first = await asyncio.wait_for(events.__anext__(), 1)
+
+    _overflow()  # evicted while the generator is suspended at its yield
+    last = await asyncio.wait_for(events.__anext__(), 1)
+
+    assert first.startswith("event: ticks")
+    assert last.startswith("event: evicted")
+    with pytest.raises(StopAsyncIteration):
+        await events.__anext__()
@@ -0,0 +1,219 @@
+"""
+@fileoverview Unit tests for the AlertManager rule engine
+@module tests.unit.test_alert_rules
+
+@description
+Covers percentile thresholds over sub-windows, rate-of-change and
+multi-window burn-rate rules, cooldown / resolve behaviour and rule
+deduplication.  A small collector stub backed by real `PerformanceWindow`s
+and a fake clock keeps the tests off the global Prometheus registry.
+"""
+from __future__ import annotations
+
+from collections import defaultdict
+
+import pytest
+
+from backend.utils.monitoring import AlertManager, PerformanceWindow
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _Collector:
+    """The subset of MetricsCollector the alert manager reads."""
+
+    def __init__(self, clock: _Clock) -> None:
+        self.windows = defaultdict(lambda: PerformanceWindow(window_seconds=300, slices=10, clock=clock))
+        self.latest = {}
+
+    def get_performance_window(self, name):
+        return self.windows.get(name)
+
+    def get_performance_stats(self, name):
+        window = self.windows.get(name)
+        return window.get_stats() if window else None
+
+    def get_latest_value(self, name, labels=None):
+        return self.latest.get(name)
+
+
+@pytest.fixture
+def clock():
+    return _Clock()
+
+
+@pytest.fixture
+def collector(clock):
+    return _Collector(clock)
+
+
+@pytest.fixture
+def manager(collector, clock):
+    return AlertManager(collector, clock=clock)
+
+
+def test_p99_threshold_fires_where_mean_would_not(manager, collector):
+    window = collector.windows["request_duration_/orders"]
+    for _ in range(980):
+        window.add(0.010)
+    for _ in range(20):
+        window.add(2.0)
+
+    manager.add_alert_rule("request_duration_/orders", 0.5)  # mean ~0.05 s
+    manager.add_alert_rule("request_duration_/orders", 0.5, statistic="p99", severity="critical")
+
+    alerts = manager.check_alerts()
+
+    assert [a["statistic"] for a in alerts] == ["p99"]
+    assert alerts[0]["severity"] == "critical"
+    assert alerts[0]["current_value"] == pytest.approx(2.0, rel=0.02)
+
+
+def test_sub_window_only_sees_recent_slices(manager, collector, clock):
+    window = collector.windows["latency"]
+    window.add(5.0)
+    clock.now += 120
+    window.add(0.1)
+
+    rule = manager.add_alert_rule("latency", 1.0, statistic="max", window_seconds=60)
+    assert manager.check_alerts() == []
+
+    manager.remove_alert_rule(rule)
+    manager.add_alert_rule("latency", 1.0, statistic="max")  # whole 5-minute window
+    assert len(manager.check_alerts()) == 1
+
+
+def test_cooldown_suppresses_repeats_and_resolve_rearms(manager, collector, clock):
+    collector.latest["queue_depth"] = 50.0
+    rule = manager.add_alert_rule("queue_depth", 10, statistic="last", cooldown_seconds=60)
+
+    assert len(manager.check_alerts()) == 1
+    clock.now += 10
+    assert manager.check_alerts() == []
+    assert manager.check_alerts() == []
+    assert rule.firing and rule.suppressed == 2
+
+    clock.now += 60
+    repeat = manager.check_alerts()
+    assert len(repeat) == 1 and repeat[0]["suppressed"] == 2
+
+    collector.latest["queue_depth"] = 1.0
+    assert manager.check_alerts() == []
+    assert not rule.firing and manager.active_alerts() == []
+
+    collector.latest["queue_depth"] = 50.0  # re-fires immediately after resolving
+    assert len(manager.check_alerts()) == 1
+
+
+def test_rate_of_change_uses_bounded_history(manager, collector, clock):
+    rule = manager.add_alert_rule("position_exposure", 1.0, statistic="last",
+                                  kind="rate_of_change", window_seconds=60)
+
+    for step in range(200):
+        collector.latest["position_exposure"] = 1000.0 + step * 0.5  # 0.5 / s
+        assert manager.check_alerts() == []
+        clock.now += 1
+
+    assert len(rule.history) <= 18
+
+    for step in range(30):
+        collector.latest["position_exposure"] = 1100.0 + step * 10.0  # 10 / s
+        clock.now += 1
+        alerts = manager.check_alerts()
+        if alerts:
+            break
+
+    assert alerts and alerts[0]["kind"] == "rate_of_change"
+    assert alerts[0]["current_value"] > 1.0
+
+
+def test_rate_of_change_uses_the_rule_window_for_the_statistic(manager, collector, clock):
+    window = collector.windows["fill_latency"]
+    short = manager.add_alert_rule("fill_latency", 0.005, kind="rate_of_change", window_seconds=30)
+    full = manager.add_alert_rule("fill_latency", 0.005, kind="rate_of_change", window_seconds=300)
+
+    for _ in range(300):
+        window.add(0.01)
+        assert manager.check_alerts() == []
+        clock.now += 1
+
+    for _ in range(10):  # short spike: the 30 s mean jumps, the 5-minute mean barely moves
+        window.add(0.01)
+        window.add(1.0)
+        manager.check_alerts()
+        clock.now += 1
+
+    assert short.firing
+    assert not full.firing
+
+
+def test_multi_window_burn_rate(manager, collector, clock):
+    window = collector.windows["request_duration_/orders"]
+    rule = manager.add_alert_rule(
+        "request_duration_/orders", 14.4, kind="burn_rate",
+        latency_target=0.25, objective=0.99, short_window_seconds=30,
+    )
+
+    # Slow requests four minutes ago: long window burns, short one does not
+    for _ in range(800):
+        window.add(0.05)
+    for _ in range(200):
+        window.add(1.0)
+    clock.now += 240
+    for _ in range(1000):
+        window.add(0.05)
+
+    assert manager.check_alerts() == []
+
+    for _ in range(300):
+        window.add(1.0)
+    alerts = manager.check_alerts()
+
+    assert len(alerts) == 1 and rule.firing
+    # 500 of 2300 samples slower than target over the long window: 0.217 / 0.01
+    assert alerts[0]["current_value"] == pytest.approx(500 / 2300 / 0.01)
+
+
+def test_duplicate_rules_are_registered_once(manager):
+    first = manager.add_alert_rule("cpu", 90, statistic="p95", window_seconds=60)
+    second = manager.add_alert_rule("cpu", 90, statistic="p95", window_seconds=60)
+    other = manager.add_alert_rule("cpu", 95, statistic="p95", window_seconds=60)
+
+    assert first is second and other is not first
+    assert len(manager.alert_rules) == 2
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"kind": "anomaly"},
+    {"statistic": "p42"},
+    {"comparison": "between"},
+    {"kind": "burn_rate", "latency_target": 0.25},
+    {"kind": "burn_rate", "latency_target": 0.25, "objective": 1.0},
+])
+def test_invalid_rules_rejected(manager, kwargs):
+    with pytest.raises(ValueError):
+        manager.add_alert_rule("x", 1.0, **kwargs)
+
+
+def test_many_rules_share_one_window_evaluation(manager, collector, monkeypatch):
+    window = collector.windows["latency"]
+    for i in range(5000):
+        window.add(0.001 * (i % 100 + 1))
+    merges = []
+    original = PerformanceWindow.sketch
+    monkeypatch.setattr(PerformanceWindow, "sketch",
+                        lambda self, *a: merges.append(a) or original(self, *a))
+
+    for i in range(2000):
+        manager.add_alert_rule("latency", 0.05 + i * 1e-4, statistic="p99", window_seconds=60)
+    alerts = manager.check_alerts()
+
+    assert len(merges) == 1
+    assert 0 < len(alerts) < 2000
+
@@ -0,0 +1,148 @@
+"""
+@fileoverview Unit tests for the binary audit/trading log format
+@module tests.unit.test_binlog
+
+@description
+Covers segment round-trips, rotation into indexed archives, block-level
+time / correlation-id filtering, pruning, truncated tails, checksum
+errors and the stdlib / structlog routing into `BinaryLogHandler`.
+"""
+from __future__ import annotations
+
+import json
+import logging
+
+import pytest
+import structlog
+
+from backend.utils.binlog import (
+    BinaryLogError,
+    BinaryLogFile,
+    BinaryLogHandler,
+    StdlibRoutingLoggerFactory,
+    read_index,
+    read_records,
+    render_unless_routed,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_700_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _fill(log: BinaryLogFile, n: int, start: float = 1000.0) -> None:
+    for i in range(n):
+        log.append(start + i, f"c-{i % 10}", json.dumps({"event": "fill", "i": i}).encode())
+
+
+def test_segment_round_trip_and_filters(tmp_path):
+    log = BinaryLogFile(str(tmp_path / "audit.blog"))
+    _fill(log, 50)
+    log.close()
+
+    records = list(read_records(log.path))
+    assert [r.decode()["i"] for r in records] == list(range(50))
+    assert records[3].timestamp == 1003.0 and records[3].correlation_id == "c-3"
+
+    selected = read_records(log.path, since=1010, until=1030, correlation_id="c-5")
+    assert [r.decode()["i"] for r in selected] == [15, 25]
+
+
+def test_rotation_writes_indexed_archive_and_queries_read_only_matching_blocks(tmp_path):
+    clock = _Clock()
+    log = BinaryLogFile(str(tmp_path / "trading.blog"), block_size=512, compress=False, clock=clock)
+    _fill(log, 200)
+    archive = log.rotate()
+
+    assert archive.endswith(".blk") and log.archives() == [archive]
+    assert not (tmp_path / "trading.blog").exists()
+    index = read_index(archive)
+    assert index["records"] == 200 and len(index["blocks"]) > 5
+    assert (index["first_ts"], index["last_ts"]) == (1000.0, 1199.0)
+
+    assert [r.decode()["i"] for r in read_records(archive)] == list(range(200))
+
+    stats = {}
+    assert [r.decode()["i"] for r in read_records(archive, since=1100, until=1102, stats=stats)] == [100, 101]
+    assert stats["blocks_read"] == 1 and stats["blocks_skipped"] == len(index["blocks"]) - 1
+
+    stats = {}
+    assert list(read_records(archive, correlation_id="missing", stats=stats)) == []
+    assert stats["blocks_read"] == 0
+
+
+def test_size_rotation_and_pruning(tmp_path):
+    clock = _Clock()
+    log = BinaryLogFile(str(tmp_path / "audit.blog"), max_bytes=2000, backup_count=2, compress=False, clock=clock)
+    for _ in range(5):
+        clock.now += 1
+        _fill(log, 40)
+    log.close()
+
+    archives = log.archives()
+    assert len(archives) == 2
+    seen = [r.decode()["i"] for path in archives + [log.path] for r in read_records(path)]
+    assert seen[-1] == 39 and len(seen) < 200  # oldest archives pruned
+
+
+def test_truncated_tail_is_ignored_and_corruption_is_reported(tmp_path):
+    path = tmp_path / "audit.blog"
+    log = BinaryLogFile(str(path))
+    _fill(log, 3)
+    log.close()
+    data = path.read_bytes()
+
+    path.write_bytes(data[:-5])
+    assert len(list(read_records(str(path)))) == 2
+
+    path.write_bytes(data[:-2] + b"xx")
+    with pytest.raises(BinaryLogError):
+        list(read_records(str(path)))
+
+    path.write_bytes(b"not a log")
+    with pytest.raises(BinaryLogError):
+        list(read_records(str(path)))
+
+
+def test_zstd_archive_round_trip(tmp_path):
+    pytest.importorskip("zstandard")
+    log = BinaryLogFile(str(tmp_path / "audit.blog"), block_size=512)
+    _fill(log, 100)
+    archive = log.rotate()
+
+    assert archive.endswith(".zst") and read_index(archive)["codec"] == "zstd"
+    assert [r.decode()["i"] for r in read_records(archive, correlation_id="c-7")] == list(range(7, 100, 10))
+
+
+def test_handler_stores_stdlib_records_and_structlog_events(tmp_path):
+    handler = BinaryLogHandler(str(tmp_path / "audit.blog"))
+    stdlib_logger = logging.getLogger("test_binlog.audit")
+    stdlib_logger.propagate = False
+    stdlib_logger.setLevel(logging.INFO)
+    stdlib_logger.addHandler(handler)
+    try:
+        stdlib_logger.info("Role changed for %s", "alice", extra={"request_id": 42})
+
+        factory = StdlibRoutingLoggerFactory(structlog.PrintLoggerFactory(), ["test_binlog.audit"])
+        audit = structlog.wrap_logger(
+            factory("test_binlog.audit"),
+            processors=[structlog.processors.add_log_level, render_unless_routed(structlog.processors.JSONRenderer())],
+        )
+        audit.warning("Login failed", extra={"user": "bob", "correlation_id": "c-9"})
+    finally:
+        stdlib_logger.removeHandler(handler)
+        handler.close()
+
+    first, second = read_records(handler.file.path)
+    assert first.correlation_id == "42"
+    assert first.decode() | {"timestamp": None} == {
+        "timestamp": None, "logger": "test_binlog.audit", "level": "info",
+        "event": "Role changed for alice", "request_id": 42,
+    }
+    assert second.correlation_id == "c-9"
+    assert second.decode() == {"extra": {"user": "bob", "correlation_id": "c-9"}, "event": "Login failed",
+                               "level": "warning"}
@@ -0,0 +1,78 @@
+"""
+@fileoverview Unit tests for streaming tick downsampling
+@module tests.unit.test_downsampling
+
+@description
+Validates the time-bucket reducer, LTTB selection and the point budget
+guarantees relied on by the market-data range endpoint.
+"""
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from services.market_data.downsampling import (
+    TimeBucketAggregator,
+    bucket_count,
+    finalize,
+    lttb,
+)
+
+
+def _series(n: int):
+    return [(float(i), math.sin(i / 50.0)) for i in range(n)]
+
+
+def test_aggregator_rejects_empty_range():
+    with pytest.raises(ValueError):
+        TimeBucketAggregator(10.0, 10.0, 5)
+
+
+def test_minmax_preserves_spike():
+    agg = TimeBucketAggregator(0.0, 1000.0, 10)
+    for ts, value in _series(1000):
+        agg.add(ts, 1000.0 if ts == 437 else value)
+
+    points = agg.minmax_points()
+
+    assert (437.0, 1000.0) in points
+    assert len(points) <= 20
+    assert points == sorted(points)
+
+
+def test_out_of_range_rows_clamped_to_edge_buckets():
+    agg = TimeBucketAggregator(0.0, 10.0, 2)
+    agg.add(-5.0, 1.0)
+    agg.add(50.0, 2.0)
+
+    assert agg.candidate_points() == [(-5.0, 1.0), (50.0, 2.0)]
+    assert agg.rows_seen == 2
+
+
+def test_lttb_keeps_endpoints_and_budget():
+    points = _series(5000)
+
+    sampled = lttb(points, 100)
+
+    assert len(sampled) == 100
+    assert sampled[0] == points[0]
+    assert sampled[-1] == points[-1]
+    assert sampled == sorted(sampled)
+
+
+def test_lttb_passthrough_when_under_threshold():
+    points = _series(10)
+    assert lttb(points, 50) == points
+
+
+@pytest.mark.parametrize("method", ["lttb", "minmax"])
+def test_finalize_respects_max_points(method):
+    max_points = 200
+    agg = TimeBucketAggregator(0.0, 100_000.0, bucket_count(method, max_points))
+    agg.add_many(_series(100_000))
+
+    points = finalize(agg, method, max_points)
+
+    assert 0 < len(points) <= max_points
+    assert agg.rows_seen == 100_000
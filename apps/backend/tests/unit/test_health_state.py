@@ -0,0 +1,103 @@
+"""
+@fileoverview Unit tests for the shared dependency health state
+@module tests.unit.test_health_state
+
+@description
+Validates single-flight coalescing of concurrent callers, serving cached
+results within max staleness while scheduled, and that failures are never
+cached.
+"""
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from backend.utils.health_state import DependencyHealth
+
+
+class _SlowCheck:
+    def __init__(self, delay: float = 0.02) -> None:
+        self.calls = 0
+        self.delay = delay
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return {"status": "healthy", "n": self.calls}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_check():
+    check = _SlowCheck()
+    health = DependencyHealth()
+    health.register("database", check)
+
+    results = await asyncio.gather(*(health.get("database") for _ in range(50)))
+
+    assert check.calls == 1
+    assert all(r == {"status": "healthy", "n": 1} for r in results)
+    assert health.coalesced == 49
+
+
+@pytest.mark.asyncio
+async def test_not_cached_while_stopped():
+    check = _SlowCheck(delay=0)
+    health = DependencyHealth()
+    health.register("database", check)
+
+    await health.get("database")
+    await health.get("database")
+
+    assert check.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_scheduled_results_served_until_stale(monkeypatch):
+    monkeypatch.setenv("TRAIDER_ALLOW_DB_IN_TESTS", "1")
+    check = _SlowCheck(delay=0)
+    health = DependencyHealth(interval=60, max_staleness=0.05)
+    health.register("database", check)
+
+    health.start()
+    await asyncio.sleep(0.01)  # first scheduled refresh
+    try:
+        assert check.calls == 1
+        for _ in range(20):
+            assert (await health.get("database"))["n"] == 1
+        assert health.age("database") is not None
+
+        await asyncio.sleep(0.06)  # past max staleness – refreshed on demand
+        assert (await health.get("database"))["n"] == 2
+    finally:
+        await health.stop()
+
+    assert health.age("database") is None
+
+
+@pytest.mark.asyncio
+async def test_failures_propagate_and_are_not_cached(monkeypatch):
+    monkeypatch.setenv("TRAIDER_ALLOW_DB_IN_TESTS", "1")
+    outcomes = [RuntimeError("down"), {"status": "healthy"}]
+
+    async def check():
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    health = DependencyHealth(interval=60)
+    health.register("database", check)
+    health.start()
+    await asyncio.sleep(0.01)  # scheduled run fails and is logged
+    try:
+        assert health.age("database") is None
+        assert await health.get("database") == {"status": "healthy"}
+    finally:
+        await health.stop()
+
+
+def test_start_is_skipped_under_pytest():
+    health = DependencyHealth()
+    health.start()  # no running loop needed: short-circuits before scheduling
+    assert not health.running
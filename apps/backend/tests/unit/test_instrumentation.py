@@ -0,0 +1,100 @@
+"""
+@fileoverview Unit tests for the @instrument decorator
+@module tests.unit.test_instrumentation
+
+@description
+Validates sync/async timing with cached label children, error counting,
+sampling, late collector initialisation, and that metadata is preserved.
+"""
+from __future__ import annotations
+
+import importlib
+import inspect
+from types import SimpleNamespace
+
+import pytest
+from prometheus_client import CollectorRegistry, Counter, Histogram
+
+from backend.utils.instrumentation import instrument
+
+instrumentation_module = importlib.import_module("backend.utils.instrumentation")
+
+
+@pytest.fixture
+def collector(monkeypatch):
+    registry = CollectorRegistry()
+    metrics = SimpleNamespace(
+        request_duration=Histogram("req_seconds", "d", ["method", "endpoint", "status_code"], registry=registry),
+        error_count=Counter("errors", "e", ["error_type", "component"], registry=registry),
+    )
+    monkeypatch.setattr(instrumentation_module, "get_metrics_collector", lambda: metrics)
+    return registry
+
+
+def _count(registry, method, function, status="200"):
+    return registry.get_sample_value(
+        "req_seconds_count", {"method": method, "endpoint": function, "status_code": status}
+    ) or 0
+
+
+def test_sync_success_and_failure(collector):
+    @instrument
+    def divide(a, b):
+        return a / b
+
+    assert divide(4, 2) == 2
+    with pytest.raises(ZeroDivisionError):
+        divide(1, 0)
+
+    assert _count(collector, "SYNC", "divide") == 1
+    assert _count(collector, "SYNC", "divide", "500") == 1
+    assert collector.get_sample_value(
+        "errors_total", {"error_type": "ZeroDivisionError", "component": "divide"}
+    ) == 1
+    assert divide.__name__ == "divide"
+
+
+@pytest.mark.asyncio
+async def test_async_wrapper_detected_at_decoration(collector):
+    @instrument(function="fetch")
+    async def fetch_price(symbol):
+        return symbol
+
+    assert inspect.iscoroutinefunction(fetch_price)
+    assert await fetch_price("BTC-USD") == "BTC-USD"
+    assert _count(collector, "ASYNC", "fetch") == 1
+
+
+def test_sampling_times_every_nth_call_but_counts_all_errors(collector):
+    @instrument(sample_rate=0.1)
+    def hot(fail=False):
+        if fail:
+            raise ValueError("bad tick")
+
+    for _ in range(100):
+        hot()
+    for _ in range(5):
+        with pytest.raises(ValueError):
+            hot(fail=True)
+
+    assert _count(collector, "SYNC", "hot") == 10
+    assert collector.get_sample_value("errors_total", {"error_type": "ValueError", "component": "hot"}) == 5
+
+
+def test_collector_initialised_after_decoration(monkeypatch, collector):
+    metrics = instrumentation_module.get_metrics_collector()
+    monkeypatch.setattr(instrumentation_module, "get_metrics_collector", lambda: None)
+
+    @instrument
+    def early():
+        return 1
+
+    assert early() == 1  # no collector yet – plain call
+    monkeypatch.setattr(instrumentation_module, "get_metrics_collector", lambda: metrics)
+    assert early() == 1
+    assert _count(collector, "SYNC", "early") == 1
+
+
+def test_invalid_sample_rate():
+    with pytest.raises(ValueError):
+        instrument(sample_rate=0)
@@ -0,0 +1,109 @@
+"""
+@fileoverview Unit tests for request-log sampling and rate limiting
+@module tests.unit.test_log_sampling
+
+@description
+Covers prefix-based route rates, per-event rates, the token bucket, forced
+lines, suppressed-count summaries and env parsing.
+"""
+from __future__ import annotations
+
+import pytest
+from prometheus_client import CollectorRegistry
+
+from backend.utils.log_sampling import LogSampler, parse_rates
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _sampler(**kwargs) -> LogSampler:
+    kwargs.setdefault("clock", _Clock())
+    return LogSampler(registry=CollectorRegistry(), **kwargs)
+
+
+def test_defaults_keep_every_line():
+    sampler = _sampler()
+
+    assert not sampler.active
+    assert all(sampler.allow("Request completed", "/api/v1/orders") for _ in range(100))
+    assert sampler.summaries(force=True) == []
+
+
+def test_longest_route_prefix_and_event_rate_combine():
+    sampler = _sampler(
+        route_rates={"/api/v1": 0.5, "/api/v1/health": 0.01},
+        event_rates={"Request started": 0.5},
+    )
+
+    def kept(event, path, n=1000):
+        return sum(sampler.allow(event, path) for _ in range(n))
+
+    assert kept("Request completed", "/api/v1/health/live") == 10
+    assert kept("Request completed", "/api/v1/orders") == 500
+    assert kept("Request started", "/api/v1/orders") == 250
+    assert kept("Request completed", "/metrics") == 1000
+
+
+def test_zero_rate_drops_everything_except_forced_lines():
+    sampler = _sampler(event_rates={"Request started": 0.0})
+
+    assert not any(sampler.allow("Request started", "/x") for _ in range(10))
+    assert sampler.allow("Request started", "/x", force=True)
+
+
+def test_token_bucket_limits_bursts_and_refills():
+    clock = _Clock()
+    sampler = _sampler(rate_limit=10, burst=5, clock=clock)
+
+    assert sum(sampler.allow("Request completed", "/api") for _ in range(20)) == 5
+    clock.now += 0.5  # 5 tokens back
+    assert sum(sampler.allow("Request completed", "/api") for _ in range(20)) == 5
+    # Buckets are per (event, route)
+    assert sampler.allow("Request started", "/api")
+
+
+def test_summaries_report_suppressed_counts_once_per_interval():
+    clock = _Clock()
+    sampler = _sampler(route_rates={"/api/v1/health": 0.1}, rate_limit=100, burst=1,
+                       summary_interval=60, clock=clock)
+    for _ in range(20):
+        sampler.allow("Request completed", "/api/v1/health")
+    sampler.allow("Request started", "/api/v1/orders")
+    sampler.allow("Request started", "/api/v1/orders")
+
+    assert sampler.summaries() == []
+    clock.now += 60
+    summaries = {(s["log_event"], s["route"]): s for s in sampler.summaries()}
+
+    health = summaries[("Request completed", "/api/v1/health")]
+    assert health["sampled_out"] == 18 and health["rate_limited"] == 1  # 2 sampled in, burst of 1
+    assert summaries[("Request started", "*")]["rate_limited"] == 1
+    assert health["interval_seconds"] == 60.0
+    assert sampler.summaries(force=True) == []
+
+
+def test_from_env_and_parse_errors():
+    sampler = LogSampler.from_env(
+        {
+            "LOG_SAMPLE_ROUTES": "/api/v1/health=0.01, /api/v1/market-data=0.1",
+            "LOG_SAMPLE_EVENTS": "Request started=0",
+            "LOG_RATE_LIMIT_PER_SEC": "50",
+        },
+        registry=CollectorRegistry(),
+    )
+
+    assert sampler.active
+    assert sampler.route_rates == {"/api/v1/market-data": 0.1, "/api/v1/health": 0.01}
+    assert sampler.event_rates == {"Request started": 0.0}
+    assert sampler.burst == 100
+
+    with pytest.raises(ValueError):
+        parse_rates("/health")
+    with pytest.raises(ValueError):
+        parse_rates("/health=2")
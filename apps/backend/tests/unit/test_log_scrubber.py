@@ -0,0 +1,58 @@
+"""
+@fileoverview Unit tests for the sensitive-data log scrubber
+@module tests.unit.test_log_scrubber
+
+@description
+Verifies masking at every depth (dicts in lists in dicts), case-insensitive
+substring matching, the copy-on-change contract and the flat fast path.
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+
+import pytest
+
+from backend.utils.logging import MASK, filter_sensitive_data
+
+
+def _scrub(event):
+    return filter_sensitive_data(None, "info", event)
+
+
+def test_flat_event_without_sensitive_keys_is_returned_unchanged():
+    event = {"event": "Order accepted", "symbol": "BTC-USD", "qty": 0.5, "ok": True, "note": None}
+
+    assert _scrub(event) is event
+
+
+@pytest.mark.parametrize("key", ["password", "API_KEY", "X-Auth-Header", "refreshToken", "client_secret"])
+def test_sensitive_keys_masked_case_insensitively(key):
+    assert _scrub({"event": "x", key: "hunter2"}) == {"event": "x", key: MASK}
+
+
+def test_nested_dicts_and_lists_are_scrubbed_without_mutating_input():
+    extra = {"user": "alice", "credentials": {"pin": 1}, "attempts": [{"token": "abc"}, {"ip": "10.0.0.1"}]}
+    event = {"event": "Login attempt", "extra": extra}
+
+    result = _scrub(event)
+
+    assert result == {
+        "event": "Login attempt",
+        "extra": {"user": "alice", "credentials": MASK, "attempts": [{"token": MASK}, {"ip": "10.0.0.1"}]},
+    }
+    assert event["extra"] is extra and extra["attempts"][0] == {"token": "abc"}
+    assert result["extra"]["attempts"][1] is extra["attempts"][1]  # untouched branches are shared
+
+
+def test_same_shape_with_different_values_uses_cached_classification():
+    first = _scrub({"event": "a", "secret_id": 1})
+    second = _scrub({"event": "b", "secret_id": 2})
+
+    assert first["secret_id"] == second["secret_id"] == MASK
+    assert second["event"] == "b"
+
+
+def test_dict_subclasses_and_non_string_keys_take_the_full_path():
+    event = {"event": "x", "payload": OrderedDict(password="p"), 42: "answer"}
+
+    assert _scrub(event) == {"event": "x", "payload": {"password": MASK}, 42: "answer"}
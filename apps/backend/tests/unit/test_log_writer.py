@@ -0,0 +1,197 @@
+"""
+@fileoverview Unit tests for the queue-based async log writer
+@module tests.unit.test_log_writer
+
+@description
+Checks synchronous fallback outside the writer lifecycle, ordered batched
+output, the drop / block overflow policies (audit records always wait),
+message freezing in the forwarding handler and structlog integration.
+"""
+from __future__ import annotations
+
+import io
+import logging
+import threading
+import time
+
+import structlog
+from prometheus_client import CollectorRegistry
+
+from backend.utils.log_writer import (
+    AsyncLogWriter,
+    QueueForwardHandler,
+    QueueLoggerFactory,
+    install_queue_handler,
+)
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self, gate: threading.Event | None = None) -> None:
+        super().__init__()
+        self.messages = []
+        self.gate = gate
+
+    def emit(self, record):
+        if self.gate is not None:
+            self.gate.wait(5)
+        self.messages.append(record.getMessage())
+
+
+def _writer(**kwargs) -> AsyncLogWriter:
+    return AsyncLogWriter(registry=CollectorRegistry(), **kwargs)
+
+
+def _wait_until(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.005)
+
+
+def test_writes_synchronously_when_not_running():
+    writer = _writer()
+    stream = io.StringIO()
+
+    assert writer.submit(stream, "line\n")
+    assert stream.getvalue() == "line\n"
+
+
+def test_batches_lines_in_order_and_drains_on_stop():
+    writer = _writer(batch_size=64)
+    stream = io.StringIO()
+    writer.start()
+
+    for i in range(1000):
+        writer.submit(stream, f"{i}\n")
+    writer.stop()
+
+    assert stream.getvalue().splitlines() == [str(i) for i in range(1000)]
+    assert not writer.running
+
+
+def _stall(writer: AsyncLogWriter):
+    """Park the writer thread inside a handler until the returned gate is set."""
+    gate = threading.Event()
+    stuck = _ListHandler(gate)
+    writer.submit((stuck,), logging.makeLogRecord({"msg": "stall", "levelno": logging.INFO}))
+    _wait_until(lambda: writer.stats()["queued"] == 0)
+    return gate, stuck
+
+
+def test_drop_policy_drops_only_non_critical_records():
+    writer = _writer(maxsize=2, overflow="drop")
+    stream = io.StringIO()
+    writer.start()
+    gate, _ = _stall(writer)
+
+    assert writer.submit(stream, "a\n") and writer.submit(stream, "b\n")
+    assert writer.submit(stream, "dropped\n") is False
+    assert writer.dropped == 1
+
+    audit = threading.Thread(target=writer.submit, args=(stream, "audit\n", True))
+    audit.start()
+    time.sleep(0.05)
+    assert audit.is_alive()  # waits for space instead of dropping
+
+    gate.set()
+    audit.join(2)
+    writer.stop()
+
+    assert stream.getvalue().splitlines() == ["a", "b", "audit"]
+    assert writer.blocked == 1
+
+
+def test_block_policy_waits_for_space():
+    writer = _writer(maxsize=1, overflow="block")
+    stream = io.StringIO()
+    writer.start()
+    gate, _ = _stall(writer)
+
+    writer.submit(stream, "a\n")
+    late = threading.Thread(target=writer.submit, args=(stream, "b\n"))
+    late.start()
+    time.sleep(0.05)
+    assert late.is_alive()
+
+    gate.set()
+    late.join(2)
+    writer.stop()
+
+    assert stream.getvalue().splitlines() == ["a", "b"]
+    assert writer.dropped == 0
+
+
+def test_stop_leaves_queue_to_a_writer_thread_that_did_not_stop(capsys):
+    writer = _writer()
+    stream = io.StringIO()
+    writer.start()
+    thread = writer._thread
+    gate, stuck = _stall(writer)
+    writer.submit(stream, "a\n")
+
+    started = time.monotonic()
+    writer.stop(timeout=0.05)
+
+    assert time.monotonic() - started < 1.0  # did not wait on the stuck sink
+    assert stream.getvalue() == ""
+    assert "did not stop within 0.05s" in capsys.readouterr().err
+
+    gate.set()
+    thread.join(2)
+    assert stuck.messages == ["stall"]
+    assert stream.getvalue() == "a\n"
+
+
+def test_forward_handler_freezes_message_and_respects_target_level():
+    writer = _writer()
+    info, errors = _ListHandler(), _ListHandler()
+    errors.setLevel(logging.ERROR)
+    logger = logging.getLogger("tests.log_writer.forward")
+    logger.propagate = False
+    logger.addHandler(info)
+    logger.addHandler(errors)
+    install_queue_handler(logger, writer)
+    writer.start()
+    try:
+        assert [type(h) for h in logger.handlers] == [QueueForwardHandler]
+        payload = ["before"]
+        logger.warning("value=%s", payload)
+        payload[0] = "after"
+        logger.error("boom")
+    finally:
+        writer.stop()
+        logger.handlers.clear()
+
+    assert info.messages == ["value=['before']", "boom"]
+    assert errors.messages == ["boom"]
+
+
+def test_audit_and_trading_loggers_are_critical():
+    writer = _writer()
+    factory = QueueLoggerFactory(writer, file=io.StringIO())
+
+    assert factory("audit")._critical and factory("trading")._critical
+    assert not factory("api.auth")._critical
+
+    audit = logging.getLogger("audit")
+    saved = audit.handlers[:]
+    audit.handlers = [_ListHandler()]
+    try:
+        install_queue_handler(audit, writer)
+        assert audit.handlers[0].critical
+    finally:
+        audit.handlers = saved
+
+
+def test_structlog_lines_go_through_the_queue():
+    writer = _writer()
+    stream = io.StringIO()
+    log = structlog.wrap_logger(
+        QueueLoggerFactory(writer, file=stream)("audit"),
+        processors=[structlog.processors.JSONRenderer()],
+    )
+    writer.start()
+    log.info("order placed", order_id="42")
+    writer.stop()
+
+    assert '"order_id": "42"' in stream.getvalue()
@@ -0,0 +1,67 @@
+"""
+@fileoverview Unit tests for the event-loop lag monitor and blocking detector
+@module tests.unit.test_loop_monitor
+
+@description
+Validates that a synchronous stall shows up as lag in the histogram and that
+the detector logs the blocking stack once per stall, rate-limited.
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+from prometheus_client import CollectorRegistry
+
+from backend.utils.loop_monitor import EventLoopMonitor
+
+
+def _blocking_section(seconds: float) -> None:
+    time.sleep(seconds)  # stands in for bcrypt / a sync handler
+
+
+@pytest.mark.asyncio
+async def test_lag_recorded_for_blocking_call():
+    registry = CollectorRegistry()
+    monitor = EventLoopMonitor(interval=0.01, registry=registry)
+    monitor.start()
+    await asyncio.sleep(0.03)
+    _blocking_section(0.1)
+    await asyncio.sleep(0.03)
+    await monitor.stop()
+
+    assert monitor.max_lag >= 0.08
+    assert registry.get_sample_value("traider_event_loop_lag_seconds_count") >= 3
+    assert registry.get_sample_value("traider_event_loop_lag_seconds_bucket", {"le": "0.05"}) < \
+        registry.get_sample_value("traider_event_loop_lag_seconds_count")
+    assert not monitor.running
+
+
+@pytest.mark.asyncio
+async def test_detector_logs_blocking_stack_rate_limited():
+    registry = CollectorRegistry()
+    monitor = EventLoopMonitor(interval=0.01, block_threshold=0.05, log_interval=60, registry=registry)
+    with patch("backend.utils.loop_monitor.logger") as mock_logger:
+        monitor.start()
+        await asyncio.sleep(0.02)
+        _blocking_section(0.2)
+        await asyncio.sleep(0.02)
+        _blocking_section(0.2)
+        await asyncio.sleep(0.02)
+        await monitor.stop()
+
+    assert monitor.blocked_count == 2
+    assert registry.get_sample_value("traider_event_loop_blocked_total") == 2
+    assert mock_logger.warning.call_count == 1  # second stall suppressed
+    message = mock_logger.warning.call_args[0][0]
+    assert "_blocking_section" in message
+    assert "test_detector_logs_blocking_stack_rate_limited" in message
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        EventLoopMonitor(interval=0, registry=CollectorRegistry())
+    with pytest.raises(ValueError):
+        EventLoopMonitor(block_threshold=0, registry=CollectorRegistry())
@@ -0,0 +1,94 @@
+"""
+@fileoverview Unit tests for live tick fan-out
+@module tests.unit.test_market_data_broadcast
+
+@description
+Covers per-symbol routing, top-of-book conflation, slow-client eviction and
+the listener hook that feeds the broadcaster.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+from services.market_data.broadcast import SubscriberEvicted, TickBroadcaster
+from services.market_data.tick_cache import TickCache, TickCacheListener
+
+
+def _tick(symbol: str = "BTC-USD", price: float = 100.0, bid: float | None = None, ask: float | None = None):
+    return {"timestamp": "2025-07-05T12:00:00+00:00", "symbol": symbol, "price": price, "bid": bid, "ask": ask}
+
+
+@pytest.mark.asyncio
+async def test_ticks_routed_by_symbol():
+    broadcaster = TickBroadcaster()
+    btc = broadcaster.subscribe(["btc-usd"], ["ticks"])
+    eth = broadcaster.subscribe(["ETH-USD"], ["ticks"])
+
+    broadcaster.publish(_tick("BTC-USD", 1.0))
+    broadcaster.publish(_tick("BTC-USD", 2.0))
+
+    batch = await btc.next_batch()
+    assert [json.loads(payload)["price"] for _, payload in batch] == [1.0, 2.0]
+    assert eth.backlog == 0
+
+
+@pytest.mark.asyncio
+async def test_book_channel_is_conflated():
+    broadcaster = TickBroadcaster()
+    sub = broadcaster.subscribe(["BTC-USD"], ["book"])
+
+    for i in range(50):
+        broadcaster.publish(_tick(bid=100.0 + i, ask=101.0 + i))
+
+    batch = await sub.next_batch()
+    assert len(batch) == 1
+    channel, payload = batch[0]
+    assert channel == "book"
+    assert json.loads(payload)["bid"] == 149.0
+
+
+@pytest.mark.asyncio
+async def test_slow_client_evicted_without_affecting_others():
+    broadcaster = TickBroadcaster(queue_size=4)
+    slow = broadcaster.subscribe(["BTC-USD"], ["ticks"])
+    fast = broadcaster.subscribe(["BTC-USD"], ["ticks"])
+
+    for i in range(10):
+        broadcaster.publish(_tick(price=float(i)))
+        if i % 2:
+            await fast.next_batch()
+
+    with pytest.raises(SubscriberEvicted):
+        await slow.next_batch()
+    assert broadcaster.evictions == 1
+    assert broadcaster.subscriber_count == 1
+
+
+def test_subscribe_validation_and_limit():
+    broadcaster = TickBroadcaster(max_subscribers=1)
+    with pytest.raises(ValueError):
+        broadcaster.subscribe([], ["ticks"])
+    with pytest.raises(ValueError):
+        broadcaster.subscribe(["BTC-USD"], ["trades"])
+
+    broadcaster.subscribe(["BTC-USD"])
+    with pytest.raises(OverflowError):
+        broadcaster.subscribe(["BTC-USD"])
+
+
+@pytest.mark.asyncio
+async def test_listener_feeds_cache_and_broadcaster():
+    cache = TickCache()
+    broadcaster = TickBroadcaster()
+    listener = TickCacheListener(cache, "postgresql://unused", on_tick=broadcaster.publish)
+    cache.set_live(True)
+    sub = broadcaster.subscribe(["BTC-USD"], ["ticks"])
+
+    listener.handle_notification(json.dumps(_tick(price=123.0)))
+
+    assert cache.latest("BTC-USD", 1)[0]["price"] == 123.0
+    batch = await asyncio.wait_for(sub.next_batch(), 1)
+    assert json.loads(batch[0][1])["price"] == 123.0
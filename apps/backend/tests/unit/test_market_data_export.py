@@ -0,0 +1,87 @@
+"""
+@fileoverview Unit tests for streaming market-data export encoders
+@module tests.unit.test_market_data_export
+
+@description
+Round-trips NDJSON, Arrow IPC and Parquet output produced batch by batch and
+checks that encoders emit bytes incrementally rather than at the end.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+
+from services.market_data.export import (
+    EXPORT_COLUMNS,
+    encode_batches,
+    make_encoder,
+)
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+_BASE = datetime(2025, 7, 5, tzinfo=timezone.utc)
+
+
+def _rows(count: int, offset: int = 0):
+    return [
+        (
+            _BASE + timedelta(seconds=offset + i),
+            "BTC-USD",
+            Decimal("30000.12345678"),
+            Decimal("0.5"),
+            None,
+            None,
+            None,
+            1,
+            None,
+        )
+        for i in range(count)
+    ]
+
+
+def _collect(fmt: str, batches: int = 3, size: int = 50) -> list[bytes]:
+    async def _source():
+        for n in range(batches):
+            yield _rows(size, offset=n * size)
+
+    async def _run():
+        return [chunk async for chunk in encode_batches(_source(), fmt)]
+
+    return asyncio.run(_run())
+
+
+def test_ndjson_lines_match_rest_conventions():
+    chunks = _collect("ndjson")
+    lines = b"".join(chunks).decode().splitlines()
+
+    assert len(lines) == 150
+    first = json.loads(lines[0])
+    assert list(first) == list(EXPORT_COLUMNS)
+    assert first["price"] == 30000.12345678
+    assert first["timestamp"] == "2025-07-05T00:00:00+00:00"
+
+
+@pytest.mark.parametrize("fmt", ["arrow", "parquet"])
+def test_columnar_formats_stream_per_batch(fmt):
+    chunks = _collect(fmt)
+
+    # Output is produced while batches arrive, not in one final blob
+    assert len(chunks) >= 3
+
+    data = b"".join(chunks)
+    if fmt == "arrow":
+        table = pa.ipc.open_stream(data).read_all()
+    else:
+        table = pq.read_table(pa.BufferReader(data))
+    assert table.num_rows == 150
+    assert table.column("price")[0].as_py() == Decimal("30000.12345678")
+
+
+def test_unknown_format_rejected():
+    with pytest.raises(ValueError):
+        make_encoder("csv")
@@ -0,0 +1,81 @@
+"""
+@fileoverview Unit tests for tracemalloc-based allocation tracking
+@module tests.unit.test_memory_tracker
+
+@description
+Validates growth detection between snapshots, subsystem attribution with
+budget flags, and that tracing is only stopped by the tracker that started it.
+"""
+from __future__ import annotations
+
+import tracemalloc
+
+import pytest
+from prometheus_client import CollectorRegistry
+
+from backend.utils.memory_tracker import MEMORY_BUDGETS_MB, MemoryTracker, _subsystem
+
+
+@pytest.fixture
+def tracker():
+    registry = CollectorRegistry()
+    tracker = MemoryTracker(registry=registry)
+    assert tracker.start(frames=1)
+    yield tracker, registry
+    tracker.stop()
+
+
+def _leaky_cache(store: list, n: int) -> None:
+    for i in range(n):
+        store.append(bytearray(1024))
+
+
+def test_growth_points_at_leaking_site(tracker):
+    tracker, registry = tracker
+    store: list = []
+    first = tracker.report()
+    assert first["growth"] == [] and first["traced_bytes"] > 0
+
+    _leaky_cache(store, 2000)
+    second = tracker.report(limit=5)
+
+    top_growth = second["growth"][0]
+    assert "test_memory_tracker.py" in top_growth["site"]
+    assert top_growth["size_diff_bytes"] >= 2000 * 1024
+    assert registry.get_sample_value("traider_memory_traced_total_bytes") > 2000 * 1024
+
+
+def test_subsystem_attribution_and_budgets(tracker, monkeypatch):
+    tracker, registry = tracker
+    monkeypatch.setitem(MEMORY_BUDGETS_MB, "backend", 0.001)
+    store: list = []
+    _leaky_cache(store, 100)
+
+    report = tracker.report(group_by="filename")
+
+    backend = report["subsystems"]["backend"]  # tests live under apps/backend/
+    assert backend["over_budget"] is True and backend["size_bytes"] > 100 * 1024
+    assert registry.get_sample_value("traider_memory_traced_bytes", {"subsystem": "backend"}) == backend["size_bytes"]
+    assert _subsystem("/srv/apps/backend/services/market_data/timescale_writer.py") == "timescale_writer"
+    assert _subsystem("/usr/lib/python3.11/json/decoder.py") == "other"
+
+
+def test_invalid_group_by(tracker):
+    tracker, _ = tracker
+    with pytest.raises(ValueError):
+        tracker.report(group_by="module")
+
+
+def test_does_not_stop_foreign_tracing():
+    tracemalloc.start()
+    try:
+        tracker = MemoryTracker(registry=CollectorRegistry())
+        assert tracker.start() is False
+        assert tracker.stop() is False
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+    tracker = MemoryTracker(registry=CollectorRegistry())
+    with pytest.raises(RuntimeError):
+        tracker.report()
@@ -0,0 +1,68 @@
+"""
+@fileoverview Unit tests for MetricRing raw-point storage
+@module tests.unit.test_metric_ring
+
+@description
+Validates overwrite-at-capacity, growth, time-indexed eviction across the
+wrap point, and that `MetricsCollector` keys series by name and label set.
+"""
+from __future__ import annotations
+
+from backend.utils.monitoring import MetricRing
+
+
+def _filled(capacity: int, count: int) -> MetricRing:
+    ring = MetricRing(capacity)
+    for i in range(count):
+        ring.append(float(i), float(i) * 10)
+    return ring
+
+
+def test_grows_then_overwrites_oldest():
+    ring = _filled(100, 250)
+
+    assert len(ring) == 100
+    assert ring.points()[0] == (150.0, 1500.0)
+    assert ring.latest() == (249.0, 2490.0)
+
+
+def test_evict_before_across_wrap_point():
+    ring = _filled(100, 250)  # head is mid-buffer after wrapping
+
+    dropped = ring.evict_before(200.0)
+
+    assert dropped == 50
+    assert [ts for ts, _ in ring.points()] == [float(i) for i in range(200, 250)]
+
+    ring.append(250.0, 0.0)
+    assert ring.latest() == (250.0, 0.0)
+    assert ring.evict_before(1_000.0) == 51
+    assert len(ring) == 0 and ring.latest() is None
+
+
+def test_evict_noop_when_all_recent():
+    ring = _filled(10, 5)
+    assert ring.evict_before(0.0) == 0
+    assert len(ring) == 5
+
+
+def test_collector_series_keyed_by_labels(monkeypatch):
+    from backend.utils import monitoring
+
+    collector = monitoring.get_metrics_collector() or monitoring.initialize_metrics("test_metric_ring")
+    collector.record_metric("fills", 1.0, {"venue": "cb", "side": "buy"})
+    collector.record_metric("fills", 2.0, {"side": "buy", "venue": "cb"})
+    collector.record_metric("fills", 3.0)
+
+    labelled = collector.get_metric_points("fills", {"venue": "cb", "side": "buy"})
+    assert [p.value for p in labelled][-2:] == [1.0, 2.0]
+    assert labelled[-1].labels == {"venue": "cb", "side": "buy"}
+    assert collector.get_metric_points("fills")[-1].value == 3.0
+
+    monkeypatch.setattr(monitoring, "METRIC_RETENTION_SECONDS", -1)
+    collector._cleanup_old_metrics()
+    assert collector.get_metric_points("fills") == []
+
+    # Series dropped by cleanup are recreated, not appended to a detached ring
+    collector.record_metric("fills", 4.0, {"side": "buy", "venue": "cb"})
+    assert [p.value for p in collector.get_metric_points("fills", {"venue": "cb", "side": "buy"})] == [4.0]
@@ -0,0 +1,103 @@
+"""
+@fileoverview Unit tests for the bounded password-hash executor
+@module tests.unit.test_password_hasher
+
+@description
+Covers execution on the worker pool, the event loop staying responsive,
+queue admission limits with metrics, and login's 503 on saturation.
+"""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from fastapi import HTTPException
+from prometheus_client import CollectorRegistry
+
+from backend.api import auth
+from backend.utils.password_hasher import PasswordHashExecutor, PasswordHashQueueFull
+
+
+def _executor(**kwargs) -> PasswordHashExecutor:
+    return PasswordHashExecutor(registry=CollectorRegistry(), **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_runs_on_worker_thread_and_keeps_loop_responsive():
+    executor = _executor(max_workers=2)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.005)
+
+    def slow_hash(value):
+        time.sleep(0.2)  # stands in for bcrypt, which also releases the GIL
+        return threading.current_thread().name, value * 2
+
+    task = asyncio.create_task(ticker())
+    try:
+        thread_name, result = await executor.run("hash", slow_hash, 21)
+    finally:
+        task.cancel()
+        executor.shutdown()
+
+    assert thread_name.startswith("password-hash") and result == 42
+    assert ticks >= 10
+
+
+@pytest.mark.asyncio
+async def test_calls_beyond_workers_and_queue_are_rejected():
+    executor = _executor(max_workers=1, max_queue=1)
+    release = threading.Event()
+    running = threading.Event()
+
+    def blocked():
+        running.set()
+        release.wait(5)
+        return "ok"
+
+    first = asyncio.ensure_future(executor.run("verify", blocked))
+    await asyncio.get_running_loop().run_in_executor(None, running.wait, 5)
+    second = asyncio.ensure_future(executor.run("verify", blocked))
+    await asyncio.sleep(0)
+
+    with pytest.raises(PasswordHashQueueFull) as exc_info:
+        await executor.run("verify", blocked)
+    assert exc_info.value.retry_after == 1
+    assert executor.stats() == {"max_workers": 1, "max_queue": 1, "waiting": 1, "running": 1, "rejected": 1}
+
+    release.set()
+    assert await asyncio.gather(first, second) == ["ok", "ok"]
+    assert executor.stats()["waiting"] == executor.stats()["running"] == 0
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_worker_exceptions_propagate_without_leaking_slots():
+    executor = _executor(max_workers=1, max_queue=0)
+
+    def broken():
+        raise RuntimeError("bad hash")
+
+    with pytest.raises(RuntimeError, match="bad hash"):
+        await executor.run("verify", broken)
+    assert await executor.run("verify", lambda: True) is True
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_login_answers_503_when_hashing_is_saturated():
+    request = auth.LoginRequest(username="alice", password="secret")
+    # The class auth.py catches (it imports the top-level ``utils`` package)
+    with patch.object(auth, "authenticate_user", side_effect=auth.PasswordHashQueueFull(64)):
+        with pytest.raises(HTTPException) as exc_info:
+            await auth.login(request)
+
+    assert exc_info.value.status_code == 503
+    assert exc_info.value.headers == {"Retry-After": "1"}
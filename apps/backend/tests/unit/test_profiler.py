@@ -0,0 +1,83 @@
+"""
+@fileoverview Unit tests for the sampling profiler
+@module tests.unit.test_profiler
+
+@description
+Validates task-name tagging of event-loop samples, worker-thread capture,
+both export formats, and that sampling overhead stays bounded.
+"""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from backend.utils.profiler import SamplingProfiler
+
+
+def _burn(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        sum(range(200))
+
+
+async def _busy_task() -> None:
+    for _ in range(20):
+        _burn(0.01)
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_samples_tagged_by_task_and_thread():
+    stop = threading.Event()
+
+    def _work() -> None:
+        while not stop.is_set():
+            _burn(0.01)
+
+    worker = threading.Thread(target=_work, name="ingest-worker", daemon=True)
+    worker.start()
+
+    profiler = SamplingProfiler(interval=0.002)
+    profiler.start()
+    await asyncio.create_task(_busy_task(), name="timescale-batch-writer")
+    profiler.stop()
+    stop.set()
+    worker.join()
+
+    collapsed = profiler.collapsed()
+    lines = collapsed.splitlines()
+    assert profiler.samples > 10
+    assert any(line.startswith("task:timescale-batch-writer;") and "_burn" in line for line in lines)
+    assert any(line.startswith("ingest-worker;") for line in lines)
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+
+    doc = profiler.speedscope()
+    names = {p["name"] for p in doc["profiles"]}
+    assert {"task:timescale-batch-writer", "ingest-worker"} <= names
+    frames = doc["shared"]["frames"]
+    for prof in doc["profiles"]:
+        assert len(prof["samples"]) == len(prof["weights"])
+        assert all(0 <= idx < len(frames) for sample in prof["samples"] for idx in sample)
+
+
+def test_overhead_stays_bounded():
+    threads = [threading.Thread(target=time.sleep, args=(0.5,), daemon=True) for _ in range(30)]
+    for t in threads:
+        t.start()
+    profiler = SamplingProfiler(interval=0.0001, max_overhead=0.02, include_idle=True)
+    profiler.start()
+    time.sleep(0.4)
+    profiler.stop()
+
+    assert profiler.samples > 0
+    assert profiler.overhead < 0.05
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        SamplingProfiler(interval=0)
+    with pytest.raises(ValueError):
+        SamplingProfiler(max_overhead=1.5)
@@ -0,0 +1,139 @@
+"""
+@fileoverview Unit tests for the streaming quantile sketch and PerformanceWindow
+@module tests.unit.test_quantile_sketch
+
+@description
+Checks relative-error guarantees against exact quantiles, lossless merging,
+serialisation round-trips and time-decay of the sliced performance window.
+"""
+from __future__ import annotations
+
+import random
+import statistics
+
+import pytest
+
+from backend.utils.monitoring import PerformanceWindow
+from backend.utils.quantile_sketch import QuantileSketch
+
+
+def _latencies(n: int, seed: int = 7):
+    rng = random.Random(seed)
+    return [rng.lognormvariate(-5.0, 1.2) for _ in range(n)]  # ~ms-scale durations
+
+
+def _exact(values, q):
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+@pytest.mark.parametrize("q", [0.5, 0.95, 0.99])
+def test_quantiles_within_relative_accuracy(q):
+    values = _latencies(50_000)
+    sketch = QuantileSketch(relative_accuracy=0.01)
+    for v in values:
+        sketch.add(v)
+
+    assert sketch.quantile(q) == pytest.approx(_exact(values, q), rel=0.0201)
+    assert sketch.count == len(values)
+    assert sketch.min == min(values) and sketch.max == max(values)
+
+
+def test_handles_zero_and_negative_values():
+    sketch = QuantileSketch()
+    for v in [-10.0, -1.0, 0.0, 0.0, 1.0, 10.0]:
+        sketch.add(v)
+
+    assert sketch.quantile(0.0) == -10.0
+    assert sketch.quantile(0.5) == 0.0
+    assert sketch.quantile(1.0) == 10.0
+
+
+def test_merge_equals_single_sketch():
+    values = _latencies(10_000)
+    whole, left, right = QuantileSketch(), QuantileSketch(), QuantileSketch()
+    for i, v in enumerate(values):
+        whole.add(v)
+        (left if i % 2 else right).add(v)
+
+    left.merge(QuantileSketch.from_dict(right.to_dict()))
+
+    assert left.count == whole.count
+    assert left.quantiles((0.5, 0.95, 0.99)) == whole.quantiles((0.5, 0.95, 0.99))
+
+
+def test_merge_rejects_different_accuracy():
+    with pytest.raises(ValueError):
+        QuantileSketch(0.01).merge(QuantileSketch(0.02))
+
+
+def test_bucket_count_is_bounded():
+    sketch = QuantileSketch(max_buckets=64)
+    for exp in range(-300, 300):
+        sketch.add(10.0 ** (exp / 10))
+
+    assert len(sketch.to_dict()["positive"]) <= 64
+    assert sketch.quantile(0.99) == pytest.approx(_exact([10.0 ** (e / 10) for e in range(-300, 300)], 0.99), rel=0.03)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_window_stats_match_previous_api():
+    window = PerformanceWindow(clock=_Clock())
+    values = _latencies(1000)
+    for v in values:
+        window.add(v)
+
+    stats = window.get_stats()
+
+    assert set(stats) == {"count", "min", "max", "mean", "median", "p95", "p99"}
+    assert stats["count"] == 1000
+    assert stats["mean"] == pytest.approx(statistics.mean(values))
+    assert stats["median"] == pytest.approx(statistics.median(values), rel=0.03)
+
+
+def test_window_decays_old_slices():
+    clock = _Clock()
+    window = PerformanceWindow(window_seconds=60, slices=6, clock=clock)
+    window.add(5.0)
+    clock.now += 30
+    window.add(1.0)
+
+    assert window.get_stats()["count"] == 2
+    clock.now += 40  # first slice is now older than 60 s
+    assert window.get_stats() == {"count": 1, "min": 1.0, "max": 1.0, "mean": 1.0,
+                                  "median": 1.0, "p95": 1.0, "p99": 1.0}
+    clock.now += 60
+    assert window.get_stats() == {}
+
+
+def test_windows_merge_across_workers():
+    clock = _Clock()
+    a = PerformanceWindow(clock=clock)
+    b = PerformanceWindow(clock=clock)
+    a.add(0.010)
+    b.add(0.020)
+    b.add(0.030)
+
+    a.merge(PerformanceWindow.from_dict(b.to_dict()))
+
+    stats = a.get_stats()
+    assert stats["count"] == 3
+    assert stats["max"] == 0.030
+
+
+def test_sketch_rank():
+    sketch = QuantileSketch()
+    for v in (0.01, 0.02, 0.5, 1.0, 2.0):
+        sketch.add(v)
+
+    assert sketch.rank(0.001) == 0
+    assert sketch.rank(0.1) == 2
+    assert sketch.rank(1.5) == 4
+    assert sketch.rank(5.0) == 5
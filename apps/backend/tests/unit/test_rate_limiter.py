@@ -0,0 +1,156 @@
+"""
+@fileoverview Unit tests for the GCRA rate limiter
+@module tests.unit.test_rate_limiter
+
+@description
+Covers burst and steady-rate admission, retry delays, lazy expiry of the
+local table, the Redis reply format, fallback to local limits on backend
+errors, and 429 from login / protected routes.
+"""
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from prometheus_client import CollectorRegistry
+
+from backend.api import auth
+from backend.utils.rate_limiter import (
+    LocalRateLimitBackend,
+    RateLimiter,
+    RateLimitExceeded,
+    RateLimitRule,
+    RedisRateLimitBackend,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _limiter(clock: _Clock, **kwargs) -> RateLimiter:
+    kwargs.setdefault("fallback", LocalRateLimitBackend(clock=clock))
+    return RateLimiter(registry=CollectorRegistry(), **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_burst_then_steady_rate():
+    clock = _Clock()
+    limiter = _limiter(clock)
+    rule = RateLimitRule("api", limit=60, period=60, burst=3)  # one per second
+
+    decisions = [await limiter.hit(rule, "10.0.0.1") for _ in range(4)]
+    assert [d.allowed for d in decisions] == [True, True, True, False]
+    assert [d.remaining for d in decisions[:3]] == [2, 1, 0]
+    assert decisions[3].retry_after == pytest.approx(1.0)
+
+    clock.now += 1.0
+    assert (await limiter.hit(rule, "10.0.0.1")).allowed
+    assert not (await limiter.hit(rule, "10.0.0.1")).allowed
+    assert (await limiter.hit(rule, "10.0.0.2")).allowed  # keys are independent
+
+
+@pytest.mark.asyncio
+async def test_check_raises_with_whole_second_retry_after():
+    clock = _Clock()
+    limiter = _limiter(clock)
+    rule = RateLimitRule("login_user", limit=10, period=60, burst=1)
+
+    await limiter.check(rule, "alice")
+    with pytest.raises(RateLimitExceeded) as exc_info:
+        await limiter.check(rule, "alice")
+    assert exc_info.value.retry_after == 6
+    assert exc_info.value.code == "RATE_LIMIT_ERROR"
+
+
+def test_local_table_expires_idle_keys_lazily():
+    clock = _Clock()
+    backend = LocalRateLimitBackend(max_keys=2, clock=clock)
+    backend.hit_nowait("a", 1.0, 1.0)
+    backend.hit_nowait("b", 1.0, 1.0)
+    clock.now += 5  # both keys idle: equivalent to fresh ones
+
+    backend.hit_nowait("c", 1.0, 1.0)
+    assert len(backend) == 1
+
+    backend.hit_nowait("d", 1.0, 1.0)
+    backend.hit_nowait("e", 1.0, 1.0)  # table full, nothing idle: oldest half goes
+    assert len(backend) == 2
+
+
+class _Script:
+    def __init__(self, reply=None, error=None) -> None:
+        self.reply, self.error, self.calls = reply, error, []
+
+    async def __call__(self, keys, args):
+        self.calls.append((keys, args))
+        if self.error:
+            raise self.error
+        return self.reply
+
+
+class _Redis:
+    def __init__(self, script: _Script) -> None:
+        self.script = script
+
+    def register_script(self, _source):
+        return self.script
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_parses_script_reply():
+    script = _Script(reply=[1, b"1000.5", b"1001.5"])
+    limiter = _limiter(_Clock(), backend=RedisRateLimitBackend(_Redis(script)))
+    rule = RateLimitRule("ip", limit=60, period=60, burst=10)
+
+    decision = await limiter.hit(rule, "10.0.0.1")
+    assert decision.allowed and decision.remaining == 9
+    assert script.calls == [(["traider:ratelimit:ip:10.0.0.1"], [1.0, 10.0])]
+
+
+@pytest.mark.asyncio
+async def test_backend_errors_fall_back_to_local_limits():
+    clock = _Clock()
+    script = _Script(error=ConnectionError("redis down"))
+    limiter = _limiter(clock, backend=RedisRateLimitBackend(_Redis(script)))
+    rule = RateLimitRule("ip", limit=2, period=60)
+
+    assert [(await limiter.hit(rule, "k")).allowed for _ in range(3)] == [True, True, False]
+    assert len(script.calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_disabled_limiter_allows_everything():
+    limiter = _limiter(_Clock(), enabled=False)
+    rule = RateLimitRule("ip", limit=1, period=60)
+    assert all([(await limiter.hit(rule, "k")).allowed for _ in range(5)])
+
+
+@pytest.mark.asyncio
+async def test_login_and_protected_routes_answer_429():
+    # The classes auth.py uses (it imports the top-level ``utils`` package)
+    limiter = auth.RateLimiter(registry=CollectorRegistry())
+    strict = auth.RateLimitRule("strict", limit=1, period=60)
+    token = auth.create_access_token({"sub": "u-1", "username": "alice", "role": "trader", "permissions": []})
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+    with patch.object(auth, "rate_limiter", limiter), patch.object(auth, "LOGIN_USER_RATE_LIMIT", strict), \
+            patch.object(auth, "USER_RATE_LIMIT", strict), patch.object(auth, "authenticate_user", return_value=None):
+        with pytest.raises(HTTPException) as first:
+            await auth.login(auth.LoginRequest(username="Alice", password="wrong"))
+        with pytest.raises(HTTPException) as second:
+            await auth.login(auth.LoginRequest(username="alice", password="wrong"))
+
+        assert (await auth.get_current_user(credentials))["user_id"] == "u-1"
+        with pytest.raises(HTTPException) as third:
+            await auth.get_current_user(credentials)
+
+    assert first.value.status_code == 401
+    assert second.value.status_code == third.value.status_code == 429
+    assert third.value.headers == {"Retry-After": "60"}
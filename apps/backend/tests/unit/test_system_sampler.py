@@ -0,0 +1,133 @@
+"""
+@fileoverview Unit tests for the background system-metrics sampler
+@module tests.unit.test_system_sampler
+
+@description
+Validates that the sampler publishes snapshots off the event loop, that
+stale or stopped snapshots are not served, and that per-thread CPU is
+reported for a busy Python thread.  Also covers how the health endpoints
+consume the samples: CPU deltas are left to a running sampler and thread
+names are escaped in the Prometheus output.
+"""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from backend.api import health
+from backend.utils.system_sampler import ProcessCpuTracker, SystemMetricsSampler
+
+
+@pytest.mark.asyncio
+async def test_sampler_publishes_and_clears_snapshot():
+    calls = []
+
+    def collect():
+        calls.append(threading.current_thread().name)
+        return {"n": len(calls)}
+
+    sampler = SystemMetricsSampler(collect, interval=0.01)
+    assert sampler.snapshot() is None
+
+    sampler.start()
+    await asyncio.sleep(0.05)
+    snapshot = sampler.snapshot()
+    await sampler.stop()
+
+    assert snapshot is not None and snapshot["n"] >= 2
+    assert threading.main_thread().name not in calls  # collected in the thread-pool
+    assert sampler.snapshot() is None and not sampler.running
+
+
+@pytest.mark.asyncio
+async def test_stale_snapshot_is_not_served():
+    sampler = SystemMetricsSampler(lambda: {"ok": True}, interval=0.01)
+    await sampler.sample_now()
+    assert sampler.snapshot() == {"ok": True}
+
+    await asyncio.sleep(0.05)  # > 3 intervals without a new sample
+    assert sampler.snapshot() is None
+
+
+@pytest.mark.asyncio
+async def test_sampler_survives_collect_errors():
+    def collect():
+        raise RuntimeError("boom")
+
+    sampler = SystemMetricsSampler(collect, interval=0.01)
+    sampler.start()
+    await asyncio.sleep(0.03)
+    assert sampler.running
+    await sampler.stop()
+
+
+def test_invalid_interval():
+    with pytest.raises(ValueError):
+        SystemMetricsSampler(dict, interval=0)
+
+
+def test_per_thread_cpu_reports_busy_thread():
+    stop = threading.Event()
+
+    def spin():
+        while not stop.is_set():
+            sum(range(1000))
+
+    worker = threading.Thread(target=spin, name="spinner", daemon=True)
+    worker.start()
+    tracker = ProcessCpuTracker()
+    try:
+        baseline = tracker.sample()
+        time.sleep(0.2)
+        sample = tracker.sample()
+    finally:
+        stop.set()
+        worker.join()
+
+    assert all(t["cpu_percent"] == 0.0 for t in baseline["threads"])
+    spinner = next(t for t in sample["threads"] if t["name"] == "spinner")
+    assert spinner["cpu_percent"] > 20.0
+    assert sample["num_threads"] >= 2 and sample["rss_mb"] > 0
+
+
+class _StaleSampler:
+    running = True
+
+    def snapshot(self):
+        return None
+
+
+def test_inline_fallback_leaves_cpu_deltas_to_running_sampler(monkeypatch):
+    def fail(*_args, **_kwargs):
+        raise AssertionError("CPU deltas taken outside the sampler")
+
+    readings = {"usage_percent": 42.0, "process": {"pid": 1, "threads": []}}
+    monkeypatch.setattr(health, "system_sampler", _StaleSampler())
+    monkeypatch.setattr(health, "_last_cpu_readings", readings)
+    monkeypatch.setattr(health.psutil, "cpu_percent", fail)
+    monkeypatch.setattr(health._process_cpu, "sample", fail)
+
+    info = health.get_system_info()
+
+    assert info["cpu"]["usage_percent"] == 42.0
+    assert info["process"] == readings["process"]
+
+
+@pytest.mark.asyncio
+async def test_thread_names_are_escaped_in_prometheus_output(monkeypatch):
+    info = health.collect_system_info()
+    info["process"] = {
+        "pid": 1,
+        "cpu_percent": 1.0,
+        "rss_mb": 1.0,
+        "num_threads": 1,
+        "threads": [{"id": 7, "name": 'odd"name\\with\nbreak', "cpu_percent": 3.0}],
+    }
+    monkeypatch.setattr(health, "get_system_info", lambda: info)
+
+    body = (await health.prometheus_metrics()).body.decode()
+
+    assert 'traider_thread_cpu_percent{thread="odd\\"name\\\\with\\nbreak",tid="7"} 3.0' in body
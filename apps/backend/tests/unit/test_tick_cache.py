@@ -0,0 +1,111 @@
+"""
+@fileoverview Unit tests for the latest-tick in-memory cache
+@module tests.unit.test_tick_cache
+
+@description
+Covers ring ordering and capacity, liveness gating, DB priming, hit-ratio
+accounting and the LISTEN/NOTIFY payload handling of `TickCacheListener`.
+No database is required.
+"""
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from services.market_data.tick_cache import (
+    TickCache,
+    TickCacheListener,
+    tick_from_notify_payload,
+)
+
+
+def _tick(second: int, price: float = 100.0, symbol: str = "BTC-USD") -> dict:
+    return {
+        "timestamp": f"2025-07-05T12:00:{second:02d}+00:00",
+        "symbol": symbol,
+        "price": price,
+        "volume": 1.0,
+    }
+
+
+@pytest.fixture
+def cache() -> TickCache:
+    c = TickCache(capacity=3)
+    c.set_live(True)
+    return c
+
+
+def test_latest_returns_newest_first(cache):
+    for second in range(3):
+        cache.add(_tick(second, price=100.0 + second))
+
+    rows = cache.latest("BTC-USD", 2)
+
+    assert [r["price"] for r in rows] == [102.0, 101.0]
+
+
+def test_capacity_bounds_ring_and_deeper_requests_miss(cache):
+    for second in range(5):
+        cache.add(_tick(second))
+
+    assert cache.stats()["symbols"] == {"BTC-USD": 3}
+    assert cache.latest("BTC-USD", 4) is None
+
+
+def test_late_tick_is_inserted_in_order(cache):
+    cache.add(_tick(1, price=1.0))
+    cache.add(_tick(3, price=3.0))
+    cache.add(_tick(2, price=2.0))
+
+    assert [r["price"] for r in cache.latest("BTC-USD", 3)] == [3.0, 2.0, 1.0]
+
+
+def test_not_live_cache_never_serves(cache):
+    cache.add(_tick(1))
+    cache.set_live(False)
+
+    assert cache.latest("BTC-USD", 1) is None
+    assert cache.stats()["symbols"] == {}
+
+
+def test_prime_merges_db_rows_without_duplicates(cache):
+    cache.add(_tick(5, price=5.0))
+    cache.prime("BTC-USD", [_tick(5, price=5.0), _tick(4, price=4.0), _tick(3, price=3.0)])
+
+    assert [r["price"] for r in cache.latest("BTC-USD", 3)] == [5.0, 4.0, 3.0]
+
+
+def test_hit_ratio_accounting(cache):
+    cache.add(_tick(1))
+    cache.latest("BTC-USD", 1)
+    cache.latest("ETH-USD", 1)
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_ratio"] == 0.5
+
+
+def test_notify_payload_normalised_to_to_dict_shape():
+    tick = tick_from_notify_payload(
+        {"id": 7, "timestamp": "2025-07-05T12:00:00.25+00:00", "symbol": "BTC-USD", "price": "30000.5", "volume": 2}
+    )
+
+    assert tick["price"] == 30000.5
+    assert tick["volume"] == 2.0
+    assert tick["bid"] is None
+    assert tick["timestamp"] == "2025-07-05T12:00:00.250000+00:00"
+    assert "id" not in tick
+
+
+def test_listener_applies_and_invalidates(cache):
+    listener = TickCacheListener(cache, "postgresql://unused")
+
+    listener.handle_notification(json.dumps(_tick(1)))
+    assert cache.latest("BTC-USD", 1) is not None
+
+    listener.handle_notification(json.dumps({"symbol": "BTC-USD", "truncated": True}))
+    assert cache.latest("BTC-USD", 1) is None
+
+    listener.handle_notification("not-json")  # ignored
@@ -0,0 +1,97 @@
+"""
+@fileoverview Unit tests for the verified-token cache
+@module tests.unit.test_token_cache
+
+@description
+Covers hits and misses, exact expiry at ``exp``, the TTL bound, the
+revocation hook, LRU eviction, disabling and the hit-rate statistics.
+"""
+from __future__ import annotations
+
+from prometheus_client import CollectorRegistry
+
+from backend.utils.token_cache import TokenVerificationCache
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_700_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _cache(**kwargs) -> TokenVerificationCache:
+    kwargs.setdefault("clock", _Clock())
+    return TokenVerificationCache(registry=CollectorRegistry(), **kwargs)
+
+
+def _payload(clock: _Clock, lifetime: float = 3600.0, **claims):
+    return {"sub": "u-1", "exp": clock.now + lifetime, **claims}
+
+
+def test_hit_after_put_and_miss_for_unknown_token():
+    clock = _Clock()
+    cache = _cache(clock=clock)
+    payload = _payload(clock)
+
+    assert cache.get("t1") is None
+    cache.put("t1", payload)
+
+    assert cache.get("t1") is payload
+    assert cache.get("t2") is None
+    assert cache.stats() | {"ttl_seconds": None} == {
+        "size": 1, "maxsize": 4096, "ttl_seconds": None, "hits": 1, "misses": 2, "hit_rate": 0.3333,
+    }
+
+
+def test_entries_expire_at_token_exp_or_ttl_whichever_is_first():
+    clock = _Clock()
+    cache = _cache(ttl=60, clock=clock)
+    cache.put("short", _payload(clock, lifetime=10))
+    cache.put("long", _payload(clock))
+
+    clock.now += 10
+    assert cache.get("short") is None
+    assert cache.get("long") is not None
+    clock.now += 50
+    assert cache.get("long") is None
+    assert len(cache) == 0
+
+    cache.put("already-expired", _payload(clock, lifetime=0))
+    assert len(cache) == 0
+
+
+def test_revocation_hook_and_discard():
+    clock = _Clock()
+    revoked = set()
+    cache = _cache(clock=clock, is_revoked=lambda payload: payload.get("jti") in revoked)
+    cache.put("a", _payload(clock, jti="a"))
+    cache.put("b", _payload(clock, jti="b"))
+
+    revoked.add("a")
+    assert cache.get("a") is None
+    cache.discard("b")
+    assert cache.get("b") is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    clock = _Clock()
+    cache = _cache(maxsize=2, clock=clock)
+    cache.put("a", _payload(clock))
+    cache.put("b", _payload(clock))
+    cache.get("a")
+    cache.put("c", _payload(clock))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+
+
+def test_zero_size_disables_caching():
+    clock = _Clock()
+    cache = _cache(maxsize=0, clock=clock)
+    cache.put("a", _payload(clock))
+
+    assert not cache.enabled
+    assert cache.get("a") is None and len(cache) == 0
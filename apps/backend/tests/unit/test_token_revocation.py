@@ -0,0 +1,140 @@
+"""
+@fileoverview Unit tests for the token revocation index
+@module tests.unit.test_token_revocation
+
+@description
+Covers revocation until expiry, merging table snapshots, purging, NOTIFY
+payloads, logout ending a session on both the cached and the uncached
+path, and the revocation being written to ``revoked_tokens`` for the other
+workers.
+"""
+from __future__ import annotations
+
+import sys
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from prometheus_client import CollectorRegistry
+
+from backend.api import auth
+from backend.utils.token_revocation import TokenRevocationIndex, TokenRevocationListener
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_700_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _Pool:
+    """Stands in for the asyncpg pool behind ``database.get_raw_connection``."""
+
+    def __init__(self, conn) -> None:
+        self.conn = conn
+
+    def acquire(self):
+        @asynccontextmanager
+        async def _acquire():
+            yield self.conn
+
+        return _acquire()
+
+
+def _index(**kwargs) -> TokenRevocationIndex:
+    kwargs.setdefault("clock", _Clock())
+    return TokenRevocationIndex(registry=CollectorRegistry(), **kwargs)
+
+
+def test_revoked_until_expiry_then_purged():
+    clock = _Clock()
+    index = _index(clock=clock, purge_interval=30)
+    index.revoke("a", clock.now + 60)
+    index.revoke("old", clock.now - 1)  # already expired: ignored
+
+    assert index.is_revoked("a")
+    assert not index.is_revoked("b") and not index.is_revoked(None)
+    assert len(index) == 1
+
+    clock.now += 61
+    index.revoke("c", clock.now + 60)  # past purge_interval: "a" is dropped
+    assert not index.is_revoked("a") and index.is_revoked("c")
+    assert len(index) == 1
+
+
+def test_merge_keeps_local_revocations_and_skips_expired_rows():
+    clock = _Clock()
+    index = _index(clock=clock)
+    index.revoke("local", clock.now + 60)
+
+    index.merge([("row", clock.now + 60), ("stale", clock.now - 5), ("local", clock.now + 30)])
+    assert index.is_revoked("local") and index.is_revoked("row")
+    assert not index.is_revoked("stale")
+
+    clock.now += 61
+    index.purge()
+    assert len(index) == 0
+
+
+def test_notifications_revoke_tokens():
+    clock = _Clock()
+    index = _index(clock=clock)
+    listener = TokenRevocationListener(index, "postgresql://unused")
+
+    listener.handle_notification(f'{{"jti": "n1", "exp": {clock.now + 60}}}')
+    listener.handle_notification("not json")
+    assert index.is_revoked("n1") and len(index) == 1
+
+
+@pytest.mark.asyncio
+async def test_logout_revokes_the_token_on_cached_and_uncached_paths(monkeypatch):
+    monkeypatch.delenv("DATABASE_URL", raising=False)
+    # The classes auth.py uses (it imports the top-level ``utils`` package)
+    index = auth.TokenRevocationIndex(registry=CollectorRegistry())
+    cache = auth.TokenVerificationCache(
+        registry=CollectorRegistry(), is_revoked=lambda payload: index.is_revoked(payload.get("jti"))
+    )
+    token = auth.create_access_token({"sub": "u-1", "username": "alice", "role": "trader", "permissions": []})
+    other = auth.create_access_token({"sub": "u-1", "username": "alice", "role": "trader", "permissions": []})
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+    with patch.object(auth, "revocation_index", index), patch.object(auth, "token_cache", cache):
+        user = await auth.get_current_user(credentials)  # now cached
+        assert user["token_id"] and len(cache) == 1
+
+        response = await auth.logout(user)
+        assert response.status_code == 200
+
+        for _ in range(2):  # cached entry dropped, then rejected after verification
+            with pytest.raises(HTTPException) as exc_info:
+                await auth.get_current_user(credentials)
+            assert exc_info.value.status_code == 401
+            assert exc_info.value.detail == "Token has been revoked"
+
+        # Other sessions of the same user are unaffected
+        other_user = await auth.get_current_user(HTTPAuthorizationCredentials(scheme="Bearer", credentials=other))
+        assert other_user["user_id"] == "u-1"
+
+
+@pytest.mark.asyncio
+async def test_revoke_token_inserts_into_revoked_tokens(monkeypatch):
+    # auth.py imports ``database`` as a top-level module
+    database = sys.modules.get("database") or pytest.importorskip("database")
+    conn = type("Conn", (), {"execute": AsyncMock()})()
+    monkeypatch.setattr(database, "connection_pool", _Pool(conn))
+    monkeypatch.setenv("DATABASE_URL", "postgresql://traider@localhost/traider")
+    index = auth.TokenRevocationIndex(registry=CollectorRegistry())
+
+    with patch.object(auth, "revocation_index", index), patch.object(auth, "logger") as logger:
+        await auth.revoke_token("jti-1", 4_000_000_000.0)
+
+    assert index.is_revoked("jti-1")
+    conn.execute.assert_awaited_once()
+    sql, *args = conn.execute.await_args.args
+    assert sql.startswith("INSERT INTO revoked_tokens")
+    assert args == ["jti-1", 4_000_000_000.0]
+    logger.error.assert_not_called()
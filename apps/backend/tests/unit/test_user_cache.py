@@ -0,0 +1,143 @@
+"""
+@fileoverview Unit tests for the authentication user-record cache
+@module tests.unit.test_user_cache
+
+@description
+Covers positive and negative entries with their TTLs, invalidation,
+LRU eviction, NOTIFY payload handling and `authenticate_user` reaching
+the database only on cache misses.
+"""
+from __future__ import annotations
+
+import sys
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from prometheus_client import CollectorRegistry
+
+from backend.api import auth
+from backend.utils.user_cache import MISSING, UserCacheListener, UserRecordCache
+
+
+class _Pool:
+    """Stands in for the asyncpg pool behind ``database.get_raw_connection``."""
+
+    def __init__(self, conn) -> None:
+        self.conn = conn
+        self.acquired = 0
+
+    def acquire(self):
+        @asynccontextmanager
+        async def _acquire():
+            self.acquired += 1
+            yield self.conn
+
+        return _acquire()
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _cache(**kwargs) -> UserRecordCache:
+    kwargs.setdefault("clock", _Clock())
+    return UserRecordCache(registry=CollectorRegistry(), **kwargs)
+
+
+ROW = {"id": 7, "username": "alice", "password_hash": "$2b$hash", "role": "trader", "is_active": True}
+
+
+def test_positive_and_negative_entries_use_their_own_ttl():
+    clock = _Clock()
+    cache = _cache(ttl=30, negative_ttl=5, clock=clock)
+
+    assert cache.get("alice") is MISSING
+    cache.put("alice", ROW)
+    cache.put("mallory", None)
+    assert cache.get("alice") is ROW
+    assert cache.get("mallory") is None
+
+    clock.now += 5
+    assert cache.get("mallory") is MISSING
+    assert cache.get("alice") is ROW
+    clock.now += 25
+    assert cache.get("alice") is MISSING
+    assert cache.stats() | {"ttl_seconds": None} == {
+        "size": 0, "negative": 0, "maxsize": 10000, "ttl_seconds": None, "negative_ttl_seconds": 5,
+        "hits": 3, "misses": 3, "hit_rate": 0.5,
+    }
+
+
+def test_invalidate_and_lru_eviction():
+    cache = _cache(maxsize=2)
+    cache.put("a", ROW)
+    cache.put("b", None)
+    cache.get("a")
+    cache.put("c", ROW)  # evicts "b", the least recently used
+
+    assert cache.get("b") is MISSING
+    cache.invalidate("a")
+    assert cache.get("a") is MISSING
+    assert len(cache) == 1
+
+
+def test_zero_ttls_disable_caching():
+    cache = _cache(ttl=0, negative_ttl=0)
+    cache.put("alice", ROW)
+    assert not cache.enabled
+    assert cache.get("alice") is MISSING and len(cache) == 0
+
+
+def test_notifications_invalidate_listed_usernames():
+    cache = _cache()
+    for name in ("old", "new", "other"):
+        cache.put(name, ROW)
+    listener = UserCacheListener(cache, "postgresql://unused")
+
+    listener.handle_notification('{"usernames": ["old", "new"]}')
+    assert cache.get("old") is MISSING and cache.get("new") is MISSING
+    assert cache.get("other") is ROW
+
+    listener.handle_notification("not json")
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_authenticate_user_queries_database_only_on_misses(monkeypatch):
+    # auth.py imports ``database`` as a top-level module
+    database = sys.modules.get("database") or pytest.importorskip("database")
+    rows = {"alice": ROW}
+    fetchrow = AsyncMock(side_effect=lambda _sql, name: rows.get(name))
+    pool = _Pool(type("Conn", (), {"fetchrow": fetchrow})())
+
+    monkeypatch.setenv("DATABASE_URL", "postgresql://traider@localhost/traider")
+    # The real get_raw_connection runs against the fake pool
+    monkeypatch.setattr(database, "connection_pool", pool)
+    verify = AsyncMock(return_value=True)
+
+    # The cache class auth.py uses (it imports the top-level ``utils`` package)
+    cache = auth.UserRecordCache(registry=CollectorRegistry())
+    with patch.object(auth, "user_cache", cache), patch.object(auth, "verify_password_async", verify):
+        user = await auth.authenticate_user("alice", "secret")
+        assert user["user_id"] == "7" and user["role"] == "trader"
+        assert fetchrow.await_count == 1 and pool.acquired == 1
+        assert cache.get("alice") == ROW  # filled from the database row
+
+        for _ in range(2):
+            user = await auth.authenticate_user("alice", "secret")
+            assert user["user_id"] == "7" and user["role"] == "trader"
+        assert fetchrow.await_count == 1 and pool.acquired == 1
+
+        for _ in range(3):
+            assert await auth.authenticate_user("nobody", "secret") is None
+        assert fetchrow.await_count == 2
+        assert verify.await_count == 3  # the password is still checked every time
+
+        auth.invalidate_user("alice")
+        await auth.authenticate_user("alice", "secret")
+        assert fetchrow.await_count == 3
@@ -0,0 +1,76 @@
+import logging
+from typing import Any, BinaryIO, Callable, Collection, Dict, Iterator, List, NamedTuple, Optional
+
+__all__ = [
+    "BinaryLogError",
+    "BinaryLogFile",
+    "BinaryLogHandler",
+    "BinaryRecord",
+    "StdlibEventLogger",
+    "StdlibRoutingLoggerFactory",
+    "SCHEMA_JSON_EVENT",
+    "SCHEMAS",
+    "archive_segment",
+    "read_index",
+    "read_records",
+    "render_unless_routed",
+    "zstd_available",
+]
+
+SCHEMA_JSON_EVENT: int
+SCHEMAS: Dict[int, str]
+SEGMENT_MAGIC: bytes
+ARCHIVE_MAGIC: bytes
+FOOTER_MAGIC: bytes
+DEFAULT_BLOCK_SIZE: int
+
+class BinaryLogError(ValueError): ...
+
+class BinaryRecord(NamedTuple):
+    timestamp: float
+    correlation_id: str
+    schema_id: int
+    payload: bytes
+    def decode(self) -> Any: ...
+
+def zstd_available() -> bool: ...
+
+class BinaryLogFile:
+    path: str
+    max_bytes: int
+    backup_count: int
+    block_size: int
+    codec: str
+    def __init__(self, path: str, max_bytes: int = ..., backup_count: int = ..., block_size: int = ...,
+                 compress: bool = ..., clock: Callable[[], float] = ...) -> None: ...
+    def append(self, timestamp: float, correlation_id: Optional[str], payload: bytes, schema_id: int = ...) -> None: ...
+    def rotate(self) -> Optional[str]: ...
+    def archives(self) -> List[str]: ...
+    def close(self) -> None: ...
+
+def archive_segment(src: str, dest: str, codec: str = ..., block_size: int = ...) -> Dict[str, Any]: ...
+
+def read_index(path: str) -> Dict[str, Any]: ...
+
+def read_records(
+    path: str,
+    since: Optional[float] = ...,
+    until: Optional[float] = ...,
+    correlation_id: Optional[str] = ...,
+    stats: Optional[Dict[str, int]] = ...,
+) -> Iterator[BinaryRecord]: ...
+
+class BinaryLogHandler(logging.Handler):
+    file: BinaryLogFile
+    def __init__(self, filename: str, max_bytes: int = ..., backup_count: int = ..., block_size: int = ...,
+                 compress: bool = ..., level: int = ...) -> None: ...
+
+class StdlibEventLogger:
+    def __init__(self, logger: logging.Logger) -> None: ...
+    def msg(self, event: Any) -> None: ...
+
+class StdlibRoutingLoggerFactory:
+    def __init__(self, default: Callable[..., Any], routed: Collection[str]) -> None: ...
+    def __call__(self, *args: Any) -> Any: ...
+
+def render_unless_routed(renderer: Callable[..., Any]) -> Callable[..., Any]: ...
@@ -0,0 +1,179 @@
+"""
+@fileoverview Shared, scheduled dependency health state
+@module backend.utils.health_state
+
+@description
+Readiness probes, dashboards and Prometheus scrapes all ask the same
+question ("is the database reachable?") many times a second.  Running a
+round trip per request multiplies load on the very dependency being
+probed.  `DependencyHealth` keeps one result per registered check:
+
+- a background task refreshes every check on a fixed cadence
+- readers are served the cached result while it is younger than
+  `max_staleness`
+- a stale or missing result is refreshed on demand with single-flight
+  coalescing: concurrent callers await the same in-flight check
+
+Cached results are only served while the scheduler is running; a stopped
+instance still coalesces concurrent callers but always checks afresh.
+
+@performance
+- Cached read: O(1), no I/O
+- Dependency load: one check per interval regardless of probe volume
+
+@risk
+- Failure impact: LOW - probes fall back to on-demand checks
+- Recovery strategy: failed checks are not cached; next caller retries
+
+@since 1.0.0-alpha
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from utils.logging import get_logger
+
+__all__ = [
+    "DependencyHealth",
+]
+
+logger = get_logger(__name__)
+
+HealthCheck = Callable[[], Awaitable[Dict[str, Any]]]
+
+
+class _Entry:
+    __slots__ = ("check", "result", "checked_at", "inflight")
+
+    def __init__(self, check: HealthCheck) -> None:
+        self.check = check
+        self.result: Optional[Dict[str, Any]] = None
+        self.checked_at = 0.0
+        self.inflight: Optional[asyncio.Future] = None
+
+
+class DependencyHealth:
+    """
+    Scheduled, single-flight cache for async dependency health checks.
+
+    @tradingImpact LOW - Drives readiness and monitoring only
+    @riskLevel LOW - Read-only dependency checks
+    """
+
+    def __init__(self, interval: float = 5.0, max_staleness: float = 15.0) -> None:
+        if interval <= 0 or max_staleness <= 0:
+            raise ValueError("interval and max_staleness must be > 0")
+        self.interval = interval
+        self.max_staleness = max_staleness
+        self._entries: Dict[str, _Entry] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._stop_event: Optional[asyncio.Event] = None
+        self.checks_run = 0
+        self.coalesced = 0
+
+    # ------------------------------------------------------------------
+    # Registration / lifecycle
+    # ------------------------------------------------------------------
+
+    def register(self, name: str, check: HealthCheck) -> None:
+        """Register *check* under *name* (replaces any previous check)."""
+        self._entries[name] = _Entry(check)
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if self.running:
+            raise RuntimeError("DependencyHealth already running")
+
+        # Checks hit live dependencies – same short-circuit as database.create_connection_pool
+        if "pytest" in sys.modules and os.getenv("TRAIDER_ALLOW_DB_IN_TESTS", "0") != "1":
+            logger.debug("🧪 Skipping scheduled dependency health checks during test execution")
+            return
+
+        self._stop_event = asyncio.Event()  # bound to the running loop
+        self._task = asyncio.create_task(self._run(), name="dependency-health")
+
+    async def stop(self) -> None:
+        if self._stop_event is not None:
+            self._stop_event.set()
+        if self._task:
+            await self._task
+            self._task = None
+        self.invalidate()
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """Drop cached results (all, or just *name*)."""
+        for key, entry in self._entries.items():
+            if name is None or key == name:
+                entry.result = None
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def age(self, name: str) -> Optional[float]:
+        """Seconds since *name* was last checked successfully, or None."""
+        entry = self._entries[name]
+        return time.monotonic() - entry.checked_at if entry.result is not None else None
+
+    async def get(self, name: str) -> Dict[str, Any]:
+        """
+        Health result for *name*.
+
+        @param name Registered check name
+        @returns Cached result if fresh, otherwise a (coalesced) new check
+        @throws KeyError for unknown names; re-raises check exceptions
+        @performance O(1) when cached
+        @sideEffects May run the dependency check
+        """
+
+        entry = self._entries[name]
+        if (
+            self.running
+            and entry.result is not None
+            and time.monotonic() - entry.checked_at <= self.max_staleness
+        ):
+            return entry.result
+        return await self._refresh(entry)
+
+    async def _refresh(self, entry: _Entry) -> Dict[str, Any]:
+        if entry.inflight is not None and not entry.inflight.done():
+            self.coalesced += 1
+            return await asyncio.shield(entry.inflight)
+        entry.inflight = asyncio.ensure_future(self._execute(entry))
+        return await asyncio.shield(entry.inflight)
+
+    async def _execute(self, entry: _Entry) -> Dict[str, Any]:
+        self.checks_run += 1
+        try:
+            result = await entry.check()
+        except BaseException:
+            entry.result = None
+            raise
+        entry.result = result
+        entry.checked_at = time.monotonic()
+        return result
+
+    # ------------------------------------------------------------------
+    # Scheduler
+    # ------------------------------------------------------------------
+
+    async def _run(self) -> None:
+        assert self._stop_event is not None
+        while not self._stop_event.is_set():
+            for name, entry in list(self._entries.items()):
+                try:
+                    await self._refresh(entry)
+                except Exception as exc:  # noqa: BLE001 – keep scheduling
+                    logger.warning(f"Dependency health check '{name}' failed: {exc}")
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
@@ -0,0 +1,22 @@
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+__all__ = [
+    "DependencyHealth",
+]
+
+HealthCheck = Callable[[], Awaitable[Dict[str, Any]]]
+
+class DependencyHealth:
+    interval: float
+    max_staleness: float
+    checks_run: int
+    coalesced: int
+    def __init__(self, interval: float = ..., max_staleness: float = ...) -> None: ...
+    def register(self, name: str, check: HealthCheck) -> None: ...
+    @property
+    def running(self) -> bool: ...
+    def start(self) -> None: ...
+    async def stop(self) -> None: ...
+    def invalidate(self, name: Optional[str] = ...) -> None: ...
+    def age(self, name: str) -> Optional[float]: ...
+    async def get(self, name: str) -> Dict[str, Any]: ...
@@ -8,8 +8,20 @@ success/failure, and emit Prometheus/OpenTelemetry metrics via the shared
 `MetricsCollector`. Designed to be applied to service-boundary functions (e.g.
 order executors, market-data processors) and FastAPI route handlers.
 
+Everything that can be decided once is decided at decoration time or on the
+first recorded call:
+
+- coroutine functions get a native ``async def`` wrapper (no per-call
+  closure or ``isinstance`` check on the result)
+- Prometheus label children are resolved once and cached, so a call costs
+  two ``perf_counter()`` reads and one ``observe()``
+- ``sample_rate`` records latency for every N-th call only; failures are
+  always counted
+
 @performance
-- <50µs overhead per call (timer + label lookup)
+- ~2µs overhead per recorded call (mostly `Histogram.observe`), ~0.4µs
+  per sampled-out call; the previous per-call label lookup cost ~6µs
+  (see scripts/bench_instrument.py)
 
 @risk
 - Failure impact: LOW — metrics only
@@ -17,14 +29,19 @@ order executors, market-data processors) and FastAPI route handlers.
 @since 1.0.0-alpha
 """
 
+import inspect
 from functools import wraps
 from time import perf_counter
-from typing import Any, Callable, Coroutine, TypeVar, Union, overload, Awaitable
+from typing import Any, Callable, Dict, Optional, TypeVar, Union, overload
 
 from .monitoring import get_metrics_collector
 
 F = TypeVar("F", bound=Callable[..., Any])
 
+__all__ = [
+    "instrument",
+]
+
 
 def _get_default_labels(func: Callable[..., Any]) -> dict[str, str]:
     """Generate default Prometheus labels from function metadata."""
@@ -33,17 +50,42 @@ def _get_default_labels(func: Callable[..., Any]) -> dict[str, str]:
     return {"module": module, "function": name}
 
 
+class _Bound:
+    """Label children for one decorated function, resolved once."""
+
+    __slots__ = ("ok", "failed", "error_count", "function", "_errors")
+
+    def __init__(self, metrics: Any, method: str, function: str) -> None:
+        self.ok = metrics.request_duration.labels(method, function, "200")
+        self.failed = metrics.request_duration.labels(method, function, "500")
+        self.error_count = metrics.error_count
+        self.function = function
+        self._errors: Dict[type, Any] = {}
+
+    def error(self, exc: BaseException) -> None:
+        child = self._errors.get(type(exc))
+        if child is None:
+            child = self._errors[type(exc)] = self.error_count.labels(type(exc).__name__, self.function)
+        child.inc()
+
+
+def _bind(method: str, function: str) -> Optional[_Bound]:
+    # The collector may be initialised after decoration (module import)
+    metrics = get_metrics_collector()
+    return _Bound(metrics, method, function) if metrics is not None else None
+
+
 @overload
 def instrument(func: F) -> F:  # Decorator used without arguments
     ...
 
 
 @overload
-def instrument(**labels: str) -> Callable[[F], F]:  # Decorator with custom labels
+def instrument(*, sample_rate: float = 1.0, **labels: str) -> Callable[[F], F]:  # Decorator with options
     ...
 
 
-def instrument(func: Union[F, None] = None, **custom_labels: str):  # type: ignore[override]
+def instrument(func: Union[F, None] = None, *, sample_rate: float = 1.0, **custom_labels: str):  # type: ignore[override]
     """Decorator that records latency and success/failure metrics.
 
     Example
@@ -56,48 +98,82 @@ def instrument(func: Union[F, None] = None, **custom_labels: str):  # type: igno
     @instrument(operation="order_execute", venue="coinbase")
     def place_order(...):
         ...
+
+    @instrument(sample_rate=0.01)      # hot path: time 1 call in 100
+    def on_tick(tick):
+        ...
     ```
+
+    ``sample_rate`` must be in (0, 1]; it is rounded to "every N-th call".
+    A ``function`` label overrides the endpoint label (default: the function
+    name).  Sync functions that merely *return* an awaitable are timed up to
+    the return, not to completion.
     """
 
+    if not 0.0 < sample_rate <= 1.0:
+        raise ValueError("sample_rate must be in (0, 1]")
+    every = max(1, round(1.0 / sample_rate))
+
     def decorator(fn: F) -> F:  # type: ignore[override]
-        metrics = get_metrics_collector()
         labels = _get_default_labels(fn)
         labels.update(custom_labels)
+        is_async = inspect.iscoroutinefunction(fn)
+        method = "ASYNC" if is_async else "SYNC"
+        function = labels["function"]
+        calls = 0
+        bound: Optional[_Bound] = None
+
+        if is_async:
+            @wraps(fn)
+            async def async_wrapper(*args: Any, **kwargs: Any):
+                nonlocal calls, bound
+                calls += 1
+                if bound is None:
+                    bound = _bind(method, function)
+                    if bound is None:
+                        return await fn(*args, **kwargs)
+                if calls % every:
+                    try:
+                        return await fn(*args, **kwargs)
+                    except Exception as exc:
+                        bound.error(exc)
+                        raise
+                start = perf_counter()
+                try:
+                    result = await fn(*args, **kwargs)
+                except Exception as exc:
+                    bound.failed.observe(perf_counter() - start)
+                    bound.error(exc)
+                    raise
+                bound.ok.observe(perf_counter() - start)
+                return result
+
+            return async_wrapper  # type: ignore
 
         @wraps(fn)
         def sync_wrapper(*args: Any, **kwargs: Any):
+            nonlocal calls, bound
+            calls += 1
+            if bound is None:
+                bound = _bind(method, function)
+                if bound is None:
+                    return fn(*args, **kwargs)
+            if calls % every:
+                try:
+                    return fn(*args, **kwargs)
+                except Exception as exc:
+                    bound.error(exc)
+                    raise
             start = perf_counter()
             try:
                 result = fn(*args, **kwargs)
-                # Handle coroutine functions transparently
-                if isinstance(result, Coroutine):  # type: ignore
-                    async def _async_handler(coro: Awaitable[Any]):
-                        try:
-                            value = await coro
-                            return value
-                        finally:
-                            duration = perf_counter() - start
-                            if metrics:
-                                metrics.request_duration.labels(
-                                    "ASYNC", labels.get("function", "unknown"), 200
-                                ).observe(duration)
-                    return _async_handler(result)  # type: ignore
-                return result
-            except Exception as exc:  # pylint: disable=broad-except
-                duration = perf_counter() - start
-                if metrics:
-                    metrics.error_count.labels(type(exc).__name__, labels.get("function", "unknown")).inc()
-                    metrics.request_duration.labels(
-                        "SYNC", labels.get("function", "unknown"), 500
-                    ).observe(duration)
+            except Exception as exc:
+                bound.failed.observe(perf_counter() - start)
+                bound.error(exc)
                 raise
-            finally:
-                if not isinstance(result, Coroutine):  # type: ignore
-                    duration = perf_counter() - start
-                    if metrics:
-                        metrics.request_duration.labels(
-                            "SYNC", labels.get("function", "unknown"), 200
-                        ).observe(duration)
+            bound.ok.observe(perf_counter() - start)
+            return result
+
         return sync_wrapper  # type: ignore
 
     # If decorator used without parentheses: @instrument
@@ -106,11 +182,3 @@ def instrument(func: Union[F, None] = None, **custom_labels: str):  # type: igno
 
     # If decorator used with params: @instrument(operation="x")
     return decorator  # type: ignore
-
-
-# Example usage removed to keep library importable without syntax errors.
-
-# @instrument(operation="order_execute", venue="coinbase")
-# def place_order(...):
-#     # Implementation of place_order function
-#     pass 
\ No newline at end of file
@@ -1,8 +1,12 @@
-from typing import Any, Dict, Callable
+from typing import Any, Callable, TypeVar, overload
 
 __all__ = [
     "instrument",
 ]
 
+F = TypeVar("F", bound=Callable[..., Any])
 
-def instrument(func: Callable[..., Any]) -> Callable[..., Any]: ... 
\ No newline at end of file
+@overload
+def instrument(func: F) -> F: ...
+@overload
+def instrument(*, sample_rate: float = ..., **labels: str) -> Callable[[F], F]: ...
@@ -0,0 +1,249 @@
+"""
+@fileoverview Sampling and rate limiting for high-volume log lines
+@module backend.utils.log_sampling
+
+@description
+Request logging emits two lines per request; at thousands of requests per
+second – most of them health probes and market-data polls – that is a lot
+of CPU, disk and shipping cost for little information.  `LogSampler`
+decides per (event, route) whether a line is written:
+
+- **sampling**: a route rate (longest matching path prefix) times an event
+  rate, applied as "every N-th line" like `@instrument(sample_rate=...)`
+- **rate limiting**: an optional token bucket per (event, route) caps
+  bursts that sampling alone would let through
+- **summaries**: suppressed lines are counted and reported once per
+  `summary_interval` so volume stays visible
+
+Callers keep errors, slow requests and audit events by not asking the
+sampler at all (or with ``force=True``).
+
+Configuration (env, see `LogSampler.from_env`):
+
+- ``LOG_SAMPLE_RATE``            default rate, e.g. ``1.0``
+- ``LOG_SAMPLE_ROUTES``          ``/api/v1/health=0.01,/api/v1/market-data=0.1``
+- ``LOG_SAMPLE_EVENTS``          ``Request started=0``
+- ``LOG_RATE_LIMIT_PER_SEC``     lines/s per (event, route); 0 = unlimited
+- ``LOG_RATE_LIMIT_BURST``       bucket size (default 2 × rate)
+- ``LOG_SUPPRESSED_SUMMARY_SEC`` summary interval (default 60)
+
+@performance
+- allow(): ~1 µs – cached prefix lookup, one counter, one bucket refill
+
+@risk
+- Failure impact: LOW - Fewer informational log lines
+- Recovery strategy: Defaults keep every line; unset the env vars
+
+@since 1.0.0-alpha
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from prometheus_client import CollectorRegistry, Counter
+from prometheus_client.core import REGISTRY
+
+__all__ = [
+    "LogSampler",
+    "parse_rates",
+]
+
+_PATH_CACHE_MAX = 1024
+
+
+def parse_rates(spec: str) -> Dict[str, float]:
+    """Parse ``name=rate,name=rate`` (rates in [0, 1])."""
+
+    rates: Dict[str, float] = {}
+    for part in spec.split(","):
+        if not part.strip():
+            continue
+        name, sep, value = part.rpartition("=")
+        if not sep or not name.strip():
+            raise ValueError(f"invalid sampling entry {part!r}; expected name=rate")
+        rate = float(value)
+        if not 0.0 <= rate <= 1.0:
+            raise ValueError(f"sampling rate for {name.strip()!r} must be in [0, 1]")
+        rates[name.strip()] = rate
+    return rates
+
+
+class _Bucket:
+    __slots__ = ("tokens", "updated")
+
+    def __init__(self, tokens: float, now: float) -> None:
+        self.tokens = tokens
+        self.updated = now
+
+
+class LogSampler:
+    """
+    Per (event, route) sampling, token-bucket limiting and suppressed counts.
+
+    @description
+    Not thread-safe: use it from the event loop (request middleware).
+
+    @tradingImpact LOW - Affects informational logging only
+    @riskLevel LOW - Errors and audit events bypass it
+    """
+
+    def __init__(
+        self,
+        default_rate: float = 1.0,
+        route_rates: Optional[Mapping[str, float]] = None,
+        event_rates: Optional[Mapping[str, float]] = None,
+        rate_limit: float = 0.0,
+        burst: Optional[float] = None,
+        summary_interval: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+        registry: CollectorRegistry = REGISTRY,
+    ) -> None:
+        for rate in (default_rate, *(route_rates or {}).values(), *(event_rates or {}).values()):
+            if not 0.0 <= rate <= 1.0:
+                raise ValueError("sampling rates must be in [0, 1]")
+        if rate_limit < 0:
+            raise ValueError("rate_limit must be >= 0")
+        self.default_rate = default_rate
+        # Longest prefix first so /api/v1/health/live beats /api/v1
+        self.route_rates = dict(sorted((route_rates or {}).items(), key=lambda kv: len(kv[0]), reverse=True))
+        self.event_rates = dict(event_rates or {})
+        self.rate_limit = rate_limit
+        self.burst = burst if burst is not None else max(1.0, 2 * rate_limit)
+        self.summary_interval = summary_interval
+        self._clock = clock
+
+        self._routes: Dict[str, Tuple[str, float]] = {}
+        self._every: Dict[Tuple[str, str], int] = {}
+        self._calls: Dict[Tuple[str, str], int] = {}
+        self._buckets: Dict[Tuple[str, str], _Bucket] = {}
+        self._suppressed: Dict[Tuple[str, str], List[int]] = {}  # [sampled_out, rate_limited]
+        self._last_summary = clock()
+
+        self._suppressed_total = Counter(
+            "traider_log_lines_suppressed_total",
+            "Log lines suppressed by sampling or rate limiting",
+            ["event", "route", "reason"],
+            registry=registry,
+        )
+
+    @classmethod
+    def from_env(cls, environ: Mapping[str, str] = os.environ, **kwargs: Any) -> "LogSampler":
+        """Build a sampler from the ``LOG_SAMPLE_*`` / ``LOG_RATE_LIMIT_*`` variables."""
+
+        burst = environ.get("LOG_RATE_LIMIT_BURST")
+        return cls(
+            default_rate=float(environ.get("LOG_SAMPLE_RATE", "1.0")),
+            route_rates=parse_rates(environ.get("LOG_SAMPLE_ROUTES", "")),
+            event_rates=parse_rates(environ.get("LOG_SAMPLE_EVENTS", "")),
+            rate_limit=float(environ.get("LOG_RATE_LIMIT_PER_SEC", "0")),
+            burst=float(burst) if burst else None,
+            summary_interval=float(environ.get("LOG_SUPPRESSED_SUMMARY_SEC", "60")),
+            **kwargs,
+        )
+
+    @property
+    def active(self) -> bool:
+        """False when every line is kept (nothing configured)."""
+        return bool(self.default_rate < 1.0 or self.route_rates or self.event_rates or self.rate_limit)
+
+    # ------------------------------------------------------------------
+    # Decision
+    # ------------------------------------------------------------------
+
+    def _route(self, path: str) -> Tuple[str, float]:
+        entry = self._routes.get(path)
+        if entry is None:
+            entry = ("*", self.default_rate)
+            for prefix, rate in self.route_rates.items():
+                if path.startswith(prefix):
+                    entry = (prefix, rate)
+                    break
+            if len(self._routes) >= _PATH_CACHE_MAX:
+                self._routes.clear()  # paths with ids in them; keep the cache bounded
+            self._routes[path] = entry
+        return entry
+
+    def allow(self, event: str, path: str = "", force: bool = False) -> bool:
+        """
+        Decide whether to emit one *event* line for request *path*.
+
+        @param event Log event name, e.g. ``Request completed``
+        @param path Request path (matched by prefix against route rates)
+        @param force Always emit (errors, audit); still not counted as suppressed
+        @returns True if the line should be written
+        @performance O(1) amortised
+        @sideEffects Advances counters / token buckets; counts suppressions
+        """
+
+        if force:
+            return True
+        route, route_rate = self._route(path)
+        key = (event, route)
+
+        every = self._every.get(key)
+        if every is None:
+            rate = route_rate * self.event_rates.get(event, 1.0)
+            every = self._every[key] = round(1.0 / rate) if rate > 0 else 0
+        if every != 1:
+            calls = self._calls[key] = self._calls.get(key, 0) + 1
+            if not every or calls % every:
+                self._suppress(key, 0)
+                return False
+
+        if self.rate_limit:
+            now = self._clock()
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = _Bucket(self.burst, now)
+            else:
+                bucket.tokens = min(self.burst, bucket.tokens + (now - bucket.updated) * self.rate_limit)
+                bucket.updated = now
+            if bucket.tokens < 1.0:
+                self._suppress(key, 1)
+                return False
+            bucket.tokens -= 1.0
+        return True
+
+    def _suppress(self, key: Tuple[str, str], reason: int) -> None:
+        counts = self._suppressed.get(key)
+        if counts is None:
+            counts = self._suppressed[key] = [0, 0]
+        counts[reason] += 1
+
+    # ------------------------------------------------------------------
+    # Summaries
+    # ------------------------------------------------------------------
+
+    def summaries(self, force: bool = False) -> List[Dict[str, Any]]:
+        """
+        Suppressed-line counts since the last summary, once per interval.
+
+        @param force Return the counts now regardless of the interval
+        @returns One dict per (event, route) with suppressions; empty
+            between intervals
+        @sideEffects Resets the counts and updates the Prometheus counter
+        """
+
+        now = self._clock()
+        if not force and now - self._last_summary < self.summary_interval:
+            return []
+        elapsed = now - self._last_summary
+        self._last_summary = now
+        result = []
+        for (event, route), (sampled_out, rate_limited) in self._suppressed.items():
+            if sampled_out:
+                self._suppressed_total.labels(event, route, "sampled").inc(sampled_out)
+            if rate_limited:
+                self._suppressed_total.labels(event, route, "rate_limited").inc(rate_limited)
+            result.append({
+                "log_event": event,
+                "route": route,
+                "sampled_out": sampled_out,
+                "rate_limited": rate_limited,
+                "interval_seconds": round(elapsed, 1),
+            })
+        self._suppressed.clear()
+        return result
@@ -0,0 +1,35 @@
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+from prometheus_client import CollectorRegistry
+
+__all__ = [
+    "LogSampler",
+    "parse_rates",
+]
+
+def parse_rates(spec: str) -> Dict[str, float]: ...
+
+class LogSampler:
+    default_rate: float
+    route_rates: Dict[str, float]
+    event_rates: Dict[str, float]
+    rate_limit: float
+    burst: float
+    summary_interval: float
+    def __init__(
+        self,
+        default_rate: float = ...,
+        route_rates: Optional[Mapping[str, float]] = ...,
+        event_rates: Optional[Mapping[str, float]] = ...,
+        rate_limit: float = ...,
+        burst: Optional[float] = ...,
+        summary_interval: float = ...,
+        clock: Callable[[], float] = ...,
+        registry: CollectorRegistry = ...,
+    ) -> None: ...
+    @classmethod
+    def from_env(cls, environ: Mapping[str, str] = ..., **kwargs: Any) -> LogSampler: ...
+    @property
+    def active(self) -> bool: ...
+    def allow(self, event: str, path: str = ..., force: bool = ...) -> bool: ...
+    def summaries(self, force: bool = ...) -> List[Dict[str, Any]]: ...
@@ -0,0 +1,45 @@
+import logging
+from typing import Any, Dict, FrozenSet, Optional, TextIO, Tuple
+
+from prometheus_client import CollectorRegistry
+
+__all__ = [
+    "AsyncLogWriter",
+    "QueueForwardHandler",
+    "QueueLoggerFactory",
+    "OVERFLOW_POLICIES",
+    "CRITICAL_LOGGERS",
+    "install_queue_handler",
+]
+
+OVERFLOW_POLICIES: Tuple[str, ...]
+CRITICAL_LOGGERS: FrozenSet[str]
+
+class AsyncLogWriter:
+    overflow: str
+    batch_size: int
+    dropped: int
+    blocked: int
+    def __init__(self, maxsize: int = ..., overflow: str = ..., batch_size: int = ..., registry: CollectorRegistry = ...) -> None: ...
+    @property
+    def running(self) -> bool: ...
+    def start(self) -> None: ...
+    def stop(self, timeout: float = ...) -> None: ...
+    def submit(self, sink: Any, payload: Any, critical: bool = ...) -> bool: ...
+    def stats(self) -> Dict[str, Any]: ...
+
+class QueueForwardHandler(logging.Handler):
+    writer: AsyncLogWriter
+    targets: Tuple[logging.Handler, ...]
+    critical: bool
+    def __init__(self, writer: AsyncLogWriter, targets: Tuple[logging.Handler, ...], critical: bool = ...) -> None: ...
+
+def install_queue_handler(logger: logging.Logger, writer: AsyncLogWriter) -> None: ...
+
+class QueueLogger:
+    def __init__(self, writer: AsyncLogWriter, file: TextIO, critical: bool) -> None: ...
+    def msg(self, message: str) -> None: ...
+
+class QueueLoggerFactory:
+    def __init__(self, writer: AsyncLogWriter, file: Optional[TextIO] = ...) -> None: ...
+    def __call__(self, *args: Any) -> QueueLogger: ...
@@ -10,7 +10,8 @@ debugging, and operational visibility.
 
 @performance
 - Structured JSON logging for machine parsing
-- Async logging to prevent blocking
+- Optional non-blocking mode (``LOG_ASYNC=1``): log calls enqueue, a
+  writer thread does the I/O (see utils/log_writer.py)
 - Log rotation and compression
 
 @risk
@@ -27,13 +28,15 @@ debugging, and operational visibility.
 @author TRAIDER Team
 """
 
+import atexit
 import json
 import logging
 import logging.config
 import os
+import re
 import sys
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import structlog
 from structlog.types import FilteringBoundLogger
@@ -43,6 +46,9 @@ from opentelemetry.sdk.resources import Resource
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
 
+from utils.binlog import BinaryLogHandler, StdlibRoutingLoggerFactory, render_unless_routed
+from utils.log_writer import AsyncLogWriter, QueueLoggerFactory, install_queue_handler
+
 # =============================================================================
 # CONFIGURATION
 # =============================================================================
@@ -56,6 +62,17 @@ ENVIRONMENT = os.getenv("PYTHON_ENV", "development")
 LOG_DIR = os.getenv("LOG_DIR", "logs")
 os.makedirs(LOG_DIR, exist_ok=True)
 
+# Non-blocking mode: hand records to a writer thread instead of doing I/O inline
+LOG_ASYNC = os.getenv("LOG_ASYNC", "false").lower() in ("1", "true", "yes")
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+LOG_OVERFLOW_POLICY = os.getenv("LOG_OVERFLOW_POLICY", "drop").lower()  # drop | block
+
+# Compact binary format (utils.binlog) for the audit and trading trails
+LOG_BINARY = os.getenv("LOG_BINARY", "false").lower() in ("1", "true", "yes")
+BINARY_LOGGERS: Tuple[str, ...] = ("audit", "trading")
+
+_async_writer: Optional[AsyncLogWriter] = None
+
 # =============================================================================
 # CUSTOM PROCESSORS
 # =============================================================================
@@ -132,66 +149,133 @@ def add_correlation_id(logger: FilteringBoundLogger, method_name: str, event_dic
     
     return event_dict
 
+# Key fragments that mark a field as sensitive (case-insensitive substring)
+SENSITIVE_FIELDS = (
+    "password", "secret", "token", "key", "auth", "credential",
+    "private_key", "api_key", "access_token", "refresh_token",
+)
+MASK = "[MASKED]"
+
+_SENSITIVE_KEY_RE = re.compile("|".join(re.escape(f) for f in sorted(SENSITIVE_FIELDS, key=len, reverse=True)),
+                               re.IGNORECASE)
+_SHAPE_CACHE_MAX = 4096
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# Key tuple of a dict -> the keys to mask (usually empty); event dicts from
+# one call site share a shape, so each shape is classified once
+_shape_cache: Dict[Tuple[Any, ...], Tuple[Any, ...]] = {}
+
+def _sensitive_keys(keys: Tuple[Any, ...]) -> Tuple[Any, ...]:
+    masked = _shape_cache.get(keys)
+    if masked is None:
+        search = _SENSITIVE_KEY_RE.search
+        masked = tuple(k for k in keys if search(str(k)))
+        if len(_shape_cache) >= _SHAPE_CACHE_MAX:
+            _shape_cache.clear()
+        _shape_cache[keys] = masked
+    return masked
+
+def _scrub(obj: Any) -> Any:
+    """Mask sensitive keys in nested dicts / lists; returns *obj* itself when nothing changes."""
+    
+    if isinstance(obj, dict):
+        masked = _sensitive_keys(tuple(obj))
+        if not masked and _SCALAR_TYPES.issuperset(map(type, obj.values())):
+            return obj  # fast path: flat dict without sensitive keys
+        nested = [k for k, v in obj.items() if isinstance(v, (dict, list))]
+        result = None
+        for k in nested:
+            value = obj[k]
+            scrubbed = _scrub(value)
+            if scrubbed is not value:
+                if result is None:
+                    result = dict(obj)
+                result[k] = scrubbed
+        if masked:
+            if result is None:
+                result = dict(obj)
+            for k in masked:
+                result[k] = MASK
+        return obj if result is None else result
+    if isinstance(obj, list):
+        items = [_scrub(item) for item in obj]
+        return items if any(a is not b for a, b in zip(items, obj)) else obj
+    return obj
+
 def filter_sensitive_data(logger: FilteringBoundLogger, method_name: str, event_dict: Dict[str, Any]) -> Dict[str, Any]:
     """
     Filter sensitive information from log entries.
     
     @description
     Removes or masks sensitive information like passwords, API keys,
-    and personal data to prevent security leaks in logs.
+    and personal data to prevent security leaks in logs.  Any key that
+    contains one of `SENSITIVE_FIELDS` (case-insensitive) is masked, at
+    any depth of nested dicts and lists.  Key matching uses one compiled
+    pattern and is memoised per dict shape; dicts that need no change are
+    returned as-is, changed ones are copied (callers' objects are never
+    mutated).
     
     @param event_dict Log event dictionary to filter
     @returns Filtered event dictionary with sensitive data masked
     
-    @performance <0.5ms overhead per log entry
+    @performance 4-15x faster than the per-key substring walk it replaced;
+        flat events without sensitive keys skip copying entirely
+        (scripts/bench_log_scrub.py)
     @sideEffects Modifies log content for security
     
     @tradingImpact HIGH - Prevents credential leaks
     @riskLevel CRITICAL - Security requirement
     """
     
-    sensitive_fields = {
-        "password", "secret", "token", "key", "auth", "credential",
-        "private_key", "api_key", "access_token", "refresh_token"
-    }
-    
-    def mask_sensitive(obj: Any, path: str = "") -> Any:
-        """Recursively mask sensitive fields in nested objects."""
-        
-        if isinstance(obj, dict):
-            return {
-                k: "[MASKED]" if any(field in k.lower() for field in sensitive_fields)
-                else mask_sensitive(v, f"{path}.{k}" if path else k)
-                for k, v in obj.items()
-            }
-        elif isinstance(obj, list):
-            return [mask_sensitive(item, f"{path}[{i}]") for i, item in enumerate(obj)]
-        else:
-            return obj
-    
-    return mask_sensitive(event_dict)
+    return _scrub(event_dict)
 
 # =============================================================================
 # LOGGING CONFIGURATION
 # =============================================================================
 
-def setup_logging(level: int = logging.INFO) -> None:
+def setup_logging(level: int = logging.INFO, async_mode: Optional[bool] = None,
+                  binary: Optional[bool] = None) -> None:
     """
     Configure structured logging for the application.
     
     @description
     Sets up structured logging with JSON formatting, file rotation,
     and appropriate processors for institutional-grade logging.
+    In async mode the configured handlers and the structlog output are
+    fed through a bounded queue and written by a background thread;
+    audit and trading records are never dropped on overflow.
+    In binary mode the audit and trading loggers (structlog and stdlib)
+    write `utils.binlog` segments (``audit.blog``, ``trading.blog``) that
+    are block-compressed and indexed on rotation.
     
     @param level Logging level (default: INFO)
+    @param async_mode Queue log I/O to a writer thread (default: LOG_ASYNC)
+    @param binary Binary audit/trading logs (default: LOG_BINARY)
     
     @performance One-time setup cost: <10ms
-    @sideEffects Configures global logging system
+    @sideEffects Configures global logging system; may start a thread
     
     @tradingImpact CRITICAL - All system logging depends on this
     @riskLevel MEDIUM - Logging system failure affects audit trails
     """
     
+    global _async_writer
+    if async_mode is None:
+        async_mode = LOG_ASYNC
+    if async_mode and _async_writer is None:
+        _async_writer = AsyncLogWriter(maxsize=LOG_QUEUE_SIZE, overflow=LOG_OVERFLOW_POLICY)
+        atexit.register(shutdown_logging)
+    writer = _async_writer if async_mode else None
+    if binary is None:
+        binary = LOG_BINARY
+    
+    renderer = structlog.processors.JSONRenderer() if LOG_FORMAT == "json" else structlog.dev.ConsoleRenderer()
+    logger_factory = QueueLoggerFactory(writer) if writer else structlog.WriteLoggerFactory()
+    if binary:
+        # audit/trading event dicts go to their stdlib handlers unrendered
+        renderer = render_unless_routed(renderer)
+        logger_factory = StdlibRoutingLoggerFactory(logger_factory, BINARY_LOGGERS)
+    
     # Configure structlog
     structlog.configure(
         processors=[
@@ -203,10 +287,10 @@ def setup_logging(level: int = logging.INFO) -> None:
             structlog.processors.add_log_level,
             structlog.processors.StackInfoRenderer(),
             structlog.dev.set_exc_info,
-            structlog.processors.JSONRenderer() if LOG_FORMAT == "json" else structlog.dev.ConsoleRenderer(),
+            renderer,
         ],
         wrapper_class=structlog.make_filtering_bound_logger(level),
-        logger_factory=structlog.WriteLoggerFactory(),
+        logger_factory=logger_factory,
         cache_logger_on_first_use=False,
     )
     
@@ -287,8 +371,24 @@ def setup_logging(level: int = logging.INFO) -> None:
         },
     }
     
+    if binary:
+        for name in BINARY_LOGGERS:
+            handler = logging_config["handlers"][name]
+            logging_config["handlers"][name] = {
+                "()": BinaryLogHandler,
+                "level": handler["level"],
+                "filename": os.path.join(LOG_DIR, f"{name}.blog"),
+                "max_bytes": handler["maxBytes"],
+                "backup_count": handler["backupCount"],
+            }
+    
     logging.config.dictConfig(logging_config)
     
+    if writer is not None:
+        for name in logging_config["loggers"]:
+            install_queue_handler(logging.getLogger(name), writer)
+        writer.start()
+    
     # ------------------------------------------------------------------
     # Observability Stub – Prometheus & OpenTelemetry
     # ------------------------------------------------------------------
@@ -317,9 +417,31 @@ def setup_logging(level: int = logging.INFO) -> None:
             "log_level": logging.getLevelName(level),
             "log_format": LOG_FORMAT,
             "log_directory": LOG_DIR,
+            "async": bool(writer),
+            "binary": bool(binary),
         }
     )
 
+def shutdown_logging(timeout: float = 5.0) -> None:
+    """
+    Flush queued log records and stop the async writer thread.
+    
+    @description
+    Safe to call when async mode is off or already stopped; records
+    logged afterwards are written synchronously.
+    
+    @param timeout Maximum seconds to wait for the queue to drain
+    
+    @performance Bounded by the queued volume (≤ LOG_QUEUE_SIZE records)
+    @sideEffects Stops the log-writer thread
+    
+    @tradingImpact LOW - Shutdown only
+    @riskLevel MEDIUM - Ensures audit records reach disk
+    """
+    
+    if _async_writer is not None:
+        _async_writer.stop(timeout)
+
 # =============================================================================
 # LOGGER FACTORY
 # =============================================================================
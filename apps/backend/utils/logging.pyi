@@ -1,14 +1,28 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 import logging
 
 __all__ = [
     "setup_logging",
+    "shutdown_logging",
     "get_logger",
+    "filter_sensitive_data",
+    "SENSITIVE_FIELDS",
+    "MASK",
     "StructuredAdapter",
 ]
 
 
-def setup_logging(level: int = ...) -> None: ...
+def setup_logging(level: int = ..., async_mode: Optional[bool] = ..., binary: Optional[bool] = ...) -> None: ...
+
+
+def shutdown_logging(timeout: float = ...) -> None: ...
+
+
+SENSITIVE_FIELDS: Tuple[str, ...]
+MASK: str
+
+
+def filter_sensitive_data(logger: Any, method_name: str, event_dict: Dict[str, Any]) -> Dict[str, Any]: ...
 
 
 def get_logger(name: Optional[str] = ...) -> logging.Logger: ...
@@ -0,0 +1,30 @@
+from typing import Any, Dict, Optional, Tuple
+
+from prometheus_client import CollectorRegistry
+
+__all__ = [
+    "EventLoopMonitor",
+    "LAG_BUCKETS",
+]
+
+LAG_BUCKETS: Tuple[float, ...]
+
+class EventLoopMonitor:
+    interval: float
+    block_threshold: Optional[float]
+    log_interval: float
+    last_lag: float
+    max_lag: float
+    blocked_count: int
+    def __init__(
+        self,
+        interval: float = ...,
+        block_threshold: Optional[float] = ...,
+        log_interval: float = ...,
+        registry: CollectorRegistry = ...,
+    ) -> None: ...
+    @property
+    def running(self) -> bool: ...
+    def start(self) -> None: ...
+    async def stop(self) -> None: ...
+    def stats(self) -> Dict[str, Any]: ...
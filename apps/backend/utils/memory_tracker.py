@@ -0,0 +1,204 @@
+"""
+@fileoverview tracemalloc-based allocation tracking and leak diagnostics
+@module backend.utils.memory_tracker
+
+@description
+Opt-in wrapper around :mod:`tracemalloc` for the running API process:
+
+- **top sites** – largest live allocation sites (line, file or traceback)
+- **growth** – allocation delta since the previous snapshot, the quickest
+  way to spot a queue, metric window or cache that only ever grows
+- **subsystems** – live traced bytes grouped by owning module, checked
+  against the resident budgets the modules document (e.g. the TimescaleDB
+  writer's "<10 MB resident")
+
+Tracing costs CPU and memory on every allocation, so it is off unless
+explicitly started (admin endpoint or ``TRAIDER_TRACEMALLOC=1``).
+
+@performance
+- Tracing overhead: roughly 1.3–2x allocation cost while enabled
+- Snapshot: O(live allocations); ~50–300 ms for a typical API process
+
+@risk
+- Failure impact: LOW - Diagnostics only
+- Recovery strategy: `stop()` releases all tracing memory
+
+@since 1.0.0-alpha
+"""
+
+from __future__ import annotations
+
+import threading
+import tracemalloc
+from typing import Any, Dict, List, Optional, Tuple
+
+from prometheus_client import CollectorRegistry, Gauge
+from prometheus_client.core import REGISTRY
+
+__all__ = [
+    "MemoryTracker",
+    "SUBSYSTEMS",
+    "MEMORY_BUDGETS_MB",
+]
+
+# Path fragment (``/``-separated) -> subsystem name; first match wins
+SUBSYSTEMS: Tuple[Tuple[str, str], ...] = (
+    ("services/market_data/timescale_writer", "timescale_writer"),
+    ("services/market_data/websocket_client", "websocket_client"),
+    ("services/market_data/tick_cache", "tick_cache"),
+    ("services/market_data/broadcast", "stream_broadcast"),
+    ("services/market_data/", "market_data"),
+    ("utils/monitoring", "metrics"),
+    ("utils/quantile_sketch", "metrics"),
+    ("utils/logging", "logging"),
+    ("backend/", "backend"),
+    ("market-data-service/", "market_data"),
+)
+
+# Documented resident budgets (module @performance sections)
+MEMORY_BUDGETS_MB: Dict[str, float] = {
+    "timescale_writer": 10.0,
+    "websocket_client": 25.0,
+}
+
+GROUP_BY = ("lineno", "filename", "traceback")
+
+_EXCLUDE = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def _subsystem(filename: str) -> str:
+    path = filename.replace("\\", "/")
+    for fragment, name in SUBSYSTEMS:
+        if fragment in path:
+            return name
+    return "other"
+
+
+def _site(stat: Any, group_by: str) -> str:
+    frames = stat.traceback
+    if group_by == "traceback":
+        return " <- ".join(f"{f.filename}:{f.lineno}" for f in reversed(frames))
+    frame = frames[0]
+    return frame.filename if group_by == "filename" else f"{frame.filename}:{frame.lineno}"
+
+
+class MemoryTracker:
+    """
+    Start/stop tracemalloc and summarise snapshots.
+
+    @tradingImpact LOW - Diagnostics only
+    @riskLevel LOW - Read-only introspection (CPU cost while tracing)
+    """
+
+    def __init__(self, registry: CollectorRegistry = REGISTRY) -> None:
+        self._lock = threading.Lock()
+        self._previous: Optional[tracemalloc.Snapshot] = None
+        self._started_here = False
+        self._traced = Gauge(
+            "traider_memory_traced_bytes",
+            "Live traced allocations by subsystem (latest tracemalloc snapshot)",
+            ["subsystem"],
+            registry=registry,
+        )
+        self._total = Gauge(
+            "traider_memory_traced_total_bytes",
+            "Total live traced allocations (latest tracemalloc snapshot)",
+            registry=registry,
+        )
+
+    @property
+    def tracing(self) -> bool:
+        return tracemalloc.is_tracing()
+
+    def start(self, frames: int = 1) -> bool:
+        """Start tracing with *frames* stack depth; False if already tracing."""
+        with self._lock:
+            if tracemalloc.is_tracing():
+                return False
+            tracemalloc.start(frames)
+            self._started_here = True
+            self._previous = None
+            return True
+
+    def stop(self) -> bool:
+        """Stop tracing (only if started here) and drop the baseline."""
+        with self._lock:
+            self._previous = None
+            if not (self._started_here and tracemalloc.is_tracing()):
+                return False
+            tracemalloc.stop()
+            self._started_here = False
+            return True
+
+    def report(self, limit: int = 20, group_by: str = "lineno") -> Dict[str, Any]:
+        """
+        Take a snapshot and summarise it against the previous one.
+
+        @param limit Number of top / growth entries to return
+        @param group_by ``lineno`` | ``filename`` | ``traceback``
+        @returns Dict with ``traced_bytes``, ``peak_bytes``, ``top``,
+            ``growth`` (empty on the first snapshot) and ``subsystems``
+        @throws RuntimeError if tracing is not active; ValueError for a bad group_by
+        @performance O(live allocations)
+        @sideEffects Replaces the growth baseline; updates gauges
+        """
+
+        if group_by not in GROUP_BY:
+            raise ValueError(f"group_by must be one of {list(GROUP_BY)}")
+        with self._lock:
+            if not tracemalloc.is_tracing():
+                raise RuntimeError("tracemalloc is not tracing")
+            snapshot = tracemalloc.take_snapshot().filter_traces(_EXCLUDE)
+            current, peak = tracemalloc.get_traced_memory()
+            previous, self._previous = self._previous, snapshot
+
+        top: List[Dict[str, Any]] = [
+            {"site": _site(stat, group_by), "size_bytes": stat.size, "count": stat.count}
+            for stat in snapshot.statistics(group_by)[:limit]
+        ]
+
+        growth: List[Dict[str, Any]] = []
+        if previous is not None:
+            diffs = [d for d in snapshot.compare_to(previous, group_by) if d.size_diff > 0]
+            growth = [
+                {
+                    "site": _site(diff, group_by),
+                    "size_diff_bytes": diff.size_diff,
+                    "count_diff": diff.count_diff,
+                    "size_bytes": diff.size,
+                }
+                for diff in diffs[:limit]
+            ]
+
+        subsystems = self._subsystems(snapshot)
+        return {
+            "traced_bytes": current,
+            "peak_bytes": peak,
+            "top": top,
+            "growth": growth,
+            "subsystems": subsystems,
+        }
+
+    def _subsystems(self, snapshot: tracemalloc.Snapshot) -> Dict[str, Dict[str, Any]]:
+        totals: Dict[str, int] = {}
+        for stat in snapshot.statistics("filename"):
+            name = _subsystem(stat.traceback[0].filename)
+            totals[name] = totals.get(name, 0) + stat.size
+
+        result: Dict[str, Dict[str, Any]] = {}
+        self._traced.clear()
+        for name, size in sorted(totals.items(), key=lambda item: item[1], reverse=True):
+            entry: Dict[str, Any] = {"size_bytes": size}
+            budget = MEMORY_BUDGETS_MB.get(name)
+            if budget is not None:
+                entry["budget_bytes"] = int(budget * 1024 * 1024)
+                entry["over_budget"] = size > entry["budget_bytes"]
+            result[name] = entry
+            self._traced.labels(subsystem=name).set(size)
+        self._total.set(sum(totals.values()))
+        return result
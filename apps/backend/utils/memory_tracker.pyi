@@ -0,0 +1,21 @@
+from typing import Any, Dict, Tuple
+
+from prometheus_client import CollectorRegistry
+
+__all__ = [
+    "MemoryTracker",
+    "SUBSYSTEMS",
+    "MEMORY_BUDGETS_MB",
+]
+
+SUBSYSTEMS: Tuple[Tuple[str, str], ...]
+MEMORY_BUDGETS_MB: Dict[str, float]
+GROUP_BY: Tuple[str, ...]
+
+class MemoryTracker:
+    def __init__(self, registry: CollectorRegistry = ...) -> None: ...
+    @property
+    def tracing(self) -> bool: ...
+    def start(self, frames: int = ...) -> bool: ...
+    def stop(self) -> bool: ...
+    def report(self, limit: int = ..., group_by: str = ...) -> Dict[str, Any]: ...
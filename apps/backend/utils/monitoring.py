@@ -28,18 +28,20 @@ for trading system monitoring and optimization.
 """
 
 import asyncio
+import math
 import time
+from array import array
 from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Tuple
 from threading import Lock
-import statistics
 
 from prometheus_client import Counter, Histogram, Gauge, CollectorRegistry, generate_latest
 from prometheus_client.core import REGISTRY
 
 from utils.logging import get_logger
+from utils.quantile_sketch import QuantileSketch
 
 # =============================================================================
 # CONFIGURATION
@@ -51,6 +53,8 @@ logger = get_logger(__name__)
 METRICS_ENABLED = True
 METRICS_COLLECTION_INTERVAL = 10  # seconds
 HISTOGRAM_BUCKETS = [0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0]
+METRIC_RING_CAPACITY = 10000  # points kept per series (oldest overwritten)
+METRIC_RETENTION_SECONDS = 3600  # points older than this are evicted
 
 # =============================================================================
 # DATA STRUCTURES
@@ -72,38 +76,222 @@ class MetricPoint:
     labels: Dict[str, str] = field(default_factory=dict)
     metric_type: str = "gauge"
 
-@dataclass
+class MetricRing:
+    """
+    Fixed-capacity ring buffer of (timestamp, value) samples for one series.
+    
+    @description
+    Timestamps and values live in two typed ``array('d')`` buffers, so a
+    recorded point costs two float stores instead of a `MetricPoint` object.
+    Buffers start small and double up to `capacity`; once full, the oldest
+    point is overwritten.  Points are appended in time order, which makes
+    age-based eviction a binary search plus a head move (`evict_before`).
+    
+    @performance
+    - append(): O(1) amortised, no per-point allocation once grown
+    - evict_before(): O(log n)
+    - Memory: 16 bytes × capacity per series, upper bound
+    """
+    
+    __slots__ = ("capacity", "metric_type", "labels", "_timestamps", "_values", "_head", "_size")
+    
+    _INITIAL_SIZE = 64
+    
+    def __init__(self, capacity: int = METRIC_RING_CAPACITY, metric_type: str = "gauge",
+                 labels: Optional[Dict[str, str]] = None):
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        self.capacity = capacity
+        self.metric_type = metric_type
+        self.labels = labels or {}
+        size = min(self._INITIAL_SIZE, capacity)
+        self._timestamps = array("d", bytes(8 * size))
+        self._values = array("d", bytes(8 * size))
+        self._head = 0
+        self._size = 0
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def append(self, timestamp: float, value: float) -> None:
+        """Record one point, overwriting the oldest when at capacity."""
+        allocated = len(self._timestamps)
+        if self._size == allocated:
+            if allocated < self.capacity:
+                self._grow(min(allocated * 2, self.capacity))
+                allocated = len(self._timestamps)
+            else:
+                # Full – overwrite oldest
+                self._timestamps[self._head] = timestamp
+                self._values[self._head] = value
+                self._head = (self._head + 1) % allocated
+                return
+        idx = (self._head + self._size) % allocated
+        self._timestamps[idx] = timestamp
+        self._values[idx] = value
+        self._size += 1
+    
+    def _grow(self, new_size: int) -> None:
+        # Linearise so the logical order starts at index 0 again
+        head, size = self._head, self._size
+        for name in ("_timestamps", "_values"):
+            old = getattr(self, name)
+            grown = array("d", bytes(8 * new_size))
+            ordered = old[head:] + old[:head]
+            grown[:size] = ordered[:size]
+            setattr(self, name, grown)
+        self._head = 0
+    
+    def _physical(self, logical: int) -> int:
+        return (self._head + logical) % len(self._timestamps)
+    
+    def evict_before(self, cutoff: float) -> int:
+        """Drop every point with timestamp < *cutoff*; returns the number dropped."""
+        if not self._size or self._timestamps[self._head] >= cutoff:
+            return 0
+        
+        # Binary search for the first retained point (timestamps are non-decreasing)
+        lo, hi = 0, self._size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._timestamps[self._physical(mid)] < cutoff:
+                lo = mid + 1
+            else:
+                hi = mid
+        dropped = lo
+        self._head = self._physical(dropped)
+        self._size -= dropped
+        return dropped
+    
+    def points(self) -> List[Tuple[float, float]]:
+        """All retained (timestamp, value) pairs, oldest first."""
+        return [
+            (self._timestamps[self._physical(i)], self._values[self._physical(i)])
+            for i in range(self._size)
+        ]
+    
+    def latest(self) -> Optional[Tuple[float, float]]:
+        if not self._size:
+            return None
+        idx = self._physical(self._size - 1)
+        return self._timestamps[idx], self._values[idx]
+
 class PerformanceWindow:
     """
-    Rolling window for performance metrics.
+    Time-decayed rolling window for performance metrics.
     
     @description
-    Maintains a rolling window of performance measurements
-    for calculating statistics and detecting anomalies.
+    Splits the window into `slices` fixed time slices, each holding a
+    mergeable `QuantileSketch`.  Samples go into the current slice; slices
+    older than `window_seconds` are dropped as time advances, so statistics
+    always describe (roughly) the last `window_seconds`.  Slices are aligned
+    to wall-clock time, which lets windows from different workers be merged
+    slice by slice (`merge()`, `to_dict()` / `from_dict()`).
+    
+    @performance
+    - add(): O(1), no per-sample allocation beyond a bucket counter
+    - get_stats(): O(slices × buckets), cached until the next add()
+    - Percentiles within 1% relative error; count/min/max/mean exact
     """
     
-    values: deque = field(default_factory=lambda: deque(maxlen=1000))
-    window_size: int = 1000
+    __slots__ = ("window_seconds", "slices", "relative_accuracy", "_slice_width",
+                 "_clock", "_slices", "_cached")
+    
+    def __init__(self, window_seconds: float = 300.0, slices: int = 10,
+                 relative_accuracy: float = 0.01,
+                 clock: Callable[[], float] = time.time):
+        if window_seconds <= 0 or slices < 1:
+            raise ValueError("window_seconds must be > 0 and slices >= 1")
+        self.window_seconds = window_seconds
+        self.slices = slices
+        self.relative_accuracy = relative_accuracy
+        self._slice_width = window_seconds / slices
+        self._clock = clock
+        self._slices: Dict[int, QuantileSketch] = {}
+        self._cached: Optional[Dict[str, float]] = None
+    
+    def _current_slice(self) -> int:
+        return int(self._clock() // self._slice_width)
+    
+    def _expire(self, current: int) -> None:
+        oldest = current - self.slices + 1
+        for slice_id in [sid for sid in self._slices if sid < oldest]:
+            del self._slices[slice_id]
+            self._cached = None
     
     def add(self, value: float) -> None:
         """Add value to the rolling window."""
-        self.values.append(value)
+        slice_id = self._current_slice()
+        sketch = self._slices.get(slice_id)
+        if sketch is None:
+            self._expire(slice_id)
+            sketch = self._slices[slice_id] = QuantileSketch(self.relative_accuracy)
+        sketch.add(value)
+        self._cached = None
+    
+    def merge(self, other: "PerformanceWindow") -> None:
+        """Fold another window (e.g. from a different worker) into this one."""
+        for slice_id, theirs in other._slices.items():
+            mine = self._slices.get(slice_id)
+            if mine is None:
+                mine = self._slices[slice_id] = QuantileSketch(self.relative_accuracy)
+            mine.merge(theirs)
+        self._expire(self._current_slice())
+        self._cached = None
+    
+    def sketch(self, window_seconds: Optional[float] = None) -> QuantileSketch:
+        """
+        Merged sketch of every live slice, or of the most recent slices
+        covering `window_seconds` (rounded up to whole slices).
+        """
+        current = self._current_slice()
+        self._expire(current)
+        oldest = current - self.slices + 1
+        if window_seconds is not None:
+            oldest = max(oldest, current - max(1, math.ceil(window_seconds / self._slice_width)) + 1)
+        merged = QuantileSketch(self.relative_accuracy)
+        for slice_id, sketch in self._slices.items():
+            if slice_id >= oldest:
+                merged.merge(sketch)
+        return merged
     
     def get_stats(self) -> Dict[str, float]:
         """Get statistical summary of the window."""
-        if not self.values:
-            return {}
-        
-        values_list = list(self.values)
+        current = self._current_slice()
+        if self._cached is not None and current - self.slices + 1 <= min(self._slices, default=current):
+            return self._cached
+        
+        merged = self.sketch()
+        if not merged.count:
+            self._cached = {}
+            return self._cached
+        
+        median, p95, p99 = merged.quantiles((0.5, 0.95, 0.99))
+        self._cached = {
+            "count": merged.count,
+            "min": merged.min,
+            "max": merged.max,
+            "mean": merged.mean,
+            "median": median,
+            "p95": p95,
+            "p99": p99,
+        }
+        return self._cached
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialisable form for shipping to another worker."""
         return {
-            "count": len(values_list),
-            "min": min(values_list),
-            "max": max(values_list),
-            "mean": statistics.mean(values_list),
-            "median": statistics.median(values_list),
-            "p95": statistics.quantiles(values_list, n=20)[18] if len(values_list) >= 20 else max(values_list),
-            "p99": statistics.quantiles(values_list, n=100)[98] if len(values_list) >= 100 else max(values_list),
+            "window_seconds": self.window_seconds,
+            "slices": self.slices,
+            "relative_accuracy": self.relative_accuracy,
+            "data": {str(sid): sketch.to_dict() for sid, sketch in self._slices.items()},
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PerformanceWindow":
+        window = cls(data["window_seconds"], data["slices"], data["relative_accuracy"])
+        window._slices = {int(sid): QuantileSketch.from_dict(raw) for sid, raw in data["data"].items()}
+        return window
 
 # =============================================================================
 # METRICS COLLECTOR
@@ -120,7 +308,7 @@ class MetricsCollector:
     @performance
     - <1ms per metric recording
     - Background aggregation every 10 seconds
-    - Memory-efficient rolling windows
+    - Memory-efficient rolling windows (mergeable quantile sketches)
     
     @tradingImpact MEDIUM - Performance monitoring affects optimization
     @riskLevel LOW - Monitoring only, graceful degradation
@@ -138,8 +326,11 @@ class MetricsCollector:
         self._lock = Lock()
         self._background_task: Optional[asyncio.Task] = None
         
-        # Metric storage
-        self._metrics: Dict[str, List[MetricPoint]] = defaultdict(list)
+        # Metric storage: one bounded ring per (name, label set)
+        self._metrics: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], MetricRing] = {}
+        # Same rings keyed by the labels in the caller's order, so the
+        # sorted key is only built the first time a call site is seen
+        self._series: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], MetricRing] = {}
         self._performance_windows: Dict[str, PerformanceWindow] = defaultdict(PerformanceWindow)
         
         # Prometheus metrics
@@ -217,7 +408,10 @@ class MetricsCollector:
         @param labels Optional metric labels
         @param metric_type Type of metric (gauge, counter, histogram)
         
-        @performance <0.5ms per metric
+        @performance ~1.5µs without labels, ~2µs with two labels (~2.3µs
+            when the labels dict is built per call); measured with
+            ``python -m scripts.bench_record_metric``.  Above the 1µs
+            target: the lock, timestamp and ring append alone take ~0.6µs
         @sideEffects Stores metric in memory
         
         @tradingImpact LOW - Monitoring only
@@ -227,21 +421,53 @@ class MetricsCollector:
         if not self.enabled:
             return
         
-        metric_point = MetricPoint(
-            name=name,
-            value=value,
-            timestamp=time.time(),
-            labels=labels or {},
-            metric_type=metric_type
-        )
-        
+        key = (name, tuple(labels.items())) if labels else (name, ())
         with self._lock:
-            self._metrics[name].append(metric_point)
-            
-            # Limit metric history to prevent memory growth
-            if len(self._metrics[name]) > 10000:
-                self._metrics[name] = self._metrics[name][-5000:]
+            ring = self._series.get(key)
+            if ring is None:
+                series = (name, tuple(sorted(labels.items()))) if labels else key
+                ring = self._metrics.get(series)
+                if ring is None:
+                    ring = self._metrics[series] = MetricRing(METRIC_RING_CAPACITY, metric_type, labels)
+                self._series[key] = ring
+            ring.append(time.time(), value)
     
+    def get_metric_points(self, name: str, labels: Optional[Dict[str, str]] = None) -> List[MetricPoint]:
+        """
+        Materialise the retained points of one series.
+        
+        @param name Metric name
+        @param labels Label set the points were recorded with
+        @returns Points oldest first (empty if the series is unknown)
+        
+        @performance O(points) – for debugging and ad-hoc queries only
+        @sideEffects None
+        
+        @tradingImpact LOW - Monitoring query
+        @riskLevel LOW - Read-only operation
+        """
+        
+        key = (name, tuple(sorted(labels.items()))) if labels else (name, ())
+        with self._lock:
+            ring = self._metrics.get(key)
+            if ring is None:
+                return []
+            raw = ring.points()
+            metric_type, ring_labels = ring.metric_type, dict(ring.labels)
+        return [
+            MetricPoint(name=name, value=value, timestamp=ts, labels=ring_labels, metric_type=metric_type)
+            for ts, value in raw
+        ]
+
+    def get_latest_value(self, name: str, labels: Optional[Dict[str, str]] = None) -> Optional[float]:
+        """Most recent value of one series (None if unknown); O(1)."""
+
+        key = (name, tuple(sorted(labels.items()))) if labels else (name, ())
+        with self._lock:
+            ring = self._metrics.get(key)
+            latest = ring.latest() if ring is not None else None
+        return latest[1] if latest is not None else None
+
     def record_request_duration(self, method: str, endpoint: str, 
                                status_code: int, duration: float) -> None:
         """
@@ -403,7 +629,11 @@ class MetricsCollector:
         
         window = self._performance_windows.get(metric_name)
         return window.get_stats() if window else None
-    
+
+    def get_performance_window(self, metric_name: str) -> Optional[PerformanceWindow]:
+        """Rolling window behind `get_performance_stats` (None if unknown)."""
+        return self._performance_windows.get(metric_name)
+
     def get_prometheus_metrics(self) -> str:
         """
         Get Prometheus-formatted metrics.
@@ -508,111 +738,334 @@ class MetricsCollector:
     def _cleanup_old_metrics(self) -> None:
         """Clean up old metrics to prevent memory growth."""
         
-        current_time = time.time()
-        retention_period = 3600  # 1 hour
+        cutoff = time.time() - METRIC_RETENTION_SECONDS
         
         with self._lock:
-            for metric_name, points in self._metrics.items():
-                # Keep only recent metrics
-                self._metrics[metric_name] = [
-                    point for point in points
-                    if current_time - point.timestamp < retention_period
-                ]
+            removed = False
+            for key in list(self._metrics):
+                ring = self._metrics[key]
+                ring.evict_before(cutoff)
+                if not len(ring):
+                    del self._metrics[key]
+                    removed = True
+            if removed:
+                self._series = {key: ring for key, ring in self._series.items() if len(ring)}
 
 # =============================================================================
 # ALERTING SYSTEM
 # =============================================================================
 
+ALERT_KINDS = ("threshold", "rate_of_change", "burn_rate")
+ALERT_STATISTICS = ("mean", "median", "p95", "p99", "min", "max", "count", "last")
+ALERT_COMPARISONS = ("greater", "less", "equal")
+ALERT_COOLDOWN_SECONDS = 300.0  # re-notify a still-firing rule at most this often
+ALERT_RATE_WINDOW_SECONDS = 300.0  # default horizon for rate_of_change rules
+_RATE_HISTORY_POINTS = 16  # samples kept per rate_of_change rule
+
+def _compare(value: float, comparison: str, threshold: float) -> bool:
+    if comparison == "greater":
+        return value > threshold
+    if comparison == "less":
+        return value < threshold
+    return abs(value - threshold) < 0.001
+
+@dataclass
+class AlertRule:
+    """
+    Alert rule definition plus its evaluation state.
+    
+    @description
+    `statistic` selects what is read from the metric: a summary of its
+    performance window (``mean``, ``median``, ``p95``, ``p99``, ``min``,
+    ``max``, ``count``) or ``last``, the latest point recorded with
+    `record_metric`.  `kind` selects what is compared with `threshold`:
+    
+    - ``threshold``: the statistic over the last `window_seconds`
+    - ``rate_of_change``: the change per second, over `window_seconds`, of
+      the statistic taken over the last `window_seconds`
+    - ``burn_rate``: share of samples slower than `latency_target` divided
+      by the error budget ``1 - objective``; with `short_window_seconds`
+      both windows must burn (multi-window burn-rate alert)
+    
+    `window_seconds=None` means the whole performance window (5 minutes).
+    """
+    
+    metric_name: str
+    threshold: float
+    comparison: str = "greater"
+    severity: str = "warning"
+    kind: str = "threshold"
+    statistic: str = "mean"
+    window_seconds: Optional[float] = None
+    short_window_seconds: Optional[float] = None
+    latency_target: Optional[float] = None
+    objective: Optional[float] = None
+    cooldown_seconds: float = ALERT_COOLDOWN_SECONDS
+    
+    # Evaluation state
+    firing: bool = False
+    last_triggered: Optional[float] = None
+    suppressed: int = 0
+    history: deque = field(default_factory=deque, repr=False)
+    
+    @property
+    def key(self) -> Tuple[Any, ...]:
+        """Identity used to deduplicate rules."""
+        return (self.metric_name, self.kind, self.statistic, self.comparison, self.threshold,
+                self.window_seconds, self.short_window_seconds, self.latency_target, self.objective)
+
 class AlertManager:
     """
-    Simple alerting system for metric thresholds.
+    Rule engine for metric alerts.
     
     @description
-    Monitors metrics and triggers alerts when thresholds are exceeded.
-    Provides basic alerting functionality for operational monitoring.
+    Evaluates threshold, rate-of-change and burn-rate rules against the
+    collector's sliding performance windows.  Rules only ever read
+    mergeable sketches (or the latest raw point), never raw samples, and a
+    check pass computes each (metric, window, statistic) value once no
+    matter how many rules share it.  A rule notifies when it starts firing
+    and then at most once per `cooldown_seconds` while it keeps firing;
+    identical rules are deduplicated on registration.
+    
+    @performance
+    - check_alerts(): O(distinct metric windows × buckets + rules);
+      independent of the number of samples in a window (~10 ms for
+      5,000 mixed rules over 50 metrics)
+    - rate_of_change state: at most ~17 points per rule
     
     @tradingImpact MEDIUM - Alerts affect operational response
     @riskLevel LOW - Alerting only, no trading logic
     """
     
-    def __init__(self, metrics_collector: MetricsCollector):
+    def __init__(self, metrics_collector: MetricsCollector,
+                 clock: Callable[[], float] = time.time):
         """Initialize alert manager."""
         
         self.metrics_collector = metrics_collector
-        self.alert_rules: List[Dict[str, Any]] = []
+        self.alert_rules: List[AlertRule] = []
         self.alert_history: deque = deque(maxlen=1000)
+        self._clock = clock
+        self._rules_by_key: Dict[Tuple[Any, ...], AlertRule] = {}
         
         logger.info("Alert manager initialized")
     
     def add_alert_rule(self, metric_name: str, threshold: float, 
-                      comparison: str = "greater", severity: str = "warning") -> None:
+                      comparison: str = "greater", severity: str = "warning",
+                      *, kind: str = "threshold", statistic: str = "mean",
+                      window_seconds: Optional[float] = None,
+                      short_window_seconds: Optional[float] = None,
+                      latency_target: Optional[float] = None,
+                      objective: Optional[float] = None,
+                      cooldown_seconds: float = ALERT_COOLDOWN_SECONDS) -> AlertRule:
         """
         Add an alert rule for metric monitoring.
         
         @param metric_name Name of metric to monitor
-        @param threshold Alert threshold value
+        @param threshold Alert threshold value (a burn-rate multiple for ``burn_rate``)
         @param comparison Comparison operator (greater, less, equal)
         @param severity Alert severity (info, warning, critical)
+        @param kind threshold | rate_of_change | burn_rate
+        @param statistic mean | median | p95 | p99 | min | max | count | last
+        @param window_seconds Evaluation window (rate horizon for rate_of_change)
+        @param short_window_seconds Second, shorter burn-rate window
+        @param latency_target Samples above this value spend error budget
+        @param objective SLO objective in (0, 1), e.g. 0.999
+        @param cooldown_seconds Minimum gap between notifications of a firing rule
+        @returns The registered rule (the existing one for a duplicate)
+        @throws ValueError for an unknown kind, statistic or comparison, or
+            an incomplete burn-rate rule
         """
         
-        rule = {
-            "metric_name": metric_name,
-            "threshold": threshold,
-            "comparison": comparison,
-            "severity": severity,
-            "last_triggered": None,
-        }
+        if kind not in ALERT_KINDS:
+            raise ValueError(f"kind must be one of {list(ALERT_KINDS)}")
+        if statistic not in ALERT_STATISTICS:
+            raise ValueError(f"statistic must be one of {list(ALERT_STATISTICS)}")
+        if comparison not in ALERT_COMPARISONS:
+            raise ValueError(f"comparison must be one of {list(ALERT_COMPARISONS)}")
+        if kind == "burn_rate" and (latency_target is None or objective is None or not 0.0 < objective < 1.0):
+            raise ValueError("burn_rate rules need latency_target and an objective in (0, 1)")
+        if kind == "rate_of_change" and window_seconds is None:
+            window_seconds = ALERT_RATE_WINDOW_SECONDS
+        
+        rule = AlertRule(
+            metric_name=metric_name,
+            threshold=threshold,
+            comparison=comparison,
+            severity=severity,
+            kind=kind,
+            statistic=statistic,
+            window_seconds=window_seconds,
+            short_window_seconds=short_window_seconds,
+            latency_target=latency_target,
+            objective=objective,
+            cooldown_seconds=cooldown_seconds,
+        )
+        existing = self._rules_by_key.get(rule.key)
+        if existing is not None:
+            return existing
         
+        self._rules_by_key[rule.key] = rule
         self.alert_rules.append(rule)
-        logger.info(f"Alert rule added: {metric_name} {comparison} {threshold}")
+        logger.info(f"Alert rule added: {kind} {statistic}({metric_name}) {comparison} {threshold}")
+        return rule
+    
+    def remove_alert_rule(self, rule: AlertRule) -> bool:
+        """Remove a rule; False if it was not registered."""
+        
+        if self._rules_by_key.get(rule.key) is not rule:
+            return False
+        del self._rules_by_key[rule.key]
+        self.alert_rules.remove(rule)
+        return True
+    
+    def active_alerts(self) -> List[AlertRule]:
+        """Rules currently firing."""
+        return [rule for rule in self.alert_rules if rule.firing]
     
     def check_alerts(self) -> List[Dict[str, Any]]:
         """
-        Check all alert rules and return triggered alerts.
+        Check all alert rules and return new notifications.
+        
+        @description
+        A rule that starts firing is reported once; while it keeps firing
+        it is reported again only after its cooldown, with the number of
+        suppressed evaluations.  Rules whose condition clears are marked
+        resolved.  Rules without data are skipped and keep their state.
         
         @returns List of triggered alerts
+        @performance Shared per-pass cache; see class docstring
+        @sideEffects Updates rule state, alert history and logs
         """
         
+        now = self._clock()
+        cache: Dict[Tuple[Any, ...], Any] = {}
         triggered_alerts = []
         
         for rule in self.alert_rules:
-            stats = self.metrics_collector.get_performance_stats(rule["metric_name"])
-            if not stats:
+            current_value = self._evaluate(rule, rule.window_seconds, now, cache)
+            if current_value is None:
                 continue
             
-            # Use mean value for comparison
-            current_value = stats.get("mean", 0)
-            threshold = rule["threshold"]
-            comparison = rule["comparison"]
+            breached = _compare(current_value, rule.comparison, rule.threshold)
+            if breached and rule.kind == "burn_rate" and rule.short_window_seconds is not None:
+                short_value = self._evaluate(rule, rule.short_window_seconds, now, cache)
+                breached = short_value is not None and _compare(short_value, rule.comparison, rule.threshold)
             
-            # Check threshold
-            triggered = False
-            if comparison == "greater" and current_value > threshold:
-                triggered = True
-            elif comparison == "less" and current_value < threshold:
-                triggered = True
-            elif comparison == "equal" and abs(current_value - threshold) < 0.001:
-                triggered = True
+            if not breached:
+                if rule.firing:
+                    rule.firing = False
+                    rule.suppressed = 0
+                    logger.info(
+                        f"Alert resolved: {rule.metric_name}",
+                        extra={"metric_name": rule.metric_name, "kind": rule.kind,
+                               "current_value": current_value, "threshold": rule.threshold},
+                    )
+                continue
             
-            if triggered:
-                alert = {
-                    "metric_name": rule["metric_name"],
-                    "current_value": current_value,
-                    "threshold": threshold,
-                    "severity": rule["severity"],
-                    "timestamp": time.time(),
-                }
-                
-                triggered_alerts.append(alert)
-                self.alert_history.append(alert)
-                rule["last_triggered"] = time.time()
-                
-                logger.warning(
-                    f"Alert triggered: {rule['metric_name']}",
-                    extra=alert
-                )
+            if rule.firing and rule.last_triggered is not None and now - rule.last_triggered < rule.cooldown_seconds:
+                rule.suppressed += 1
+                continue
+            
+            alert = {
+                "metric_name": rule.metric_name,
+                "current_value": current_value,
+                "threshold": rule.threshold,
+                "severity": rule.severity,
+                "timestamp": now,
+                "kind": rule.kind,
+                "statistic": rule.statistic,
+                "window_seconds": rule.window_seconds,
+                "suppressed": rule.suppressed,
+            }
+            
+            triggered_alerts.append(alert)
+            self.alert_history.append(alert)
+            rule.firing = True
+            rule.last_triggered = now
+            rule.suppressed = 0
+            
+            logger.warning(
+                f"Alert triggered: {rule.metric_name}",
+                extra=alert
+            )
         
         return triggered_alerts
+    
+    # ------------------------------------------------------------------
+    # Evaluation
+    # ------------------------------------------------------------------
+    
+    def _evaluate(self, rule: AlertRule, window_seconds: Optional[float], now: float,
+                  cache: Dict[Tuple[Any, ...], Any]) -> Optional[float]:
+        if rule.kind == "burn_rate":
+            return self._burn_rate(rule, window_seconds, cache)
+        if rule.kind == "rate_of_change":
+            value = self._statistic(rule.metric_name, rule.statistic, window_seconds, cache)
+            return None if value is None else self._rate(rule, value, now)
+        return self._statistic(rule.metric_name, rule.statistic, window_seconds, cache)
+    
+    def _sketch(self, metric_name: str, window_seconds: Optional[float],
+                cache: Dict[Tuple[Any, ...], Any]) -> Optional[QuantileSketch]:
+        key = ("sketch", metric_name, window_seconds)
+        if key not in cache:
+            window = self.metrics_collector.get_performance_window(metric_name)
+            sketch = window.sketch(window_seconds) if window is not None else None
+            cache[key] = sketch if sketch is not None and sketch.count else None
+        return cache[key]
+    
+    def _statistic(self, metric_name: str, statistic: str, window_seconds: Optional[float],
+                   cache: Dict[Tuple[Any, ...], Any]) -> Optional[float]:
+        key = (statistic, metric_name, window_seconds)
+        if key in cache:
+            return cache[key]
+        
+        value: Optional[float] = None
+        if statistic == "last":
+            value = self.metrics_collector.get_latest_value(metric_name)
+        elif window_seconds is None:
+            # Whole window: the collector's cached summary
+            stats = self.metrics_collector.get_performance_stats(metric_name)
+            value = stats.get(statistic) if stats else None
+        else:
+            sketch = self._sketch(metric_name, window_seconds, cache)
+            if sketch is not None:
+                if statistic == "median":
+                    value = sketch.quantile(0.5)
+                elif statistic in ("p95", "p99"):
+                    value = sketch.quantile(int(statistic[1:]) / 100)
+                elif statistic == "mean":
+                    value = sketch.mean
+                else:
+                    value = getattr(sketch, statistic)
+        cache[key] = value
+        return value
+    
+    def _burn_rate(self, rule: AlertRule, window_seconds: Optional[float],
+                   cache: Dict[Tuple[Any, ...], Any]) -> Optional[float]:
+        key = ("burn", rule.metric_name, window_seconds, rule.latency_target)
+        if key not in cache:
+            sketch = self._sketch(rule.metric_name, window_seconds, cache)
+            cache[key] = (
+                (sketch.count - sketch.rank(rule.latency_target)) / sketch.count
+                if sketch is not None else None
+            )
+        bad_ratio = cache[key]
+        return None if bad_ratio is None else bad_ratio / (1.0 - rule.objective)
+    
+    @staticmethod
+    def _rate(rule: AlertRule, value: float, now: float) -> Optional[float]:
+        # Keep a sparse history: one point per window/_RATE_HISTORY_POINTS,
+        # plus the newest point at least one window old as the baseline.
+        history = rule.history
+        horizon = rule.window_seconds
+        if not history or now - history[-1][0] >= horizon / _RATE_HISTORY_POINTS:
+            history.append((now, value))
+        while len(history) > 1 and history[1][0] <= now - horizon:
+            history.popleft()
+        since, baseline = history[0]
+        if now <= since:
+            return None
+        return (value - baseline) / (now - since)
 
 # =============================================================================
 # GLOBAL METRICS INSTANCE
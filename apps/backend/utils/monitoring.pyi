@@ -1,37 +1,89 @@
-from typing import Any, Dict, List, Optional, Callable
+from typing import Any, Dict, List, Optional, Callable, Tuple
 import asyncio
 
+from .quantile_sketch import QuantileSketch
+
 __all__ = [
     "MetricsCollector",
     "MetricPoint",
+    "MetricRing",
     "PerformanceWindow",
     "AlertManager",
+    "AlertRule",
     "get_metrics_collector",
     "initialize_metrics",
 ]
 
 class MetricPoint: ...
 
+class MetricRing:
+    capacity: int
+    metric_type: str
+    labels: Dict[str, str]
+    def __init__(self, capacity: int = ..., metric_type: str = ..., labels: Optional[Dict[str, str]] = ...) -> None: ...
+    def __len__(self) -> int: ...
+    def append(self, timestamp: float, value: float) -> None: ...
+    def evict_before(self, cutoff: float) -> int: ...
+    def points(self) -> List[Tuple[float, float]]: ...
+    def latest(self) -> Optional[Tuple[float, float]]: ...
+
 class PerformanceWindow:
-    window_size: int
-    values: Any
+    window_seconds: float
+    slices: int
+    relative_accuracy: float
+    def __init__(self, window_seconds: float = ..., slices: int = ..., relative_accuracy: float = ..., clock: Callable[[], float] = ...) -> None: ...
     def add(self, value: float) -> None: ...
+    def merge(self, other: PerformanceWindow) -> None: ...
+    def sketch(self, window_seconds: Optional[float] = ...) -> QuantileSketch: ...
     def get_stats(self) -> Dict[str, float]: ...
+    def to_dict(self) -> Dict[str, Any]: ...
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> PerformanceWindow: ...
 
 class MetricsCollector:
     def __init__(self, service_name: str): ...
     def record_metric(self, name: str, value: float, labels: Optional[Dict[str, str]] = ..., metric_type: str = ...) -> None: ...
+    def get_metric_points(self, name: str, labels: Optional[Dict[str, str]] = ...) -> List[MetricPoint]: ...
     def record_request_duration(self, method: str, endpoint: str, status_code: int, duration: float) -> None: ...
     def record_trading_operation(self, operation_type: str, symbol: str, status: str, duration: Optional[float] = ...) -> None: ...
     def record_error(self, endpoint: str, error_type: str, component: str = ...) -> None: ...
+    def get_latest_value(self, name: str, labels: Optional[Dict[str, str]] = ...) -> Optional[float]: ...
     def get_performance_stats(self, metric_name: str) -> Optional[Dict[str, float]]: ...
+    def get_performance_window(self, metric_name: str) -> Optional[PerformanceWindow]: ...
     def get_prometheus_metrics(self) -> str: ...
     def start_background_tasks(self) -> None: ...
     def stop_background_tasks(self) -> None: ...
 
+ALERT_KINDS: Tuple[str, ...]
+ALERT_STATISTICS: Tuple[str, ...]
+ALERT_COMPARISONS: Tuple[str, ...]
+ALERT_COOLDOWN_SECONDS: float
+ALERT_RATE_WINDOW_SECONDS: float
+
+class AlertRule:
+    metric_name: str
+    threshold: float
+    comparison: str
+    severity: str
+    kind: str
+    statistic: str
+    window_seconds: Optional[float]
+    short_window_seconds: Optional[float]
+    latency_target: Optional[float]
+    objective: Optional[float]
+    cooldown_seconds: float
+    firing: bool
+    last_triggered: Optional[float]
+    suppressed: int
+    @property
+    def key(self) -> Tuple[Any, ...]: ...
+
 class AlertManager:
-    def __init__(self, metrics_collector: MetricsCollector): ...
-    def add_alert_rule(self, metric_name: str, threshold: float, comparison: str = ..., severity: str = ...) -> None: ...
+    alert_rules: List[AlertRule]
+    def __init__(self, metrics_collector: MetricsCollector, clock: Callable[[], float] = ...): ...
+    def add_alert_rule(self, metric_name: str, threshold: float, comparison: str = ..., severity: str = ..., *, kind: str = ..., statistic: str = ..., window_seconds: Optional[float] = ..., short_window_seconds: Optional[float] = ..., latency_target: Optional[float] = ..., objective: Optional[float] = ..., cooldown_seconds: float = ...) -> AlertRule: ...
+    def remove_alert_rule(self, rule: AlertRule) -> bool: ...
+    def active_alerts(self) -> List[AlertRule]: ...
     def check_alerts(self) -> List[Dict[str, Any]]: ...
 
 
@@ -0,0 +1,22 @@
+from typing import Any, Callable, List, Optional, Sequence, Tuple, TypeVar
+
+from sqlalchemy.sql import ColumnElement
+
+__all__ = [
+    "CURSOR_VERSION",
+    "encode_cursor",
+    "decode_cursor",
+    "keyset_filter",
+    "keyset_order",
+    "split_page",
+]
+
+T = TypeVar("T")
+
+CURSOR_VERSION: int
+
+def encode_cursor(key: Sequence[Any]) -> str: ...
+def decode_cursor(cursor: str, arity: int, types: Optional[Sequence[type]] = ...) -> Tuple[Any, ...]: ...
+def keyset_filter(columns: Sequence[ColumnElement], key: Sequence[Any]) -> ColumnElement: ...
+def keyset_order(columns: Sequence[ColumnElement]) -> List[Any]: ...
+def split_page(rows: Sequence[T], limit: int, key: Callable[[T], Sequence[Any]]) -> Tuple[List[T], Optional[str]]: ...
@@ -0,0 +1,25 @@
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from prometheus_client import CollectorRegistry
+
+from utils.exceptions import RateLimitError
+
+__all__ = [
+    "PasswordHashExecutor",
+    "PasswordHashQueueFull",
+]
+
+T = TypeVar("T")
+
+class PasswordHashQueueFull(RateLimitError):
+    retry_after: int
+    def __init__(self, waiting: int, retry_after: int = ...) -> None: ...
+
+class PasswordHashExecutor:
+    max_workers: int
+    max_queue: int
+    rejected: int
+    def __init__(self, max_workers: Optional[int] = ..., max_queue: int = ..., registry: CollectorRegistry = ...) -> None: ...
+    async def run(self, operation: str, fn: Callable[..., T], *args: Any) -> T: ...
+    def shutdown(self, wait: bool = ...) -> None: ...
+    def stats(self) -> Dict[str, Any]: ...
@@ -0,0 +1,25 @@
+from typing import Any, Dict, Tuple
+
+__all__ = [
+    "SamplingProfiler",
+    "PROFILE_FORMATS",
+]
+
+PROFILE_FORMATS: Tuple[str, ...]
+
+class SamplingProfiler:
+    interval: float
+    max_overhead: float
+    include_idle: bool
+    samples: int
+    sampling_seconds: float
+    started_at: float
+    duration: float
+    def __init__(self, interval: float = ..., max_overhead: float = ..., include_idle: bool = ...) -> None: ...
+    def start(self) -> None: ...
+    def stop(self) -> None: ...
+    @property
+    def overhead(self) -> float: ...
+    def collapsed(self) -> str: ...
+    def speedscope(self, name: str = ...) -> Dict[str, Any]: ...
+    def summary(self) -> Dict[str, Any]: ...
@@ -0,0 +1,267 @@
+"""
+@fileoverview Mergeable streaming quantile sketch (log-bucket histogram)
+@module backend.utils.quantile_sketch
+
+@description
+Relative-error quantile sketch in the style of DDSketch / HDR histograms.
+Every value is mapped to a logarithmic bucket ``ceil(log_gamma(|v|))`` with
+``gamma = (1 + a) / (1 - a)`` so any reported quantile is within a relative
+error *a* (default 1 %) of the true value.  Buckets are plain counters, so
+two sketches with the same accuracy merge exactly by adding counts – the
+basis for combining time slices and for aggregating across workers.
+
+Exact ``count``, ``sum``, ``min`` and ``max`` are tracked alongside the
+buckets so mean and extremes carry no approximation error.
+
+@performance
+- Insert: O(1) (one log + one dict increment)
+- Quantile: O(buckets log buckets); ~900 buckets cover 1 µs – 100 s at 1 %
+- Memory: bounded by `max_buckets` (lowest buckets are collapsed beyond it)
+
+@risk
+- Failure impact: LOW - monitoring only
+- Recovery strategy: None needed; sketches are rebuilt from new samples
+
+@since 1.0.0-alpha
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any, Dict, Iterator, Tuple
+
+__all__ = [
+    "QuantileSketch",
+]
+
+DEFAULT_RELATIVE_ACCURACY = 0.01
+DEFAULT_MAX_BUCKETS = 2048
+_MIN_INDEXABLE = 1e-12  # |v| below this counts as zero
+
+
+class QuantileSketch:
+    """
+    Log-bucket quantile sketch with bounded relative error.
+
+    @description
+    Supports negative, zero and positive values.  Sketches built with the
+    same `relative_accuracy` can be merged losslessly.
+
+    @tradingImpact LOW - Latency percentiles for monitoring
+    @riskLevel LOW - Pure data structure
+    """
+
+    __slots__ = (
+        "relative_accuracy",
+        "max_buckets",
+        "_gamma",
+        "_inv_log_gamma",
+        "_positive",
+        "_negative",
+        "zero_count",
+        "count",
+        "sum",
+        "min",
+        "max",
+    )
+
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+                 max_buckets: int = DEFAULT_MAX_BUCKETS) -> None:
+        if not 0.0 < relative_accuracy < 1.0:
+            raise ValueError("relative_accuracy must be in (0, 1)")
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self._gamma = (1.0 + relative_accuracy) / (1.0 - relative_accuracy)
+        self._inv_log_gamma = 1.0 / math.log(self._gamma)
+        self._positive: Dict[int, int] = {}
+        self._negative: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def add(self, value: float) -> None:
+        """
+        Record one value.
+
+        @param value Sample to record
+        @performance O(1)
+        @sideEffects Mutates the sketch
+        """
+
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+        if value > _MIN_INDEXABLE:
+            store = self._positive
+        elif value < -_MIN_INDEXABLE:
+            store = self._negative
+            value = -value
+        else:
+            self.zero_count += 1
+            return
+        idx = math.ceil(math.log(value) * self._inv_log_gamma)
+        store[idx] = store.get(idx, 0) + 1
+        if len(store) > self.max_buckets:
+            self._collapse(store)
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """
+        Add every sample of *other* into this sketch.
+
+        @param other Sketch built with the same relative accuracy
+        @throws ValueError if the accuracies differ
+        @performance O(buckets of other)
+        @sideEffects Mutates the sketch
+        """
+
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("cannot merge sketches with different relative accuracy")
+        if not other.count:
+            return
+        for mine, theirs in ((self._positive, other._positive), (self._negative, other._negative)):
+            for idx, n in theirs.items():
+                mine[idx] = mine.get(idx, 0) + n
+            if len(mine) > self.max_buckets:
+                self._collapse(mine)
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def _collapse(self, store: Dict[int, int]) -> None:
+        # Fold the smallest-magnitude buckets together; keeps the tail exact
+        keys = sorted(store)
+        excess = len(keys) - self.max_buckets
+        target = keys[excess]
+        for idx in keys[:excess]:
+            store[target] += store.pop(idx)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    def _value(self, idx: int) -> float:
+        # Midpoint (in relative terms) of bucket (gamma^(idx-1), gamma^idx]
+        return 2.0 * self._gamma ** idx / (self._gamma + 1.0)
+
+    def _ordered(self) -> Iterator[Tuple[float, int]]:
+        for idx in sorted(self._negative, reverse=True):
+            yield -self._value(idx), self._negative[idx]
+        if self.zero_count:
+            yield 0.0, self.zero_count
+        for idx in sorted(self._positive):
+            yield self._value(idx), self._positive[idx]
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate the *q*-quantile (0 ≤ q ≤ 1).
+
+        @param q Quantile to estimate
+        @returns Value within `relative_accuracy` of the true quantile
+            (0.0 for an empty sketch)
+        @performance O(buckets log buckets)
+        @sideEffects None
+        """
+
+        if not self.count:
+            return 0.0
+        if q <= 0.0:
+            return self.min
+        if q >= 1.0:
+            return self.max
+        rank = q * (self.count - 1)
+        seen = 0
+        for value, n in self._ordered():
+            seen += n
+            if seen > rank:
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def rank(self, value: float) -> int:
+        """
+        Approximate number of samples ``<= value``.
+
+        @param value Threshold to count against
+        @returns Sample count at or below *value*; bucket-granular, so a
+            threshold within `relative_accuracy` of a sample may land on
+            either side of it (exact below `min` / at or above `max`)
+        @performance O(buckets log buckets)
+        @sideEffects None
+        """
+
+        if not self.count or value < self.min:
+            return 0
+        if value >= self.max:
+            return self.count
+        seen = 0
+        for bucket, n in self._ordered():
+            if bucket > value:
+                break
+            seen += n
+        return seen
+
+    def quantiles(self, qs: Tuple[float, ...]) -> Tuple[float, ...]:
+        """Estimate several quantiles in a single pass over the buckets."""
+
+        if not self.count:
+            return tuple(0.0 for _ in qs)
+        order = sorted(range(len(qs)), key=lambda i: qs[i])
+        results = [0.0] * len(qs)
+        pending = iter(order)
+        current = next(pending, None)
+        seen = 0
+        for value, n in self._ordered():
+            seen += n
+            while current is not None and seen > qs[current] * (self.count - 1):
+                results[current] = min(max(value, self.min), self.max)
+                current = next(pending, None)
+            if current is None:
+                break
+        while current is not None:
+            results[current] = self.max
+            current = next(pending, None)
+        return tuple(results)
+
+    # ------------------------------------------------------------------
+    # Serialisation (cross-worker aggregation)
+    # ------------------------------------------------------------------
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "positive": {str(k): v for k, v in self._positive.items()},
+            "negative": {str(k): v for k, v in self._negative.items()},
+            "zero_count": self.zero_count,
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "QuantileSketch":
+        sketch = cls(relative_accuracy=data["relative_accuracy"])
+        sketch._positive = {int(k): int(v) for k, v in data.get("positive", {}).items()}
+        sketch._negative = {int(k): int(v) for k, v in data.get("negative", {}).items()}
+        sketch.zero_count = int(data.get("zero_count", 0))
+        sketch.count = int(data.get("count", 0))
+        sketch.sum = float(data.get("sum", 0.0))
+        if sketch.count:
+            sketch.min = float(data["min"])
+            sketch.max = float(data["max"])
+        return sketch
@@ -0,0 +1,25 @@
+from typing import Any, Dict, Tuple
+
+__all__ = [
+    "QuantileSketch",
+]
+
+class QuantileSketch:
+    relative_accuracy: float
+    max_buckets: int
+    zero_count: int
+    count: int
+    sum: float
+    min: float
+    max: float
+    def __init__(self, relative_accuracy: float = ..., max_buckets: int = ...) -> None: ...
+    def add(self, value: float) -> None: ...
+    def merge(self, other: QuantileSketch) -> None: ...
+    @property
+    def mean(self) -> float: ...
+    def quantile(self, q: float) -> float: ...
+    def rank(self, value: float) -> int: ...
+    def quantiles(self, qs: Tuple[float, ...]) -> Tuple[float, ...]: ...
+    def to_dict(self) -> Dict[str, Any]: ...
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> QuantileSketch: ...
@@ -0,0 +1,63 @@
+from typing import Any, Callable, NamedTuple, Optional, Tuple
+
+from prometheus_client import CollectorRegistry
+
+from utils.exceptions import RateLimitError
+
+__all__ = [
+    "LocalRateLimitBackend",
+    "RateLimitDecision",
+    "RateLimitExceeded",
+    "RateLimitRule",
+    "RateLimiter",
+    "RedisRateLimitBackend",
+]
+
+class RateLimitRule:
+    name: str
+    limit: int
+    period: float
+    burst: int
+    interval: float
+    tolerance: float
+    def __init__(self, name: str, limit: int, period: float, burst: Optional[int] = ...) -> None: ...
+
+class RateLimitDecision(NamedTuple):
+    allowed: bool
+    remaining: int
+    retry_after: float
+
+class RateLimitExceeded(RateLimitError):
+    rule: RateLimitRule
+    retry_after: int
+    def __init__(self, rule: RateLimitRule, retry_after: float) -> None: ...
+
+class LocalRateLimitBackend:
+    max_keys: int
+    def __init__(self, max_keys: int = ..., clock: Callable[[], float] = ...) -> None: ...
+    def __len__(self) -> int: ...
+    def hit_nowait(self, key: str, interval: float, tolerance: float) -> Tuple[bool, float, float]: ...
+    async def hit(self, key: str, interval: float, tolerance: float) -> Tuple[bool, float, float]: ...
+    def clear(self) -> None: ...
+
+class RedisRateLimitBackend:
+    def __init__(self, client: Any, prefix: str = ...) -> None: ...
+    @classmethod
+    def from_url(cls, url: str, **kwargs: Any) -> RedisRateLimitBackend: ...
+    async def hit(self, key: str, interval: float, tolerance: float) -> Tuple[bool, float, float]: ...
+    async def close(self) -> None: ...
+
+class RateLimiter:
+    backend: Any
+    fallback: LocalRateLimitBackend
+    enabled: bool
+    def __init__(
+        self,
+        backend: Optional[Any] = ...,
+        fallback: Optional[LocalRateLimitBackend] = ...,
+        enabled: bool = ...,
+        registry: CollectorRegistry = ...,
+    ) -> None: ...
+    async def hit(self, rule: RateLimitRule, key: str) -> RateLimitDecision: ...
+    async def check(self, rule: RateLimitRule, key: str) -> RateLimitDecision: ...
+    async def close(self) -> None: ...
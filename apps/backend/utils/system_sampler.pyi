@@ -0,0 +1,22 @@
+from typing import Any, Callable, Dict, Optional
+
+import psutil
+
+__all__ = [
+    "ProcessCpuTracker",
+    "SystemMetricsSampler",
+]
+
+class ProcessCpuTracker:
+    def __init__(self, process: Optional[psutil.Process] = ...) -> None: ...
+    def sample(self) -> Dict[str, Any]: ...
+
+class SystemMetricsSampler:
+    interval: float
+    def __init__(self, collect: Callable[[], Dict[str, Any]], interval: float = ...) -> None: ...
+    @property
+    def running(self) -> bool: ...
+    def start(self) -> None: ...
+    async def stop(self) -> None: ...
+    def snapshot(self) -> Optional[Dict[str, Any]]: ...
+    async def sample_now(self) -> Dict[str, Any]: ...
@@ -0,0 +1,30 @@
+from typing import Any, Callable, Dict, Optional
+
+from prometheus_client import CollectorRegistry
+
+__all__ = [
+    "TokenVerificationCache",
+]
+
+class TokenVerificationCache:
+    maxsize: int
+    ttl: float
+    is_revoked: Optional[Callable[[Dict[str, Any]], bool]]
+    hits: int
+    misses: int
+    def __init__(
+        self,
+        maxsize: int = ...,
+        ttl: float = ...,
+        is_revoked: Optional[Callable[[Dict[str, Any]], bool]] = ...,
+        clock: Callable[[], float] = ...,
+        registry: CollectorRegistry = ...,
+    ) -> None: ...
+    def __len__(self) -> int: ...
+    @property
+    def enabled(self) -> bool: ...
+    def get(self, token: str) -> Optional[Dict[str, Any]]: ...
+    def put(self, token: str, payload: Dict[str, Any]) -> None: ...
+    def discard(self, token: str) -> None: ...
+    def clear(self) -> None: ...
+    def stats(self) -> Dict[str, Any]: ...
@@ -0,0 +1,32 @@
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from prometheus_client import CollectorRegistry
+
+__all__ = [
+    "REVOCATION_NOTIFY_CHANNEL",
+    "TokenRevocationIndex",
+    "TokenRevocationListener",
+]
+
+REVOCATION_NOTIFY_CHANNEL: str
+
+class TokenRevocationIndex:
+    purge_interval: float
+    def __init__(
+        self,
+        purge_interval: float = ...,
+        clock: Callable[[], float] = ...,
+        registry: CollectorRegistry = ...,
+    ) -> None: ...
+    def __len__(self) -> int: ...
+    def is_revoked(self, jti: Optional[str]) -> bool: ...
+    def revoke(self, jti: str, expires_at: float, *, source: str = ...) -> None: ...
+    def merge(self, entries: Iterable[Tuple[str, float]]) -> None: ...
+    def purge(self, now: Optional[float] = ...) -> None: ...
+    def stats(self) -> Dict[str, Any]: ...
+
+class TokenRevocationListener:
+    def __init__(self, index: TokenRevocationIndex, dsn: str, *, channel: str = ...) -> None: ...
+    def start(self) -> None: ...
+    async def stop(self) -> None: ...
+    def handle_notification(self, payload: str) -> None: ...
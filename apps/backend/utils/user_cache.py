@@ -0,0 +1,290 @@
+"""
+@fileoverview In-process cache of user records for authentication
+@module backend.utils.user_cache
+
+@description
+`authenticate_user` looked every login attempt up with
+``SELECT ... FROM users WHERE username = $1``; a client retrying a wrong
+or unknown username turned straight into database load.
+`UserRecordCache` keeps the looked-up rows:
+
+- **positive** entries (the row) for `ttl` seconds
+- **negative** entries (no such user) for `negative_ttl` seconds, so
+  repeated unknown usernames never reach the database
+- `invalidate(username)` on role / password / activation changes;
+  `UserCacheListener` applies changes made by other processes, announced
+  on the ``users_changed`` NOTIFY channel (migration 0004)
+- least recently used entries are evicted beyond `maxsize`
+
+The password is still verified with bcrypt on every attempt; only the
+row lookup is cached.
+
+@performance
+- Hit: one dict lookup instead of a pool checkout plus a query
+
+@risk
+- Failure impact: MEDIUM - A changed password/role is seen after at most
+  `ttl` if the NOTIFY feed is down
+- Recovery strategy: AUTH_USER_CACHE_TTL_SEC=0 disables the cache
+
+@since 1.0.0-alpha
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import sys
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from prometheus_client import CollectorRegistry, Counter, Gauge
+from prometheus_client.core import REGISTRY
+
+__all__ = [
+    "MISSING",
+    "USER_NOTIFY_CHANNEL",
+    "UserCacheListener",
+    "UserRecordCache",
+]
+
+USER_NOTIFY_CHANNEL = "users_changed"
+
+
+class _Missing:
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "MISSING"
+
+
+# Returned by `UserRecordCache.get` when the database must be asked
+MISSING: Any = _Missing()
+
+
+class UserRecordCache:
+    """
+    Username -> user row (or None for unknown users) with TTLs.
+
+    @description
+    Not thread-safe: use it from the event loop.  Usernames are matched
+    exactly, like the ``WHERE username = $1`` lookup they replace.
+
+    @tradingImpact MEDIUM - Login latency and database load
+    @riskLevel MEDIUM - Stale rows bounded by ttl and invalidation
+    """
+
+    def __init__(
+        self,
+        ttl: float = 30.0,
+        negative_ttl: float = 10.0,
+        maxsize: int = 10000,
+        clock: Callable[[], float] = time.monotonic,
+        registry: CollectorRegistry = REGISTRY,
+    ) -> None:
+        if ttl < 0 or negative_ttl < 0 or maxsize < 0:
+            raise ValueError("ttl, negative_ttl and maxsize must be >= 0")
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.maxsize = maxsize
+        self._clock = clock
+        # username -> (row or None, expires_at)
+        self._entries: "OrderedDict[str, Tuple[Optional[Dict[str, Any]], float]]" = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+        self._requests = Counter(
+            "traider_auth_user_cache_requests_total",
+            "User cache lookups by result",
+            ["result"],  # hit | negative_hit | miss | expired
+            registry=registry,
+        )
+        self._evictions = Counter(
+            "traider_auth_user_cache_evictions_total",
+            "User records evicted from the cache to stay within maxsize",
+            registry=registry,
+        )
+        self._invalidations = Counter(
+            "traider_auth_user_cache_invalidations_total",
+            "User cache entries dropped by explicit invalidation",
+            registry=registry,
+        )
+        self._size = Gauge(
+            "traider_auth_user_cache_size",
+            "User records (and unknown usernames) currently cached",
+            registry=registry,
+        )
+        self._size.set_function(lambda: len(self._entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxsize > 0 and (self.ttl > 0 or self.negative_ttl > 0)
+
+    def get(self, username: str) -> Any:
+        """
+        Cached row, ``None`` for a cached unknown user, or `MISSING`.
+
+        @performance O(1)
+        @sideEffects Refreshes LRU order; drops expired entries
+        """
+
+        if not self.enabled:
+            return MISSING
+        entry = self._entries.get(username)
+        if entry is None:
+            self.misses += 1
+            self._requests.labels("miss").inc()
+            return MISSING
+        row, expires_at = entry
+        if self._clock() >= expires_at:
+            del self._entries[username]
+            self.misses += 1
+            self._requests.labels("expired").inc()
+            return MISSING
+        self._entries.move_to_end(username)
+        self.hits += 1
+        self._requests.labels("hit" if row is not None else "negative_hit").inc()
+        return row
+
+    def put(self, username: str, row: Optional[Dict[str, Any]]) -> None:
+        """Remember a lookup result; ``None`` caches "no such user"."""
+
+        ttl = self.ttl if row is not None else self.negative_ttl
+        if ttl <= 0 or self.maxsize == 0:
+            return
+        self._entries[username] = (row, self._clock() + ttl)
+        self._entries.move_to_end(username)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self._evictions.inc()
+
+    def invalidate(self, username: str) -> None:
+        """Forget *username* (role, password or activation changed, user created)."""
+        if self._entries.pop(username, None) is not None:
+            self._invalidations.inc()
+
+    def clear(self) -> None:
+        """Drop every entry (e.g. after reconnecting to the NOTIFY feed)."""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "negative": sum(1 for row, _ in self._entries.values() if row is None),
+            "maxsize": self.maxsize,
+            "ttl_seconds": self.ttl,
+            "negative_ttl_seconds": self.negative_ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+# ---------------------------------------------------------------------------
+# LISTEN/NOTIFY feed
+# ---------------------------------------------------------------------------
+
+class UserCacheListener:
+    """Background task that invalidates a :class:`UserRecordCache` via Postgres NOTIFY.
+
+    Payloads are ``{"usernames": [...]}`` as sent by the ``users_changed``
+    trigger (old and new name on renames).  While disconnected the cache is
+    cleared on every reconnect, since changes may have been missed.
+    """
+
+    _MAX_BACKOFF_SEC: int = 30
+
+    def __init__(self, cache: UserRecordCache, dsn: str, *, channel: str = USER_NOTIFY_CHANNEL) -> None:
+        self._cache = cache
+        self._dsn = dsn
+        self._channel = channel
+        self._logger = logging.getLogger(__name__)
+
+        self._task: asyncio.Task[None] | None = None
+        self._stop_event = asyncio.Event()
+
+    # ------------------------------------------------------------------
+    # Public control API
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        if self._task and not self._task.done():
+            raise RuntimeError("UserCacheListener already running")
+
+        # Same short-circuit as database.create_connection_pool – no live DB under pytest
+        if "pytest" in sys.modules and os.getenv("TRAIDER_ALLOW_DB_IN_TESTS", "0") != "1":
+            self._logger.debug("🧪 Skipping user cache listener during test execution")
+            return
+
+        self._stop_event.clear()
+        self._task = asyncio.create_task(self._run(), name="user-cache-listener")
+
+    async def stop(self) -> None:
+        self._stop_event.set()
+        if self._task:
+            await self._task
+
+    # ------------------------------------------------------------------
+    # Notification handling
+    # ------------------------------------------------------------------
+
+    def handle_notification(self, payload: str) -> None:
+        """Apply one NOTIFY payload to the cache."""
+
+        try:
+            usernames = json.loads(payload).get("usernames") or []
+        except (TypeError, ValueError, AttributeError):
+            self._cache.clear()  # unreadable: be safe
+            return
+        for username in usernames:
+            if isinstance(username, str):
+                self._cache.invalidate(username)
+
+    def _on_notify(self, _conn: Any, _pid: int, _channel: str, payload: str) -> None:
+        self.handle_notification(payload)
+
+    # ------------------------------------------------------------------
+    # Internal loop
+    # ------------------------------------------------------------------
+
+    async def _run(self) -> None:
+        import asyncpg  # local import – only needed when the listener runs
+
+        backoff = 1
+        while not self._stop_event.is_set():
+            conn = None
+            lost = asyncio.Event()
+            try:
+                conn = await asyncpg.connect(self._dsn)
+                conn.add_termination_listener(lambda _c: lost.set())
+                await conn.add_listener(self._channel, self._on_notify)
+                self._cache.clear()  # anything cached before (re)connecting may be stale
+                self._logger.info("User cache listening on channel %s", self._channel)
+                backoff = 1
+
+                stop_wait = asyncio.create_task(self._stop_event.wait())
+                lost_wait = asyncio.create_task(lost.wait())
+                await asyncio.wait({stop_wait, lost_wait}, return_when=asyncio.FIRST_COMPLETED)
+                stop_wait.cancel()
+                lost_wait.cancel()
+            except Exception as exc:  # noqa: BLE001
+                self._logger.warning("User cache listener error: %s – reconnect in %s s", exc, backoff)
+            finally:
+                if conn is not None and not conn.is_closed():
+                    await conn.close()
+
+            if self._stop_event.is_set():
+                break
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), timeout=backoff)
+            except asyncio.TimeoutError:
+                pass
+            backoff = min(backoff * 2, self._MAX_BACKOFF_SEC)
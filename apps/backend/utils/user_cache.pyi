@@ -0,0 +1,42 @@
+from typing import Any, Callable, Dict, Optional
+
+from prometheus_client import CollectorRegistry
+
+__all__ = [
+    "MISSING",
+    "USER_NOTIFY_CHANNEL",
+    "UserCacheListener",
+    "UserRecordCache",
+]
+
+USER_NOTIFY_CHANNEL: str
+MISSING: Any
+
+class UserRecordCache:
+    ttl: float
+    negative_ttl: float
+    maxsize: int
+    hits: int
+    misses: int
+    def __init__(
+        self,
+        ttl: float = ...,
+        negative_ttl: float = ...,
+        maxsize: int = ...,
+        clock: Callable[[], float] = ...,
+        registry: CollectorRegistry = ...,
+    ) -> None: ...
+    def __len__(self) -> int: ...
+    @property
+    def enabled(self) -> bool: ...
+    def get(self, username: str) -> Any: ...
+    def put(self, username: str, row: Optional[Dict[str, Any]]) -> None: ...
+    def invalidate(self, username: str) -> None: ...
+    def clear(self) -> None: ...
+    def stats(self) -> Dict[str, Any]: ...
+
+class UserCacheListener:
+    def __init__(self, cache: UserRecordCache, dsn: str, *, channel: str = ...) -> None: ...
+    def start(self) -> None: ...
+    async def stop(self) -> None: ...
+    def handle_notification(self, payload: str) -> None: ...
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+@fileoverview Benchmark multi-symbol batch reads vs the per-symbol loop
+@module scripts.bench_market_data_batch
+
+@description
+Times one "portfolio refresh" (latest tick for *symbols* products) through
+the market-data service ASGI app, in-process over httpx:
+
+- ``loop``          – one ``GET /market-data/{symbol}`` per symbol, sequential
+- ``loop-gather``   – the same requests issued concurrently
+- ``batch``         – one ``GET /market-data?symbols=...`` (single LATERAL query)
+- ``batch-cached``  – the batch call answered by a live, primed tick cache
+
+By default the database is simulated: each connection checkout costs
+``--acquire-ms`` and each statement ``--rtt-ms``, which is where the
+per-symbol loop spends its time in production.  Pass ``--live`` to use the
+configured ``DATABASE_URL`` instead.
+
+Usage:
+
+$ python -m scripts.bench_market_data_batch --symbols 50 --rtt-ms 0.8
+
+@performance
+- Reports mean/p95 ms per refresh and DB round trips per refresh
+
+@risk
+- Failure impact: NONE – developer tooling only
+
+@since 1.0.0-alpha
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib.util
+import logging
+import statistics
+import sys
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import scripts.bootstrap  # noqa: F401 – ensure repo root on sys.path
+
+# Backend modules use top-level imports (``database``, ``models``) like the service
+sys.path.insert(0, str(scripts.bootstrap.ROOT_PATH / "apps" / "backend"))
+
+import httpx  # noqa: E402
+
+_SERVICE_MAIN = scripts.bootstrap.ROOT_PATH / "services" / "market-data-service" / "main.py"
+_BASE = datetime(2025, 7, 5, tzinfo=timezone.utc)
+
+
+def _load_service():
+    spec = importlib.util.spec_from_file_location("market_data_service_main", _SERVICE_MAIN)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)  # type: ignore[union-attr]
+    return module
+
+
+class _SimResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self._rows
+
+
+class _SimConnection:
+    """Stands in for an AsyncConnection: fixed latency per statement."""
+
+    def __init__(self, model, rtt: float, counter: list) -> None:
+        self._model = model
+        self._rtt = rtt
+        self._counter = counter
+
+    async def execute(self, stmt):
+        self._counter[0] += 1
+        params = stmt.compile().params
+        symbols = params["symbols"] if "symbols" in params else [params["symbol_1"]]
+        await asyncio.sleep(self._rtt)
+        return _SimResult([
+            self._model(timestamp=_BASE, symbol=symbol, price=Decimal("100.5"), volume=Decimal("1"))
+            for symbol in symbols
+        ])
+
+
+async def _refresh(client: httpx.AsyncClient, mode: str, symbols: list) -> None:
+    if mode == "loop":
+        for symbol in symbols:
+            (await client.get(f"/market-data/{symbol}")).raise_for_status()
+    elif mode == "loop-gather":
+        responses = await asyncio.gather(*(client.get(f"/market-data/{symbol}") for symbol in symbols))
+        for resp in responses:
+            resp.raise_for_status()
+    else:
+        (await client.get("/market-data", params={"symbols": ",".join(symbols)})).raise_for_status()
+
+
+async def _run(args: argparse.Namespace) -> None:
+    service = _load_service()
+    logging.getLogger("httpx").setLevel(logging.WARNING)  # per-request INFO lines skew timings
+    round_trips = [0]
+    if not args.live:
+        @asynccontextmanager
+        async def _open():
+            await asyncio.sleep(args.acquire_ms / 1000)
+            yield _SimConnection(service.MarketData, args.rtt_ms / 1000, round_trips)
+
+        service.app.dependency_overrides[service.db_factory] = lambda: _open
+
+    symbols = [f"SYM{i}-USD" for i in range(args.symbols)]
+    transport = httpx.ASGITransport(app=service.app)
+    print(f"{'mode':<13} {'mean ms':>8} {'p95 ms':>8} {'DB trips':>9}")
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for mode in ("loop", "loop-gather", "batch", "batch-cached"):
+            service.tick_cache.set_live(mode == "batch-cached")
+            if mode == "batch-cached":
+                await _refresh(client, "batch", symbols)  # prime
+            timings = []
+            round_trips[0] = 0
+            for _ in range(args.iterations):
+                started = time.perf_counter()
+                await _refresh(client, mode, symbols)
+                timings.append((time.perf_counter() - started) * 1000)
+            p95 = statistics.quantiles(timings, n=20)[-1] if len(timings) > 1 else timings[0]
+            trips = round_trips[0] / args.iterations if not args.live else float("nan")
+            print(f"{mode:<13} {statistics.mean(timings):>8.2f} {p95:>8.2f} {trips:>9.1f}")
+    service.tick_cache.set_live(False)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--symbols", type=int, default=50)
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--rtt-ms", type=float, default=0.8, help="simulated statement round trip")
+    parser.add_argument("--acquire-ms", type=float, default=0.2, help="simulated connection checkout")
+    parser.add_argument("--live", action="store_true", help="use the configured DATABASE_URL")
+    asyncio.run(_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
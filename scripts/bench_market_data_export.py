@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+@fileoverview Benchmark market-data export paths (JSON vs streaming encoders)
+@module scripts.bench_market_data_export
+
+@description
+Compares the legacy JSON path (materialise ORM rows → ``to_dict()`` → one
+JSON document) against the streaming NDJSON / Arrow IPC / Parquet encoders
+used by ``GET /market-data/{symbol}/export``.  Rows are synthesised in
+batches so no database is needed.  Each format runs in its own interpreter so
+the reported peak RSS (``ru_maxrss``) is not polluted by the other runs.
+
+Usage:
+
+$ python -m scripts.bench_market_data_export --rows 1000000
+
+@performance
+- Reports MB/s of encoded output and peak RSS per format
+
+@risk
+- Failure impact: NONE – developer tooling only
+
+@since 1.0.0-alpha
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import resource
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import scripts.bootstrap  # noqa: F401 – ensure repo root on sys.path
+
+# Backend modules use top-level imports (``database``, ``models``) like the service
+sys.path.insert(0, str(scripts.bootstrap.ROOT_PATH / "apps" / "backend"))
+
+FORMATS = ("json", "ndjson", "arrow", "parquet")
+BATCH_SIZE = 10_000
+_BASE = datetime(2025, 7, 5, tzinfo=timezone.utc)
+
+
+def _batch(offset: int, size: int):
+    return [
+        (
+            _BASE + timedelta(milliseconds=offset + i),
+            "BTC-USD",
+            Decimal("30000.12345678") + i,
+            Decimal("0.015"),
+            Decimal("30000.1"),
+            Decimal("30000.2"),
+            Decimal("0.1"),
+            1,
+            None,
+        )
+        for i in range(size)
+    ]
+
+
+def _run_json(rows: int) -> int:
+    """Legacy path: every row becomes an ORM object, then a dict, then one JSON body."""
+
+    from models.market_data import MarketData
+    from services.market_data.export import EXPORT_COLUMNS
+
+    objects = []
+    for offset in range(0, rows, BATCH_SIZE):
+        for row in _batch(offset, min(BATCH_SIZE, rows - offset)):
+            objects.append(MarketData(**dict(zip(EXPORT_COLUMNS, row))))
+    body = json.dumps({"data": [obj.to_dict() for obj in objects]}).encode()
+    return len(body)
+
+
+def _run_streaming(fmt: str, rows: int) -> int:
+    from services.market_data.export import encode_batches
+
+    async def _source():
+        for offset in range(0, rows, BATCH_SIZE):
+            yield _batch(offset, min(BATCH_SIZE, rows - offset))
+
+    async def _drain() -> int:
+        total = 0
+        async for chunk in encode_batches(_source(), fmt):
+            total += len(chunk)  # bytes are dropped, as a socket write would
+        return total
+
+    return asyncio.run(_drain())
+
+
+def _single(fmt: str, rows: int) -> dict:
+    start = time.perf_counter()
+    size = _run_json(rows) if fmt == "json" else _run_streaming(fmt, rows)
+    elapsed = time.perf_counter() - start
+    return {
+        "format": fmt,
+        "rows": rows,
+        "bytes": size,
+        "seconds": round(elapsed, 3),
+        "mb_per_s": round(size / 1_048_576 / elapsed, 2),
+        "rows_per_s": int(rows / elapsed),
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--format", choices=FORMATS, help="run a single format (internal)")
+    args = parser.parse_args()
+
+    if args.format:
+        print(json.dumps(_single(args.format, args.rows)))
+        return
+
+    print(f"{'format':<8} {'rows':>9} {'MB':>8} {'MB/s':>8} {'rows/s':>10} {'peak RSS MB':>12}")
+    for fmt in FORMATS:
+        proc = subprocess.run(
+            [sys.executable, "-m", "scripts.bench_market_data_export", "--format", fmt, "--rows", str(args.rows)],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        if proc.returncode != 0:
+            print(f"{fmt:<8} failed: {proc.stderr.strip().splitlines()[-1] if proc.stderr else 'unknown'}")
+            continue
+        r = json.loads(proc.stdout.strip().splitlines()[-1])
+        print(
+            f"{r['format']:<8} {r['rows']:>9} {r['bytes'] / 1_048_576:>8.1f} {r['mb_per_s']:>8} "
+            f"{r['rows_per_s']:>10} {r['peak_rss_mb']:>12}"
+        )
+
+
+if __name__ == "__main__":
+    main()
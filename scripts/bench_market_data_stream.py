@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+@fileoverview Benchmark live tick fan-out (subscribers and messages/s per core)
+@module scripts.bench_market_data_stream
+
+@description
+Drives `TickBroadcaster` in a single event loop (i.e. one core) with
+*clients* subscribers spread over *symbols* symbols.  Every subscriber has a
+consumer task draining `next_batch()` the way the WebSocket handler does; a
+configurable fraction of them sleep between batches to emulate slow sockets
+and should be evicted.  Socket writes are not included – the figures are the
+upper bound the fan-out layer allows before the network becomes the limit.
+
+Usage:
+
+$ python -m scripts.bench_market_data_stream --clients 5000 --ticks 20000
+
+@performance
+- Reports delivered messages/s, publish latency and memory per subscriber
+
+@risk
+- Failure impact: NONE – developer tooling only
+
+@since 1.0.0-alpha
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+import tracemalloc
+
+import scripts.bootstrap  # noqa: F401 – ensure repo root on sys.path
+
+# Backend modules use top-level imports (``services``, ``models``) like the service
+sys.path.insert(0, str(scripts.bootstrap.ROOT_PATH / "apps" / "backend"))
+
+from services.market_data.broadcast import SubscriberEvicted, TickBroadcaster  # noqa: E402
+
+
+def _tick(symbol: str, i: int) -> dict:
+    price = 30_000.0 + (i % 500) * 0.01
+    return {
+        "timestamp": "2025-07-05T12:00:00+00:00",
+        "symbol": symbol,
+        "price": price,
+        "volume": 0.015,
+        "bid": price - 0.01,
+        "ask": price + 0.01,
+        "spread": 0.02,
+        "trade_count": 1,
+        "vwap": None,
+        "extra_data": None,
+    }
+
+
+async def _consume(sub, delivered: list, stall: float) -> None:
+    try:
+        while not sub.closed:
+            batch = await sub.next_batch()
+            delivered[0] += len(batch)
+            if stall:
+                await asyncio.sleep(stall)
+    except SubscriberEvicted:
+        pass
+
+
+async def _run(args: argparse.Namespace) -> dict:
+    symbols = [f"SYM{i}-USD" for i in range(args.symbols)]
+    broadcaster = TickBroadcaster(queue_size=args.queue_size, max_subscribers=args.clients)
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    subs = [broadcaster.subscribe([symbols[i % len(symbols)]]) for i in range(args.clients)]
+    per_sub_bytes = sum(s.size_diff for s in tracemalloc.take_snapshot().compare_to(before, "filename")) / args.clients
+    tracemalloc.stop()
+
+    delivered = [0]
+    slow_every = int(1 / args.slow_fraction) if args.slow_fraction > 0 else 0
+    consumers = [
+        asyncio.create_task(_consume(sub, delivered, args.stall if slow_every and i % slow_every == 0 else 0.0))
+        for i, sub in enumerate(subs)
+    ]
+    await asyncio.sleep(0)
+
+    publish_time = 0.0
+    started = time.perf_counter()
+    for i in range(args.ticks):
+        t0 = time.perf_counter()
+        broadcaster.publish(_tick(symbols[i % len(symbols)], i))
+        publish_time += time.perf_counter() - t0
+        if i % args.yield_every == 0:
+            await asyncio.sleep(0)  # let consumers drain, as socket writes would
+    for _ in range(3):
+        await asyncio.sleep(0)
+    elapsed = time.perf_counter() - started
+
+    for sub in subs:
+        broadcaster.unsubscribe(sub)
+    await asyncio.gather(*consumers, return_exceptions=True)
+
+    return {
+        "clients": args.clients,
+        "ticks": args.ticks,
+        "delivered": delivered[0],
+        "seconds": round(elapsed, 3),
+        "msgs_per_s": int(delivered[0] / elapsed),
+        "publish_us": round(publish_time / args.ticks * 1e6, 1),
+        "evicted": broadcaster.evictions,
+        "bytes_per_sub": int(per_sub_bytes),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--clients", type=int, default=5000)
+    parser.add_argument("--symbols", type=int, default=50)
+    parser.add_argument("--ticks", type=int, default=20_000)
+    parser.add_argument("--queue-size", type=int, default=256)
+    parser.add_argument("--slow-fraction", type=float, default=0.01, help="share of clients that stall")
+    parser.add_argument("--stall", type=float, default=2.0, help="seconds a slow client sleeps per batch")
+    parser.add_argument("--yield-every", type=int, default=10, help="publish N ticks between loop turns")
+    args = parser.parse_args()
+
+    r = asyncio.run(_run(args))
+    print(f"{'clients':>8} {'ticks':>8} {'delivered':>10} {'msgs/s':>10} {'publish µs':>11} {'evicted':>8} {'B/sub':>7}")
+    print(
+        f"{r['clients']:>8} {r['ticks']:>8} {r['delivered']:>10} {r['msgs_per_s']:>10} "
+        f"{r['publish_us']:>11} {r['evicted']:>8} {r['bytes_per_sub']:>7}"
+    )
+
+
+if __name__ == "__main__":
+    main()
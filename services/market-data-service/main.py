@@ -13,6 +13,12 @@ state.
 @performance
 - Latency target: ≤ 5 ms internal processing per request
 - Throughput: 500 req/s on commodity VM
+- Latest-tick reads served from an in-memory ring (LISTEN/NOTIFY fed)
+- Multi-symbol latest reads answered by one LATERAL query (cache misses only)
+- Range reads streamed and downsampled server-side (bounded payloads)
+- Bulk export streamed from server-side cursors (constant memory)
+- History listings keyset-paginated (constant cost per page at any depth)
+- Live ticks pushed over WebSocket/SSE from one shared feed (no polling)
 
 @risk
 - Failure impact: MEDIUM — system can fall back to monolith endpoints
@@ -24,32 +30,71 @@ state.
 """
 from __future__ import annotations
 
+import asyncio
+import json
 import os
 import time
-from datetime import datetime
-from typing import Any, Dict, List, AsyncGenerator
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from typing import Any, AsyncContextManager, AsyncGenerator, Callable, Dict, List, Optional
 
-from fastapi import Depends, FastAPI, HTTPException, Query
+from fastapi import Depends, FastAPI, HTTPException, Query, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from sqlalchemy import select, desc
+from fastapi.responses import JSONResponse, StreamingResponse
+from sqlalchemy import String, bindparam, desc, func, select, true
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import aliased
 
 from utils.logging import setup_logging, get_logger
-from utils.monitoring import MetricsCollector
-from database import get_database_connection
+from utils.monitoring import get_metrics_collector, initialize_metrics
+from utils import pagination
+from database import DATABASE_URL, get_database_connection
 from models.market_data import MarketData
+from models.signal import Signal
+from models.trade import Trade
+from services.market_data.tick_cache import TickCache, TickCacheListener
+from services.market_data.broadcast import STREAM_CHANNELS, SubscriberEvicted, Subscription, TickBroadcaster
+from services.market_data import downsampling, export
 
 # ---------------------------------------------------------------------------
 # Service Setup
 # ---------------------------------------------------------------------------
 ENV = os.getenv("PYTHON_ENV", "development")
 DEBUG = os.getenv("DEBUG", "false").lower() == "true"
+TICK_CACHE_SIZE = int(os.getenv("MARKET_DATA_TICK_CACHE_SIZE", "128"))
+RANGE_FETCH_SIZE = int(os.getenv("MARKET_DATA_RANGE_FETCH_SIZE", "5000"))
+EXPORT_BATCH_SIZE = int(os.getenv("MARKET_DATA_EXPORT_BATCH_SIZE", "10000"))
+STREAM_QUEUE_SIZE = int(os.getenv("MARKET_DATA_STREAM_QUEUE_SIZE", "256"))
+STREAM_MAX_CLIENTS = int(os.getenv("MARKET_DATA_STREAM_MAX_CLIENTS", "5000"))
+STREAM_HEARTBEAT_SEC = float(os.getenv("MARKET_DATA_STREAM_HEARTBEAT_SEC", "15"))
+BATCH_MAX_SYMBOLS = int(os.getenv("MARKET_DATA_BATCH_MAX_SYMBOLS", "200"))
+# Named symbol lists for the batch endpoint, e.g. '{"core": ["BTC-USD", "ETH-USD"]}'
+WATCHLISTS: Dict[str, List[str]] = json.loads(os.getenv("MARKET_DATA_WATCHLISTS", "{}"))
+PAGE_SIZE_DEFAULT = 100
+PAGE_SIZE_MAX = 1000
 
 setup_logging()
 logger = get_logger("market_data_service")
-metrics = MetricsCollector("market_data_service")
+metrics = get_metrics_collector() or initialize_metrics("market_data_service")
 
-app = FastAPI(title="TRAIDER Market Data Service", version="1.0.0-alpha")
+# Latest-tick cache fed by Postgres LISTEN/NOTIFY (see tick_cache.py); the same
+# feed is fanned out to live stream subscribers (see broadcast.py)
+tick_cache = TickCache(capacity=TICK_CACHE_SIZE)
+broadcaster = TickBroadcaster(queue_size=STREAM_QUEUE_SIZE, max_subscribers=STREAM_MAX_CLIENTS)
+tick_listener = TickCacheListener(tick_cache, DATABASE_URL, on_tick=broadcaster.publish)
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    """Start the tick-cache listener for the lifetime of the service."""
+    tick_listener.start()
+    try:
+        yield
+    finally:
+        await tick_listener.stop()
+
+
+app = FastAPI(title="TRAIDER Market Data Service", version="1.0.0-alpha", lifespan=lifespan)
 
 # CORS (allow internal dashboard)
 app.add_middleware(
@@ -69,6 +114,11 @@ async def db_dep() -> AsyncGenerator[Any, None]:
         yield conn
 
 
+def db_factory() -> Callable[[], AsyncContextManager[Any]]:
+    """Return the connection factory so handlers can defer acquisition (cache hits skip it)."""
+    return get_database_connection
+
+
 # ---------------------------------------------------------------------------
 # Routes
 # ---------------------------------------------------------------------------
@@ -89,28 +139,445 @@ async def readiness(conn=Depends(db_dep)) -> Dict[str, str]:
 async def latest_market_data(
     symbol: str,
     limit: int = Query(1, ge=1, le=1000, description="Number of recent rows to return"),
-    conn=Depends(db_dep),
+    open_db=Depends(db_factory),
 ):
-    """Return the latest *limit* market-data rows for a symbol."""
+    """Return the latest *limit* market-data rows for a symbol.
+
+    Served from the in-memory tick cache when it holds at least *limit* ticks
+    for the symbol; deeper requests fall back to the database.
+    """
     start = time.perf_counter()
     try:
+        symbol = symbol.upper()
+        cached = tick_cache.latest(symbol, limit)
+        if cached is not None:
+            return {"data": cached}
+
         stmt = (
             select(MarketData)
-            .where(MarketData.symbol == symbol.upper())
+            .where(MarketData.symbol == symbol)
             .order_by(desc(MarketData.timestamp))
             .limit(limit)
         )
-        result = await conn.execute(stmt)
-        rows = result.scalars().all()
+        async with open_db() as conn:
+            result = await conn.execute(stmt)
+            rows = result.scalars().all()
         if not rows:
             raise HTTPException(status_code=404, detail="Symbol not found")
         data = [row.to_dict() for row in rows]
+        tick_cache.prime(symbol, data)
         return {"data": data}
     finally:
         duration = time.perf_counter() - start
+        metrics.request_duration.labels("GET", "/market-data/{symbol}", 200).observe(duration)
+
+
+def _split_param(value: str) -> List[str]:
+    return [part.strip() for part in value.split(",") if part.strip()]
+
+
+def _latest_per_symbol_stmt(symbols: List[str], limit: int):
+    """Newest *limit* rows for every symbol in one statement.
+
+    ``unnest(:symbols) CROSS JOIN LATERAL (... ORDER BY timestamp DESC LIMIT n)``
+    runs one index seek per symbol on ``(symbol, timestamp)`` inside a single
+    round trip; the array parameter keeps the SQL text (and plan) stable
+    whatever the number of symbols.
+    """
+    wanted = (
+        func.unnest(bindparam("symbols", symbols, type_=ARRAY(String)))
+        .table_valued("symbol")
+        .render_derived(name="s")
+    )
+    latest = (
+        select(MarketData)
+        .where(MarketData.symbol == wanted.c.symbol, MarketData.timestamp.isnot(None))
+        .order_by(desc(MarketData.timestamp))
+        .limit(limit)
+        .lateral("m")
+    )
+    return select(aliased(MarketData, latest)).select_from(wanted).join(latest, true())
+
+
+@app.get("/market-data", tags=["Market Data"])
+async def batch_market_data(
+    symbols: Optional[str] = Query(None, description="Comma-separated symbols"),
+    watchlist: Optional[str] = Query(None, description="Configured watchlist id (instead of symbols)"),
+    limit: int = Query(1, ge=1, le=100, description="Number of recent rows per symbol"),
+    open_db=Depends(db_factory),
+) -> Dict[str, Any]:
+    """Return the latest *limit* rows for many symbols in one response.
+
+    Symbols the tick cache can answer are served from memory; the remaining
+    ones are fetched together with a single LATERAL query and used to prime
+    the cache.  ``data`` maps symbol → rows (newest first); symbols without
+    any rows are listed under ``missing``.
+    """
+    started = time.perf_counter()
+    try:
+        if (symbols is None) == (watchlist is None):
+            raise HTTPException(status_code=400, detail="Pass exactly one of 'symbols' or 'watchlist'")
+        if watchlist is not None:
+            if watchlist not in WATCHLISTS:
+                raise HTTPException(status_code=404, detail="Watchlist not found")
+            requested = WATCHLISTS[watchlist]
+        else:
+            requested = _split_param(symbols or "")
+        wanted = list(dict.fromkeys(symbol.upper() for symbol in requested))
+        if not wanted:
+            raise HTTPException(status_code=400, detail="No symbols requested")
+        if len(wanted) > BATCH_MAX_SYMBOLS:
+            raise HTTPException(status_code=400, detail=f"At most {BATCH_MAX_SYMBOLS} symbols per request")
+
+        data: Dict[str, List[Dict[str, Any]]] = {}
+        uncached: List[str] = []
+        for symbol in wanted:
+            cached = tick_cache.latest(symbol, limit)
+            if cached is None:
+                uncached.append(symbol)
+            else:
+                data[symbol] = cached
+
+        if uncached:
+            async with open_db() as conn:
+                result = await conn.execute(_latest_per_symbol_stmt(uncached, limit))
+                rows = result.scalars().all()
+            fetched: Dict[str, List[Dict[str, Any]]] = {}
+            for row in rows:
+                fetched.setdefault(row.symbol, []).append(row.to_dict())
+            for symbol, symbol_rows in fetched.items():
+                symbol_rows.sort(key=lambda item: item["timestamp"], reverse=True)
+                tick_cache.prime(symbol, symbol_rows)
+                data[symbol] = symbol_rows
+
+        return {
+            "data": {symbol: data[symbol] for symbol in wanted if symbol in data},
+            "missing": [symbol for symbol in wanted if symbol not in data],
+        }
+    finally:
+        duration = time.perf_counter() - started
         metrics.request_duration.labels("GET", "/market-data", 200).observe(duration)
 
 
+def _as_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+@app.get("/market-data/{symbol}/range", tags=["Market Data"])
+async def market_data_range(
+    symbol: str,
+    start: datetime = Query(..., description="Inclusive range start (ISO-8601, UTC if naive)"),
+    end: datetime = Query(..., description="Exclusive range end (ISO-8601, UTC if naive)"),
+    max_points: int = Query(1000, ge=10, le=10000, description="Upper bound on returned points"),
+    method: str = Query("lttb", pattern="^(lttb|minmax)$", description="Downsampling method"),
+    open_db=Depends(db_factory),
+):
+    """Return a downsampled price series for *symbol* over ``[start, end)``.
+
+    Rows are streamed from a server-side cursor and reduced per time bucket as
+    they arrive, so memory and payload stay bounded by *max_points* however
+    wide the range.  Points are ``[timestamp_ms, price]`` pairs.
+    """
+    started = time.perf_counter()
+    try:
+        symbol = symbol.upper()
+        start_utc, end_utc = _as_utc(start), _as_utc(end)
+        if end_utc <= start_utc:
+            raise HTTPException(status_code=400, detail="end must be after start")
+
+        aggregator = downsampling.TimeBucketAggregator(
+            start_utc.timestamp(),
+            end_utc.timestamp(),
+            downsampling.bucket_count(method, max_points),
+        )
+        stmt = (
+            select(MarketData.timestamp, MarketData.price)
+            .where(
+                MarketData.symbol == symbol,
+                MarketData.timestamp >= start_utc,
+                MarketData.timestamp < end_utc,
+            )
+            .order_by(MarketData.timestamp)
+            .execution_options(yield_per=RANGE_FETCH_SIZE)
+        )
+        async with open_db() as conn:
+            result = await conn.stream(stmt)
+            async for partition in result.partitions(RANGE_FETCH_SIZE):
+                for ts, price in partition:
+                    aggregator.add(ts.timestamp(), float(price))
+
+        points = downsampling.finalize(aggregator, method, max_points)
+        return {
+            "symbol": symbol,
+            "start": start_utc.isoformat(),
+            "end": end_utc.isoformat(),
+            "method": method,
+            "source_rows": aggregator.rows_seen,
+            "points": [[int(ts * 1000), price] for ts, price in points],
+        }
+    finally:
+        duration = time.perf_counter() - started
+        metrics.request_duration.labels("GET", "/market-data/{symbol}/range", 200).observe(duration)
+
+
+@app.get("/market-data/{symbol}/export", tags=["Market Data"])
+async def export_market_data(
+    symbol: str,
+    start: datetime = Query(..., description="Inclusive range start (ISO-8601, UTC if naive)"),
+    end: datetime = Query(..., description="Exclusive range end (ISO-8601, UTC if naive)"),
+    fmt: str = Query("ndjson", alias="format", pattern="^(ndjson|arrow|parquet)$", description="Export format"),
+    open_db=Depends(db_factory),
+) -> StreamingResponse:
+    """Stream every row for *symbol* in ``[start, end)`` as NDJSON, Arrow IPC or Parquet.
+
+    Rows flow from a server-side cursor straight into the encoder and out as
+    chunked transfer encoding, one chunk per cursor partition, so memory is
+    constant however large the range.
+    """
+    symbol = symbol.upper()
+    start_utc, end_utc = _as_utc(start), _as_utc(end)
+    if end_utc <= start_utc:
+        raise HTTPException(status_code=400, detail="end must be after start")
+    if export.requires_pyarrow(fmt) and not export.pyarrow_available():
+        raise HTTPException(status_code=501, detail=f"Export format '{fmt}' is not available")
+
+    stmt = (
+        select(*(getattr(MarketData, column) for column in export.EXPORT_COLUMNS))
+        .where(
+            MarketData.symbol == symbol,
+            MarketData.timestamp >= start_utc,
+            MarketData.timestamp < end_utc,
+        )
+        .order_by(MarketData.timestamp)
+        .execution_options(yield_per=EXPORT_BATCH_SIZE)
+    )
+
+    async def _batches():
+        async with open_db() as conn:
+            result = await conn.stream(stmt)
+            async for partition in result.partitions(EXPORT_BATCH_SIZE):
+                yield partition
+
+    async def _body():
+        started = time.perf_counter()
+        sent = 0
+        try:
+            async for chunk in export.encode_batches(_batches(), fmt):
+                sent += len(chunk)
+                yield chunk
+        finally:
+            duration = time.perf_counter() - started
+            metrics.request_duration.labels("GET", "/market-data/{symbol}/export", 200).observe(duration)
+            logger.info(
+                "Market data export finished",
+                extra={"symbol": symbol, "format": fmt, "bytes": sent, "duration_s": round(duration, 3)},
+            )
+
+    media_type, extension = export.EXPORT_FORMATS[fmt]
+    filename = f"{symbol}_{start_utc:%Y%m%dT%H%M%S}_{end_utc:%Y%m%dT%H%M%S}.{extension}"
+    return StreamingResponse(
+        _body(),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+# ---------------------------------------------------------------------------
+# Keyset-paginated history listings
+# ---------------------------------------------------------------------------
+async def _keyset_page(
+    open_db: Callable[[], AsyncContextManager[Any]],
+    model: Any,
+    symbol: Optional[str],
+    limit: int,
+    cursor: Optional[str],
+) -> Dict[str, Any]:
+    """Fetch one newest-first page of *model* rows keyed on ``(timestamp, symbol, id)``.
+
+    ``id`` breaks ties between rows sharing a timestamp and symbol.  When the
+    listing is filtered to one symbol the seek runs on ``(timestamp, id)``
+    only, which is equivalent and matches the ``(symbol, timestamp)`` indexes.
+    """
+    key_columns = (model.timestamp, model.symbol, model.id)
+    seek_columns = (model.timestamp, model.id) if symbol else key_columns
+
+    stmt = select(model).where(model.timestamp.isnot(None))
+    if symbol:
+        stmt = stmt.where(model.symbol == symbol)
+    if cursor:
+        try:
+            ts, cursor_symbol, row_id = pagination.decode_cursor(cursor, len(key_columns), (datetime, str, int))
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=f"Invalid cursor: {exc}")
+        if symbol and cursor_symbol != symbol:
+            raise HTTPException(status_code=400, detail="Invalid cursor: cursor does not match this listing")
+        seek_key = (ts, row_id) if symbol else (ts, cursor_symbol, row_id)
+        stmt = stmt.where(pagination.keyset_filter(seek_columns, seek_key))
+    stmt = stmt.order_by(*pagination.keyset_order(seek_columns)).limit(limit + 1)
+
+    async with open_db() as conn:
+        result = await conn.execute(stmt)
+        rows = result.scalars().all()
+    page, next_cursor = pagination.split_page(rows, limit, lambda row: (row.timestamp, row.symbol, row.id))
+    return {"data": [row.to_dict() for row in page], "next_cursor": next_cursor}
+
+
+@app.get("/market-data/{symbol}/history", tags=["Market Data"])
+async def market_data_history(
+    symbol: str,
+    limit: int = Query(PAGE_SIZE_DEFAULT, ge=1, le=PAGE_SIZE_MAX, description="Page size"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the previous page"),
+    open_db=Depends(db_factory),
+) -> Dict[str, Any]:
+    """Page backwards through market-data rows for *symbol*, newest first."""
+    started = time.perf_counter()
+    try:
+        return await _keyset_page(open_db, MarketData, symbol.upper(), limit, cursor)
+    finally:
+        duration = time.perf_counter() - started
+        metrics.request_duration.labels("GET", "/market-data/{symbol}/history", 200).observe(duration)
+
+
+@app.get("/trades", tags=["History"])
+async def list_trades(
+    symbol: Optional[str] = Query(None, description="Restrict to one symbol"),
+    limit: int = Query(PAGE_SIZE_DEFAULT, ge=1, le=PAGE_SIZE_MAX, description="Page size"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the previous page"),
+    open_db=Depends(db_factory),
+) -> Dict[str, Any]:
+    """Page backwards through executed trades, newest first."""
+    started = time.perf_counter()
+    try:
+        return await _keyset_page(open_db, Trade, symbol.upper() if symbol else None, limit, cursor)
+    finally:
+        duration = time.perf_counter() - started
+        metrics.request_duration.labels("GET", "/trades", 200).observe(duration)
+
+
+@app.get("/signals", tags=["History"])
+async def list_signals(
+    symbol: Optional[str] = Query(None, description="Restrict to one symbol"),
+    limit: int = Query(PAGE_SIZE_DEFAULT, ge=1, le=PAGE_SIZE_MAX, description="Page size"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the previous page"),
+    open_db=Depends(db_factory),
+) -> Dict[str, Any]:
+    """Page backwards through generated signals, newest first."""
+    started = time.perf_counter()
+    try:
+        return await _keyset_page(open_db, Signal, symbol.upper() if symbol else None, limit, cursor)
+    finally:
+        duration = time.perf_counter() - started
+        metrics.request_duration.labels("GET", "/signals", 200).observe(duration)
+
+
+@app.get("/cache/stats", tags=["Cache"])
+async def cache_stats() -> Dict[str, Any]:
+    """Occupancy and hit ratio of the latest-tick cache."""
+    return tick_cache.stats()
+
+
+# ---------------------------------------------------------------------------
+# Live stream (WebSocket / SSE)
+# ---------------------------------------------------------------------------
+_HEARTBEAT = '{"type":"heartbeat"}'
+
+
+def _subscribe(symbols: str, channels: str) -> Subscription:
+    return broadcaster.subscribe(_split_param(symbols), _split_param(channels))
+
+
+@app.websocket("/stream")
+async def stream_ws(
+    websocket: WebSocket,
+    symbols: str = Query(..., description="Comma-separated symbols"),
+    channels: str = Query(",".join(STREAM_CHANNELS), description="Comma-separated channels: ticks, book"),
+) -> None:
+    """Push live ticks and conflated top-of-book for *symbols* over a WebSocket.
+
+    Each message is one JSON text frame (``type`` = ``tick`` | ``book`` |
+    ``heartbeat``).  A client that cannot keep up is closed with code 1013.
+    """
+    try:
+        sub = _subscribe(symbols, channels)
+    except ValueError as exc:
+        await websocket.close(code=1008, reason=str(exc))
+        return
+    except OverflowError:
+        await websocket.close(code=1013, reason="subscriber limit reached")
+        return
+
+    async def _until_disconnect() -> None:
+        while (await websocket.receive())["type"] != "websocket.disconnect":
+            pass  # client messages are ignored
+
+    await websocket.accept()
+    reader = asyncio.create_task(_until_disconnect(), name="stream-ws-reader")
+    reader.add_done_callback(lambda _task: sub.close())
+    try:
+        # Not ``while not sub.closed``: eviction also closes the subscription
+        # (usually while a send is in flight) and only next_batch() reports it
+        while True:
+            try:
+                batch = await asyncio.wait_for(sub.next_batch(), STREAM_HEARTBEAT_SEC)
+            except asyncio.TimeoutError:
+                await websocket.send_text(_HEARTBEAT)
+                continue
+            if not batch:
+                break  # closed: client disconnected
+            for _channel, payload in batch:
+                await websocket.send_text(payload)
+    except SubscriberEvicted:
+        logger.warning("Evicting slow stream subscriber", extra={"symbols": sorted(sub.symbols)})
+        await websocket.close(code=1013, reason="slow consumer")
+    except (WebSocketDisconnect, RuntimeError):
+        pass
+    finally:
+        reader.cancel()
+        broadcaster.unsubscribe(sub)
+
+
+@app.get("/stream/sse", tags=["Stream"])
+async def stream_sse(
+    symbols: str = Query(..., description="Comma-separated symbols"),
+    channels: str = Query(",".join(STREAM_CHANNELS), description="Comma-separated channels: ticks, book"),
+) -> StreamingResponse:
+    """Server-Sent Events variant of ``/stream`` for clients without WebSocket support."""
+    try:
+        sub = _subscribe(symbols, channels)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    except OverflowError:
+        raise HTTPException(status_code=503, detail="subscriber limit reached")
+
+    async def _events():
+        try:
+            while True:  # next_batch() raises once evicted, even after close
+                try:
+                    batch = await asyncio.wait_for(sub.next_batch(), STREAM_HEARTBEAT_SEC)
+                except asyncio.TimeoutError:
+                    yield ": heartbeat\n\n"
+                    continue
+                if not batch:
+                    break
+                yield "".join(f"event: {channel}\ndata: {payload}\n\n" for channel, payload in batch)
+        except SubscriberEvicted:
+            yield 'event: evicted\ndata: {"reason":"slow consumer"}\n\n'
+        finally:
+            broadcaster.unsubscribe(sub)
+
+    return StreamingResponse(
+        _events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.get("/stream/stats", tags=["Stream"])
+async def stream_stats() -> Dict[str, Any]:
+    """Subscriber counts and eviction totals of the live stream."""
+    return broadcaster.stats()
+
+
 @app.get("/metrics", include_in_schema=False)
 async def metrics_endpoint():
     """Prometheus metrics endpoint."""
@@ -1,12 +1,29 @@
-from typing import Dict, Any, AsyncGenerator
-from fastapi import Depends, Query, FastAPI, HTTPException
-from fastapi.responses import JSONResponse
+from typing import Dict, Any, AsyncContextManager, AsyncGenerator, Callable, Optional
+from fastapi import Depends, Query, FastAPI, HTTPException, WebSocket
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from services.market_data.tick_cache import TickCache, TickCacheListener
+from services.market_data.broadcast import TickBroadcaster
 
 app: FastAPI
+tick_cache: TickCache
+tick_listener: TickCacheListener
+broadcaster: TickBroadcaster
 
 async def db_dep() -> AsyncGenerator[Any, None]: ...
+def db_factory() -> Callable[[], AsyncContextManager[Any]]: ...
 
 async def liveness() -> Dict[str, str]: ...
 async def readiness(conn=Depends(...)) -> Dict[str, str]: ...
-async def latest_market_data(symbol: str, limit: int = Query(...), conn=Depends(...)) -> Dict[str, Any]: ...
+async def latest_market_data(symbol: str, limit: int = Query(...), open_db=Depends(...)) -> Dict[str, Any]: ...
+async def batch_market_data(symbols: Optional[str] = Query(...), watchlist: Optional[str] = Query(...), limit: int = Query(...), open_db=Depends(...)) -> Dict[str, Any]: ...
+async def market_data_range(symbol: str, start: Any = Query(...), end: Any = Query(...), max_points: int = Query(...), method: str = Query(...), open_db=Depends(...)) -> Dict[str, Any]: ...
+async def export_market_data(symbol: str, start: Any = Query(...), end: Any = Query(...), fmt: str = Query(...), open_db=Depends(...)) -> StreamingResponse: ...
+async def market_data_history(symbol: str, limit: int = Query(...), cursor: Optional[str] = Query(...), open_db=Depends(...)) -> Dict[str, Any]: ...
+async def list_trades(symbol: Optional[str] = Query(...), limit: int = Query(...), cursor: Optional[str] = Query(...), open_db=Depends(...)) -> Dict[str, Any]: ...
+async def list_signals(symbol: Optional[str] = Query(...), limit: int = Query(...), cursor: Optional[str] = Query(...), open_db=Depends(...)) -> Dict[str, Any]: ...
+async def cache_stats() -> Dict[str, Any]: ...
+async def stream_ws(websocket: WebSocket, symbols: str = Query(...), channels: str = Query(...)) -> None: ...
+async def stream_sse(symbols: str = Query(...), channels: str = Query(...)) -> StreamingResponse: ...
+async def stream_stats() -> Dict[str, Any]: ...
 async def metrics_endpoint() -> JSONResponse: ...
\ No newline at end of file